@@ -94,7 +94,10 @@ async def invoke_tool(session: SessionDep, request: ToolInvokeRequest) -> ToolIn
 
     # Validate input against schema
     if tool.input_schema:
-        validation = validate_input_against_schema(request.arguments, tool.input_schema)
+        # Tool versions are bumped on every update, so (id, version) pins the schema
+        validation = validate_input_against_schema(
+            request.arguments, tool.input_schema, cache_key=(tool.id, tool.version)
+        )
         if not validation.valid:
             raise HTTPException(
                 status_code=422,
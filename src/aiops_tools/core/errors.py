@@ -1,5 +1,7 @@
 """Standardized error handling for AIOps Tools API."""
 
+from collections.abc import Sequence
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
@@ -113,12 +115,12 @@ class ValidationError(APIError):
 class MultiValidationError(APIError):
     """Multiple validation errors."""
 
-    def __init__(self, errors: list[ErrorDetail]):
+    def __init__(self, errors: Sequence[ErrorDetail]):
         super().__init__(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             code=ErrorCode.VALIDATION_ERROR,
             message=f"Validation failed with {len(errors)} error(s)",
-            errors=errors,
+            errors=list(errors),
         )
 
 
@@ -226,9 +228,30 @@ ERROR_MESSAGES = {
 }
 
 
-def get_error_template(key: str) -> dict:
-    """Get error message template by key."""
-    return ERROR_MESSAGES.get(key, {})
+@dataclass(slots=True, frozen=True)
+class ErrorTemplate:
+    """Pre-built error message template."""
+
+    code: ErrorCode
+    message: str
+    suggestion: str | None = None
+    example: str | None = None
+
+
+# Templates are frozen once at import so lookups are plain attribute reads
+ERROR_TEMPLATES: dict[str, ErrorTemplate] = {
+    key: ErrorTemplate(**template) for key, template in ERROR_MESSAGES.items()
+}
+
+
+def get_error_template(key: str) -> ErrorTemplate:
+    """Get error message template by key.
+
+    Raises:
+        KeyError: If no template is defined for the key. Callers pass literal
+            ERROR_MESSAGES keys, so a miss is a programming error.
+    """
+    return ERROR_TEMPLATES[key]
 
 
 async def api_exception_handler(request: Request, exc: APIError) -> JSONResponse:
@@ -269,12 +292,12 @@ async def validation_exception_handler(request: Request, exc: Exception) -> JSON
             suggestion = None
             if "string_pattern_mismatch" in error["type"]:
                 template = get_error_template("invalid_tool_name")
-                suggestion = template.get("suggestion")
+                suggestion = template.suggestion
             elif "missing" in error["type"]:
                 suggestion = f"The field '{field}' is required. Please provide a value."
             elif "uuid" in error["type"].lower():
                 template = get_error_template("invalid_uuid")
-                suggestion = template.get("suggestion")
+                suggestion = template.suggestion
 
             errors.append(
                 ErrorDetail(
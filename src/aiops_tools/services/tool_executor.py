@@ -1,12 +1,13 @@
 """Tool execution service using subprocess."""
 
-import json
 import subprocess
 import tempfile
 import time
 from dataclasses import dataclass
 from pathlib import Path
 
+import orjson
+
 from aiops_tools.core.config import settings
 
 
@@ -55,9 +56,37 @@ import json
 
 # Read input from stdin and execute main()
 if __name__ == "__main__":
-    input_data = json.loads(sys.stdin.read())
+    import datetime as _datetime
+
+    try:
+        import orjson as _orjson
+    except ImportError:
+        _orjson = None
+
+    def _json_default(obj):
+        if isinstance(obj, _datetime.date):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {{type(obj).__name__}} is not JSON serializable")
+
+    def _dumps(result):
+        if _orjson is not None:
+            try:
+                return _orjson.dumps(result, option=_orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # orjson rejects some values json accepts, e.g. ints wider than 64 bits
+                pass
+        return json.dumps(result, default=_json_default).encode()
+
+    if _orjson is not None:
+        input_data = _orjson.loads(sys.stdin.buffer.read())
+    else:
+        input_data = json.loads(sys.stdin.read())
     result = main(input_data)
-    print(json.dumps(result))
+    # Write the encoded bytes directly; decoding to str first would copy
+    # large results (e.g. pod logs) only to re-encode them on output.
+    # Flush first so anything the script printed stays ahead of the result.
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_dumps(result))
 '''
 
     # Create temporary file for the script
@@ -74,43 +103,45 @@ if __name__ == "__main__":
         # Execute the script with input via stdin
         result = subprocess.run(
             ["python", str(script_path)],
-            input=json.dumps(input_data),
+            input=orjson.dumps(input_data),
             capture_output=True,
-            text=True,
             timeout=timeout,
         )
 
         duration_ms = int((time.time() - start_time) * 1000)
 
+        stdout = result.stdout.decode("utf-8", errors="replace")
+        stderr = result.stderr.decode("utf-8", errors="replace")
+
         if result.returncode == 0:
             # Try to parse stdout as JSON
             try:
-                output = json.loads(result.stdout) if result.stdout.strip() else {}
+                output = orjson.loads(result.stdout) if stdout.strip() else {}
                 return ExecutionResult(
                     success=True,
                     result=output,
                     duration_ms=duration_ms,
-                    stdout=result.stdout,
-                    stderr=result.stderr,
+                    stdout=stdout,
+                    stderr=stderr,
                 )
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # If output is not JSON, wrap it
                 return ExecutionResult(
                     success=True,
-                    result={"output": result.stdout},
+                    result={"output": stdout},
                     duration_ms=duration_ms,
-                    stdout=result.stdout,
-                    stderr=result.stderr,
+                    stdout=stdout,
+                    stderr=stderr,
                 )
         else:
             # Script returned non-zero exit code
-            error_msg = result.stderr or result.stdout or "Unknown error"
+            error_msg = stderr or stdout or "Unknown error"
             return ExecutionResult(
                 success=False,
                 error=error_msg.strip(),
                 duration_ms=duration_ms,
-                stdout=result.stdout,
-                stderr=result.stderr,
+                stdout=stdout,
+                stderr=stderr,
             )
 
     except subprocess.TimeoutExpired:
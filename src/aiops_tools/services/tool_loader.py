@@ -1,13 +1,23 @@
 """Tool loader service for registering pre-built tools."""
 
+import ast
 import importlib
-import inspect
+import importlib.util
 from pathlib import Path
 from typing import Any
 
 from aiops_tools.models.tool import ToolStatus
 
 
+def _tool_source_path(category: str, tool_name: str) -> str | None:
+    """Locate a tool module's source file without importing (executing) it."""
+    try:
+        spec = importlib.util.find_spec(f"aiops_tools.tools.{category}.{tool_name}")
+    except ImportError:
+        return None
+    return spec.origin if spec else None
+
+
 def get_tool_script(category: str, tool_name: str) -> str | None:
     """Get the script content for a tool.
 
@@ -18,18 +28,40 @@ def get_tool_script(category: str, tool_name: str) -> str | None:
     Returns:
         Script content as string, or None if not found
     """
+    source_file = _tool_source_path(category, tool_name)
+    if not source_file:
+        return None
     try:
-        module_name = f"aiops_tools.tools.{category}.{tool_name}"
-        module = importlib.import_module(module_name)
-
-        # Get the source code of the module
-        source_file = inspect.getfile(module)
         with open(source_file, encoding="utf-8") as f:
             return f.read()
-    except (ImportError, OSError):
+    except OSError:
         return None
 
 
+def _literal_tool_definition(source: str) -> dict[str, Any] | None:
+    """Evaluate a module's TOOL_DEFINITION from source when it is a plain literal.
+
+    Both ``TOOL_DEFINITION = {...}`` and annotated ``TOOL_DEFINITION: dict = {...}``
+    assignments are recognized. Returns None when no such assignment is found.
+
+    Raises:
+        ValueError: TOOL_DEFINITION is built from non-literal expressions
+    """
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        if any(
+            isinstance(target, ast.Name) and target.id == "TOOL_DEFINITION"
+            for target in targets
+        ):
+            return ast.literal_eval(node.value)
+    return None
+
+
 def get_tool_definition(category: str, tool_name: str) -> dict[str, Any] | None:
     """Get the tool definition for a tool.
 
@@ -40,6 +72,19 @@ def get_tool_definition(category: str, tool_name: str) -> dict[str, Any] | None:
     Returns:
         Tool definition dict, or None if not found
     """
+    # Most definitions are plain literals and are read straight from source, so
+    # discovery does not import the tool's dependencies (kubernetes, boto3, ...).
+    # Anything the literal reader cannot resolve falls back to importing the module.
+    script = get_tool_script(category, tool_name)
+    if not script:
+        return None
+    try:
+        definition = _literal_tool_definition(script)
+    except (SyntaxError, ValueError):
+        definition = None
+    if definition is not None:
+        return definition
+
     try:
         module_name = f"aiops_tools.tools.{category}.{tool_name}"
         module = importlib.import_module(module_name)
@@ -2,19 +2,49 @@
 
 import ast
 import re
+import threading
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass
+from typing import Any, NamedTuple
 
 import jsonschema
 
 from aiops_tools.core.errors import ErrorCode, ErrorDetail, get_error_template
 
+# Shared across all validators so format/type checkers are built only once
+_FORMAT_CHECKER = jsonschema.FormatChecker()
+_META_VALIDATOR = jsonschema.Draft7Validator(jsonschema.Draft7Validator.META_SCHEMA)
 
-@dataclass
+# Keywords handled by the fast input validator; anything else falls back to jsonschema
+_SIMPLE_SCHEMA_KEYWORDS = frozenset({"type", "properties", "required", "title", "description"})
+_SIMPLE_PROPERTY_KEYWORDS = frozenset({"type", "enum", "title", "description", "default"})
+_SIMPLE_TYPES = frozenset({"string", "integer", "number", "boolean", "object", "array", "null"})
+
+# Compiled input validators keyed by the caller's cache key (e.g. tool id and version)
+_INPUT_VALIDATORS_SIZE = 256
+_INPUT_VALIDATORS: dict[Hashable, Callable[[Any], Any]] = {}
+_INPUT_VALIDATORS_LOCK = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of a validation check."""
 
     valid: bool
-    errors: list[ErrorDetail]
+    errors: tuple[ErrorDetail, ...]
+
+
+class _MainFoundError(Exception):
+    """Raised by _MainFinder to stop traversal at the first match."""
+
+
+class _MainFinder(ast.NodeVisitor):
+    """AST visitor that stops as soon as a 'main' function definition is found."""
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        if node.name == "main":
+            raise _MainFoundError
+        self.generic_visit(node)
 
 
 def validate_python_syntax(script_content: str) -> ValidationResult:
@@ -31,30 +61,30 @@ def validate_python_syntax(script_content: str) -> ValidationResult:
         template = get_error_template("script_content_empty")
         return ValidationResult(
             valid=False,
-            errors=[
+            errors=(
                 ErrorDetail(
-                    code=template.get("code", ErrorCode.INVALID_FIELD).value,
+                    code=template.code.value,
                     field="script_content",
-                    message=template.get("message", "Script content is empty"),
-                    suggestion=template.get("suggestion"),
-                )
-            ],
+                    message=template.message,
+                    suggestion=template.suggestion,
+                ),
+            ),
         )
 
     try:
         tree = ast.parse(script_content)
 
         # Check if main function exists
-        has_main = False
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name == "main":
-                has_main = True
-                break
+        try:
+            _MainFinder().visit(tree)
+            has_main = False
+        except _MainFoundError:
+            has_main = True
 
         if not has_main:
             return ValidationResult(
                 valid=False,
-                errors=[
+                errors=(
                     ErrorDetail(
                         code=ErrorCode.VALIDATION_ERROR.value,
                         field="script_content",
@@ -64,11 +94,11 @@ def validate_python_syntax(script_content: str) -> ValidationResult:
                         details={
                             "example": 'def main(input_data):\n    # Your code here\n    return {"success": True, "data": {}}'
                         },
-                    )
-                ],
+                    ),
+                ),
             )
 
-        return ValidationResult(valid=True, errors=[])
+        return ValidationResult(valid=True, errors=())
 
     except SyntaxError as e:
         template = get_error_template("script_syntax_error")
@@ -79,26 +109,31 @@ def validate_python_syntax(script_content: str) -> ValidationResult:
 
         error_context = ""
         if e.text:
-            error_context = f"\n  Code: {e.text.strip()}"
+            code_line = e.text.strip()
             if e.offset:
-                error_context += f"\n  {' ' * (e.offset + 7)}^"
+                # Align the caret under the offending column of the stripped line
+                indent = len(e.text) - len(e.text.lstrip())
+                pad = max(e.offset - indent - 1, 0) + 6
+                error_context = f"\n  Code: {code_line}\n  {'':>{pad}}^"
+            else:
+                error_context = f"\n  Code: {code_line}"
 
         return ValidationResult(
             valid=False,
-            errors=[
+            errors=(
                 ErrorDetail(
-                    code=template.get("code", ErrorCode.SCRIPT_SYNTAX_ERROR).value,
+                    code=template.code.value,
                     field="script_content",
                     message=f"Python syntax error at {error_location}: {e.msg}{error_context}",
-                    suggestion=template.get("suggestion"),
+                    suggestion=template.suggestion,
                     details={
                         "line": e.lineno,
                         "column": e.offset,
                         "error_type": "SyntaxError",
                         "error_message": e.msg,
                     },
-                )
-            ],
+                ),
+            ),
         )
 
 
@@ -115,44 +150,154 @@ def validate_json_schema(schema: dict, field_name: str = "input_schema") -> Vali
     """
     if not schema:
         # Empty schema is valid (no parameters)
-        return ValidationResult(valid=True, errors=[])
+        return ValidationResult(valid=True, errors=())
 
-    try:
-        # Validate the schema itself by checking it against the meta-schema
-        jsonschema.Draft7Validator.check_schema(schema)
-        return ValidationResult(valid=True, errors=[])
-    except jsonschema.SchemaError as e:
-        template = get_error_template("invalid_json_schema")
+    # Validate the schema itself by checking it against the meta-schema
+    e = next(_META_VALIDATOR.iter_errors(schema), None)
+    if e is None:
+        return ValidationResult(valid=True, errors=())
 
-        # Build path to the error location in the schema
-        error_path = " -> ".join(str(p) for p in e.absolute_path) if e.absolute_path else "root"
+    template = get_error_template("invalid_json_schema")
 
-        return ValidationResult(
-            valid=False,
-            errors=[
-                ErrorDetail(
-                    code=template.get("code", ErrorCode.INVALID_JSON_SCHEMA).value,
-                    field=field_name,
-                    message=f"Invalid JSON Schema at '{error_path}': {e.message}",
-                    suggestion=template.get("suggestion"),
-                    details={
-                        "schema_path": list(e.absolute_path) if e.absolute_path else [],
-                        "validator": e.validator,
-                        "validator_value": str(e.validator_value)[:100],  # Truncate for safety
-                    },
-                )
-            ],
+    # Build path to the error location in the schema
+    error_path = " -> ".join(str(p) for p in e.absolute_path) if e.absolute_path else "root"
+
+    return ValidationResult(
+        valid=False,
+        errors=(
+            ErrorDetail(
+                code=template.code.value,
+                field=field_name,
+                message=f"Invalid JSON Schema at '{error_path}': {e.message}",
+                suggestion=template.suggestion,
+                details={
+                    "schema_path": list(e.absolute_path) if e.absolute_path else [],
+                    "validator": e.validator,
+                    "validator_value": str(e.validator_value)[:100],  # Truncate for safety
+                },
+            ),
+        ),
+    )
+
+
+class _InputError(NamedTuple):
+    """First input error, shaped like the jsonschema.ValidationError fields we report."""
+
+    message: str
+    absolute_path: tuple[str, ...]
+    validator: str
+    validator_value: Any
+    instance: Any
+
+
+def _is_json_type(value: Any, json_type: str) -> bool:
+    """Check a value against a JSON Schema primitive type name."""
+    if json_type == "string":
+        return isinstance(value, str)
+    if json_type == "integer":
+        return (isinstance(value, int) and not isinstance(value, bool)) or (
+            isinstance(value, float) and value.is_integer()
         )
+    if json_type == "number":
+        return isinstance(value, int | float) and not isinstance(value, bool)
+    if json_type == "boolean":
+        return isinstance(value, bool)
+    if json_type == "object":
+        return isinstance(value, dict)
+    if json_type == "array":
+        return isinstance(value, list)
+    return value is None
+
+
+def _compile_simple_validator(schema: dict) -> Callable[[Any], _InputError | None] | None:
+    """Compile a flat object schema into a plain-Python validator.
+
+    Only handles ``type: object`` schemas whose properties use ``type``/``enum``;
+    returns None for anything else so the caller falls back to jsonschema.
+    """
+    if schema.get("type") != "object" or not _SIMPLE_SCHEMA_KEYWORDS.issuperset(schema):
+        return None
+
+    required = schema.get("required", [])
+    checks: list[tuple[str, str | None, list | None]] = []
+    for name, prop in schema.get("properties", {}).items():
+        if not isinstance(prop, dict) or not _SIMPLE_PROPERTY_KEYWORDS.issuperset(prop):
+            return None
+        prop_type = prop.get("type")
+        # Union types (e.g. ["string", "null"]) are left to jsonschema
+        if prop_type is not None and (
+            not isinstance(prop_type, str) or prop_type not in _SIMPLE_TYPES
+        ):
+            return None
+        checks.append((name, prop_type, prop.get("enum")))
+
+    def validate(instance: Any) -> _InputError | None:
+        if not isinstance(instance, dict):
+            return _InputError(
+                f"{instance!r} is not of type 'object'", (), "type", "object", instance
+            )
+        for name in required:
+            if name not in instance:
+                return _InputError(
+                    f"{name!r} is a required property", (), "required", required, instance
+                )
+        for name, prop_type, enum in checks:
+            if name not in instance:
+                continue
+            value = instance[name]
+            if prop_type is not None and not _is_json_type(value, prop_type):
+                return _InputError(
+                    f"{value!r} is not of type {prop_type!r}", (name,), "type", prop_type, value
+                )
+            if enum is not None and value not in enum:
+                return _InputError(
+                    f"{value!r} is not one of {enum!r}", (name,), "enum", enum, value
+                )
+        return None
+
+    return validate
+
+
+def _build_input_validator(schema: dict) -> Callable[[Any], Any]:
+    """Build a first-error validator for a schema.
+
+    Flat schemas get a compiled plain-Python check; everything else uses a
+    format-enabled Draft7Validator.
+    """
+    simple = _compile_simple_validator(schema)
+    if simple is not None:
+        return simple
+
+    validator = jsonschema.Draft7Validator(schema, format_checker=_FORMAT_CHECKER)
+    return lambda instance: next(validator.iter_errors(instance), None)
+
+
+def _get_input_validator(schema: dict, cache_key: Hashable | None) -> Callable[[Any], Any]:
+    """Get the validator for a schema, reusing the one cached under cache_key."""
+    if cache_key is None:
+        return _build_input_validator(schema)
+
+    with _INPUT_VALIDATORS_LOCK:
+        validator = _INPUT_VALIDATORS.get(cache_key)
+    if validator is None:
+        validator = _build_input_validator(schema)
+        with _INPUT_VALIDATORS_LOCK:
+            if len(_INPUT_VALIDATORS) >= _INPUT_VALIDATORS_SIZE:
+                _INPUT_VALIDATORS.pop(next(iter(_INPUT_VALIDATORS)), None)
+            _INPUT_VALIDATORS[cache_key] = validator
+    return validator
 
 
 def validate_input_against_schema(
-    input_data: dict, input_schema: dict
+    input_data: dict, input_schema: dict, cache_key: Hashable | None = None
 ) -> ValidationResult:
     """Validate input data against a JSON Schema.
 
     Args:
         input_data: Input data to validate.
         input_schema: JSON Schema to validate against.
+        cache_key: Key identifying this exact schema (e.g. tool id and version);
+            when given, the compiled validator is reused across calls.
 
     Returns:
         ValidationResult with valid=True if input matches schema,
@@ -160,32 +305,32 @@ def validate_input_against_schema(
     """
     if not input_schema:
         # No schema means any input is valid
-        return ValidationResult(valid=True, errors=[])
+        return ValidationResult(valid=True, errors=())
 
-    try:
-        jsonschema.validate(instance=input_data, schema=input_schema)
-        return ValidationResult(valid=True, errors=[])
-    except jsonschema.ValidationError as e:
-        # Build path to the error location
-        error_path = ".".join(str(p) for p in e.absolute_path) if e.absolute_path else "root"
+    e = _get_input_validator(input_schema, cache_key)(input_data)
+    if e is None:
+        return ValidationResult(valid=True, errors=())
 
-        return ValidationResult(
-            valid=False,
-            errors=[
-                ErrorDetail(
-                    code=ErrorCode.VALIDATION_ERROR.value,
-                    field=f"input_data.{error_path}" if error_path != "root" else "input_data",
-                    message=e.message,
-                    suggestion=f"Check the value at '{error_path}' in your input data.",
-                    details={
-                        "path": list(e.absolute_path) if e.absolute_path else [],
-                        "validator": e.validator,
-                        "expected": str(e.validator_value)[:100] if e.validator_value else None,
-                        "actual": str(e.instance)[:100] if e.instance else None,
-                    },
-                )
-            ],
-        )
+    # Build path to the error location
+    error_path = ".".join(str(p) for p in e.absolute_path) if e.absolute_path else "root"
+
+    return ValidationResult(
+        valid=False,
+        errors=(
+            ErrorDetail(
+                code=ErrorCode.VALIDATION_ERROR.value,
+                field=f"input_data.{error_path}" if error_path != "root" else "input_data",
+                message=e.message,
+                suggestion=f"Check the value at '{error_path}' in your input data.",
+                details={
+                    "path": list(e.absolute_path) if e.absolute_path else [],
+                    "validator": e.validator,
+                    "expected": str(e.validator_value)[:100] if e.validator_value else None,
+                    "actual": str(e.instance)[:100] if e.instance else None,
+                },
+            ),
+        ),
+    )
 
 
 def validate_tool_name(name: str) -> ValidationResult:
@@ -212,10 +357,10 @@ def validate_tool_name(name: str) -> ValidationResult:
         template = get_error_template("tool_name_too_long")
         errors.append(
             ErrorDetail(
-                code=template.get("code", ErrorCode.INVALID_FIELD).value,
+                code=template.code.value,
                 field="name",
-                message=template.get("message", f"Tool name is too long ({len(name)} characters)"),
-                suggestion=template.get("suggestion"),
+                message=template.message,
+                suggestion=template.suggestion,
                 details={"current_length": len(name), "max_length": 100},
             )
         )
@@ -223,10 +368,10 @@ def validate_tool_name(name: str) -> ValidationResult:
         template = get_error_template("invalid_tool_name")
         errors.append(
             ErrorDetail(
-                code=template.get("code", ErrorCode.INVALID_FORMAT).value,
+                code=template.code.value,
                 field="name",
-                message=template.get("message", "Invalid tool name format"),
-                suggestion=template.get("suggestion"),
+                message=template.message,
+                suggestion=template.suggestion,
                 details={
                     "provided_name": name,
                     "valid_pattern": "^[a-z][a-z0-9_]*$",
@@ -235,7 +380,7 @@ def validate_tool_name(name: str) -> ValidationResult:
             )
         )
 
-    return ValidationResult(valid=len(errors) == 0, errors=errors)
+    return ValidationResult(valid=len(errors) == 0, errors=tuple(errors))
 
 
 def validate_tool(
@@ -269,13 +414,13 @@ def validate_tool(
             template = get_error_template("script_content_required")
             errors.append(
                 ErrorDetail(
-                    code=template.get("code", ErrorCode.MISSING_REQUIRED_FIELD).value,
+                    code=template.code.value,
                     field="script_content",
-                    message=template.get("message", "Script content is required for Python executor"),
-                    suggestion=template.get("suggestion"),
+                    message=template.message,
+                    suggestion=template.suggestion,
                     details={
                         "executor_type": executor_type,
-                        "example": template.get("example"),
+                        "example": template.example,
                     },
                 )
             )
@@ -290,4 +435,4 @@ def validate_tool(
         if not schema_result.valid:
             errors.extend(schema_result.errors)
 
-    return ValidationResult(valid=len(errors) == 0, errors=errors)
+    return ValidationResult(valid=len(errors) == 0, errors=tuple(errors))
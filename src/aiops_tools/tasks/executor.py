@@ -15,16 +15,26 @@ celery_app = Celery(
     backend=settings.celery_result_backend,
 )
 
-celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
-    timezone="UTC",
-    enable_utc=True,
-    task_track_started=True,
-    task_time_limit=settings.tool_execution_timeout + 10,  # Extra buffer
-    task_soft_time_limit=settings.tool_execution_timeout,
-)
+# Time limits derived once from settings at import time
+_TASK_SOFT_LIMIT = settings.tool_execution_timeout
+_TASK_HARD_LIMIT = _TASK_SOFT_LIMIT + 10  # Extra buffer
+
+
+def _configure_celery(app: Celery) -> None:
+    """Apply the worker configuration to the Celery app."""
+    app.conf.update(
+        task_serializer="msgpack",
+        accept_content=["msgpack", "json"],  # json kept for messages enqueued before the switch
+        result_serializer="msgpack",
+        timezone="UTC",
+        enable_utc=True,
+        task_track_started=True,
+        task_time_limit=_TASK_HARD_LIMIT,
+        task_soft_time_limit=_TASK_SOFT_LIMIT,
+    )
+
+
+_configure_celery(celery_app)
 
 
 @celery_app.task(bind=True, name="execute_tool")
@@ -48,7 +58,7 @@ def execute_tool_task(
     result = execute_script(
         script_content=script_content,
         input_data=input_data,
-        timeout=settings.tool_execution_timeout,
+        timeout=_TASK_SOFT_LIMIT,
     )
 
     return {
@@ -1,5 +1,14 @@
 """Describe an EC2 instance in detail."""
 
+try:
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError, NoCredentialsError
+
+    _HAS_BOTO = True
+except ImportError:
+    _HAS_BOTO = False
+
 TOOL_DEFINITION = {
     "name": "aws_describe_instance",
     "display_name": "Describe EC2 Instance",
@@ -51,10 +60,27 @@ TOOL_DEFINITION = {
 }
 
 
+# Adaptive retries back off on throttling; the larger pool leaves room for
+# requests a tool issues concurrently, and the timeouts fail a stalled call
+# instead of letting it hang until the tool timeout. Inputs are schema-validated
+# before the tool runs, so botocore's request validation is skipped (AWS still
+# rejects malformed requests).
+_BOTO_CFG = (
+    Config(
+        max_pool_connections=64,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        tcp_keepalive=True,
+        connect_timeout=5,
+        read_timeout=30,
+        parameter_validation=False,
+    )
+    if _HAS_BOTO
+    else None
+)
+
+
 def _get_boto_session(input_data: dict):
     """Get boto3 session with credentials from input or environment."""
-    import boto3
-
     if input_data.get("aws_access_key_id") and input_data.get("aws_secret_access_key"):
         return boto3.Session(
             aws_access_key_id=input_data["aws_access_key_id"],
@@ -73,10 +99,7 @@ def main(input_data: dict) -> dict:
     Returns:
         Dictionary with success status and instance details or error
     """
-    try:
-        import boto3
-        from botocore.exceptions import ClientError, NoCredentialsError
-    except ImportError:
+    if not _HAS_BOTO:
         return {
             "success": False,
             "error": {
@@ -99,7 +122,7 @@ def main(input_data: dict) -> dict:
 
     try:
         session = _get_boto_session(input_data)
-        ec2 = session.client("ec2")
+        ec2 = session.client("ec2", config=_BOTO_CFG)
 
         response = ec2.describe_instances(InstanceIds=[instance_id])
 
@@ -1,5 +1,14 @@
 """Describe an RDS database instance."""
 
+try:
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError, NoCredentialsError
+
+    _HAS_BOTO = True
+except ImportError:
+    _HAS_BOTO = False
+
 TOOL_DEFINITION = {
     "name": "aws_describe_rds",
     "display_name": "Describe RDS Instance",
@@ -47,10 +56,36 @@ TOOL_DEFINITION = {
 }
 
 
+# Adaptive retries back off on throttling; the larger pool leaves room for
+# requests a tool issues concurrently, and the timeouts fail a stalled call
+# instead of letting it hang until the tool timeout. Inputs are schema-validated
+# before the tool runs, so botocore's request validation is skipped (AWS still
+# rejects malformed requests).
+_BOTO_CFG = (
+    Config(
+        max_pool_connections=64,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        tcp_keepalive=True,
+        connect_timeout=5,
+        read_timeout=30,
+        parameter_validation=False,
+    )
+    if _HAS_BOTO
+    else None
+)
+
+
+def _error_response(code: str, message: str) -> dict:
+    """Build the standard tool error envelope."""
+    return {"success": False, "error": {"code": code, "message": message}}
+
+
+_ERR_NO_BOTO3 = _error_response("AWS_IMPORT_ERROR", "boto3 package not installed")
+_ERR_NO_CREDENTIALS = _error_response("AWS_AUTH_ERROR", "No AWS credentials found")
+
+
 def _get_boto_session(input_data: dict):
     """Get boto3 session with credentials from input or environment."""
-    import boto3
-
     if input_data.get("aws_access_key_id") and input_data.get("aws_secret_access_key"):
         return boto3.Session(
             aws_access_key_id=input_data["aws_access_key_id"],
@@ -60,6 +95,32 @@ def _get_boto_session(input_data: dict):
     return boto3.Session(region_name=input_data.get("region"))
 
 
+def _format_rds(instance: dict) -> dict:
+    """Build the output record for a described DB instance."""
+    endpoint = instance.get("Endpoint")
+    restorable = instance.get("LatestRestorableTime")
+    return {
+        "db_instance_identifier": instance["DBInstanceIdentifier"],
+        "db_instance_class": instance["DBInstanceClass"],
+        "engine": instance["Engine"],
+        "engine_version": instance["EngineVersion"],
+        "status": instance["DBInstanceStatus"],
+        "endpoint": {
+            "address": endpoint.get("Address", ""),
+            "port": endpoint.get("Port", 0),
+        } if endpoint else {},
+        "allocated_storage_gb": instance["AllocatedStorage"],
+        "storage_type": instance.get("StorageType", ""),
+        "multi_az": instance.get("MultiAZ", False),
+        "availability_zone": instance.get("AvailabilityZone", ""),
+        "vpc_id": instance.get("DBSubnetGroup", {}).get("VpcId", ""),
+        "publicly_accessible": instance.get("PubliclyAccessible", False),
+        "backup_retention_days": instance.get("BackupRetentionPeriod", 0),
+        "latest_restorable_time": restorable.isoformat() if restorable else "",
+        "tags": {tag["Key"]: tag["Value"] for tag in instance.get("TagList") or ()},
+    }
+
+
 def main(input_data: dict) -> dict:
     """Describe an RDS instance.
 
@@ -69,112 +130,44 @@ def main(input_data: dict) -> dict:
     Returns:
         Dictionary with success status and RDS details or error
     """
-    try:
-        import boto3
-        from botocore.exceptions import ClientError, NoCredentialsError
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_IMPORT_ERROR",
-                "message": "boto3 package not installed",
-            },
-        }
+    if not _HAS_BOTO:
+        return _ERR_NO_BOTO3
 
     region = input_data.get("region")
     db_instance_identifier = input_data.get("db_instance_identifier")
 
     if not region or not db_instance_identifier:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_INVALID_INPUT",
-                "message": "region and db_instance_identifier are required",
-            },
-        }
+        return _error_response(
+            "AWS_INVALID_INPUT",
+            "region and db_instance_identifier are required",
+        )
 
     try:
         session = _get_boto_session(input_data)
-        rds = session.client("rds")
+        rds = session.client("rds", config=_BOTO_CFG)
 
         response = rds.describe_db_instances(DBInstanceIdentifier=db_instance_identifier)
 
         if not response.get("DBInstances"):
-            return {
-                "success": False,
-                "error": {
-                    "code": "AWS_NOT_FOUND",
-                    "message": f"RDS instance '{db_instance_identifier}' not found",
-                },
-            }
-
-        instance = response["DBInstances"][0]
-
-        # Extract tags
-        tags = {}
-        if instance.get("TagList"):
-            for tag in instance["TagList"]:
-                tags[tag["Key"]] = tag["Value"]
-
-        # Get endpoint info
-        endpoint = {}
-        if instance.get("Endpoint"):
-            endpoint = {
-                "address": instance["Endpoint"].get("Address", ""),
-                "port": instance["Endpoint"].get("Port", 0),
-            }
+            return _error_response(
+                "AWS_NOT_FOUND",
+                f"RDS instance '{db_instance_identifier}' not found",
+            )
 
         return {
             "success": True,
-            "data": {
-                "db_instance_identifier": instance["DBInstanceIdentifier"],
-                "db_instance_class": instance["DBInstanceClass"],
-                "engine": instance["Engine"],
-                "engine_version": instance["EngineVersion"],
-                "status": instance["DBInstanceStatus"],
-                "endpoint": endpoint,
-                "allocated_storage_gb": instance["AllocatedStorage"],
-                "storage_type": instance.get("StorageType", ""),
-                "multi_az": instance.get("MultiAZ", False),
-                "availability_zone": instance.get("AvailabilityZone", ""),
-                "vpc_id": instance.get("DBSubnetGroup", {}).get("VpcId", ""),
-                "publicly_accessible": instance.get("PubliclyAccessible", False),
-                "backup_retention_days": instance.get("BackupRetentionPeriod", 0),
-                "latest_restorable_time": instance.get("LatestRestorableTime", "").isoformat() if instance.get("LatestRestorableTime") else "",
-                "tags": tags,
-            },
+            "data": _format_rds(response["DBInstances"][0]),
         }
 
     except NoCredentialsError:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_AUTH_ERROR",
-                "message": "No AWS credentials found",
-            },
-        }
+        return _ERR_NO_CREDENTIALS
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "Unknown")
         if error_code == "DBInstanceNotFound":
-            return {
-                "success": False,
-                "error": {
-                    "code": "AWS_NOT_FOUND",
-                    "message": f"RDS instance '{db_instance_identifier}' not found",
-                },
-            }
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_ERROR",
-                "message": str(e),
-            },
-        }
+            return _error_response(
+                "AWS_NOT_FOUND",
+                f"RDS instance '{db_instance_identifier}' not found",
+            )
+        return _error_response("AWS_ERROR", str(e))
     except Exception as e:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_ERROR",
-                "message": str(e),
-            },
-        }
+        return _error_response("AWS_ERROR", str(e))
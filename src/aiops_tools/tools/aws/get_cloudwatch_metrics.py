@@ -1,6 +1,16 @@
 """Get CloudWatch metrics for AWS resources."""
 
-from datetime import datetime, timedelta, timezone
+import re
+from datetime import UTC, datetime, timedelta
+
+try:
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError, NoCredentialsError
+
+    _HAS_BOTO = True
+except ImportError:
+    _HAS_BOTO = False
 
 TOOL_DEFINITION = {
     "name": "aws_get_cloudwatch_metrics",
@@ -48,10 +58,29 @@ TOOL_DEFINITION = {
                 "type": "string",
                 "description": "End time (ISO 8601 or 'now')",
             },
+            "unit": {
+                "type": "string",
+                "description": "Unit to request (e.g., Percent, Bytes), reported on each datapoint",
+            },
+            "metrics": {
+                "type": "array",
+                "description": "Up to 500 metrics per call (replaces namespace/metric_name)",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "namespace": {"type": "string"},
+                        "metric_name": {"type": "string"},
+                        "dimensions": {"type": "array"},
+                        "statistic": {"type": "string"},
+                        "unit": {"type": "string"},
+                    },
+                    "required": ["namespace", "metric_name"],
+                },
+            },
             "aws_access_key_id": {"type": "string"},
             "aws_secret_access_key": {"type": "string"},
         },
-        "required": ["region", "namespace", "metric_name", "dimensions"],
+        "required": ["region"],
     },
     "output_schema": {
         "type": "object",
@@ -65,6 +94,7 @@ TOOL_DEFINITION = {
                     "datapoints": {"type": "array"},
                     "period": {"type": "integer"},
                     "statistic": {"type": "string"},
+                    "metrics": {"type": "array"},
                 },
             },
         },
@@ -72,10 +102,39 @@ TOOL_DEFINITION = {
 }
 
 
+# Adaptive retries back off on throttling; the larger pool leaves room for
+# requests a tool issues concurrently, and the timeouts fail a stalled call
+# instead of letting it hang until the tool timeout. Inputs are schema-validated
+# before the tool runs, so botocore's request validation is skipped (AWS still
+# rejects malformed requests).
+_BOTO_CFG = (
+    Config(
+        max_pool_connections=64,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        tcp_keepalive=True,
+        connect_timeout=5,
+        read_timeout=30,
+        parameter_validation=False,
+    )
+    if _HAS_BOTO
+    else None
+)
+
+# GetMetricData accepts at most 500 queries per request
+_MAX_METRIC_QUERIES = 500
+
+
+def _error_response(code: str, message: str) -> dict:
+    """Build the standard tool error envelope."""
+    return {"success": False, "error": {"code": code, "message": message}}
+
+
+_ERR_NO_BOTO3 = _error_response("AWS_IMPORT_ERROR", "boto3 package not installed")
+_ERR_NO_CREDENTIALS = _error_response("AWS_AUTH_ERROR", "No AWS credentials found")
+
+
 def _get_boto_session(input_data: dict):
     """Get boto3 session with credentials from input or environment."""
-    import boto3
-
     if input_data.get("aws_access_key_id") and input_data.get("aws_secret_access_key"):
         return boto3.Session(
             aws_access_key_id=input_data["aws_access_key_id"],
@@ -85,57 +144,88 @@ def _get_boto_session(input_data: dict):
     return boto3.Session(region_name=input_data.get("region"))
 
 
-def _parse_time(time_str: str | None, default_delta: timedelta = None) -> datetime:
+_REL_RE = re.compile(r"^-(\d+)([hmd])$")
+_UNIT = {"h": "hours", "m": "minutes", "d": "days"}
+
+
+def _parse_time(
+    time_str: str | None,
+    default_delta: timedelta = None,
+    now: datetime | None = None,
+) -> datetime:
     """Parse time string to datetime.
 
     Supports:
     - ISO 8601 format
     - 'now'
     - Relative times like '-1h', '-30m', '-1d'
+
+    Relative times are resolved against ``now`` (current UTC time if omitted).
     """
+    if now is None:
+        now = datetime.now(UTC)
     if not time_str:
-        if default_delta:
-            return datetime.now(timezone.utc) + default_delta
-        return datetime.now(timezone.utc)
+        return now + default_delta if default_delta else now
 
     if time_str == "now":
-        return datetime.now(timezone.utc)
-
-    if time_str.startswith("-"):
-        # Relative time
-        value = int(time_str[1:-1])
-        unit = time_str[-1]
-        if unit == "h":
-            return datetime.now(timezone.utc) - timedelta(hours=value)
-        elif unit == "m":
-            return datetime.now(timezone.utc) - timedelta(minutes=value)
-        elif unit == "d":
-            return datetime.now(timezone.utc) - timedelta(days=value)
+        return now
+
+    if m := _REL_RE.match(time_str):
+        return now - timedelta(**{_UNIT[m[2]]: int(m[1])})
 
     # Try ISO format
     return datetime.fromisoformat(time_str.replace("Z", "+00:00"))
 
 
+def _check_metric_spec(spec: object) -> str | None:
+    """Describe what is wrong with one entry of the metrics batch, or None if it is valid."""
+    if not isinstance(spec, dict):
+        return "must be an object"
+    for field in ("namespace", "metric_name"):
+        if not spec.get(field) or not isinstance(spec[field], str):
+            return f"{field} is required"
+    dimensions = spec.get("dimensions") or []
+    if not isinstance(dimensions, list) or not all(
+        isinstance(d, dict) and "name" in d and "value" in d for d in dimensions
+    ):
+        return "dimensions must be a list of {name, value} objects"
+    for field in ("statistic", "unit"):
+        if spec.get(field) is not None and not isinstance(spec[field], str):
+            return f"{field} must be a string"
+    return None
+
+
+def _build_metric_query(index: int, spec: dict, period: int, default_statistic: str) -> dict:
+    """Build a GetMetricData query for one metric spec."""
+    metric_stat = {
+        "Metric": {
+            "Namespace": spec["namespace"],
+            "MetricName": spec["metric_name"],
+            "Dimensions": [
+                {"Name": d["name"], "Value": d["value"]}
+                for d in spec.get("dimensions") or []
+            ],
+        },
+        "Period": period,
+        "Stat": spec.get("statistic") or default_statistic,
+    }
+    if spec.get("unit"):
+        metric_stat["Unit"] = spec["unit"]
+    return {"Id": f"m{index}", "MetricStat": metric_stat, "ReturnData": True}
+
+
 def main(input_data: dict) -> dict:
     """Get CloudWatch metrics.
 
     Args:
-        input_data: Dictionary with region, namespace, metric_name, dimensions, optional period/statistic/time range
+        input_data: Dictionary with region and either namespace/metric_name/dimensions
+            or a batch of metrics, optional period/statistic/unit/time range
 
     Returns:
         Dictionary with success status and metric data or error
     """
-    try:
-        import boto3
-        from botocore.exceptions import ClientError, NoCredentialsError
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_IMPORT_ERROR",
-                "message": "boto3 package not installed",
-            },
-        }
+    if not _HAS_BOTO:
+        return _ERR_NO_BOTO3
 
     region = input_data.get("region")
     namespace = input_data.get("namespace")
@@ -143,97 +233,105 @@ def main(input_data: dict) -> dict:
     dimensions = input_data.get("dimensions", [])
     period = input_data.get("period", 300)
     statistic = input_data.get("statistic", "Average")
+    unit = input_data.get("unit")
+    metrics = input_data.get("metrics")
     start_time_str = input_data.get("start_time")
     end_time_str = input_data.get("end_time")
 
-    if not all([region, namespace, metric_name, dimensions]):
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_INVALID_INPUT",
-                "message": "region, namespace, metric_name, and dimensions are required",
-            },
-        }
+    if metrics is None:
+        if not all([region, namespace, metric_name, dimensions]):
+            return _error_response(
+                "AWS_INVALID_INPUT",
+                "region, namespace, metric_name, and dimensions are required",
+            )
+        specs = [{
+            "namespace": namespace,
+            "metric_name": metric_name,
+            "dimensions": dimensions,
+            "statistic": statistic,
+            "unit": unit,
+        }]
+    elif not region or not metrics or len(metrics) > _MAX_METRIC_QUERIES:
+        return _error_response(
+            "AWS_INVALID_INPUT",
+            f"region and between 1 and {_MAX_METRIC_QUERIES} metrics are required",
+        )
+    else:
+        for i, spec in enumerate(metrics):
+            if problem := _check_metric_spec(spec):
+                return _error_response("AWS_INVALID_INPUT", f"metrics[{i}]: {problem}")
+        specs = metrics
 
     try:
         # Parse times
-        end_time = _parse_time(end_time_str)
-        start_time = _parse_time(start_time_str, default_delta=timedelta(hours=-1))
+        now = datetime.now(UTC)
+        end_time = _parse_time(end_time_str, now=now)
+        start_time = _parse_time(start_time_str, default_delta=timedelta(hours=-1), now=now)
 
         session = _get_boto_session(input_data)
-        cloudwatch = session.client("cloudwatch")
+        cloudwatch = session.client("cloudwatch", config=_BOTO_CFG)
 
-        # Build dimensions for API
-        api_dimensions = [
-            {"Name": d["name"], "Value": d["value"]}
-            for d in dimensions
+        queries = [
+            _build_metric_query(i, spec, period, statistic)
+            for i, spec in enumerate(specs)
         ]
 
-        response = cloudwatch.get_metric_statistics(
-            Namespace=namespace,
-            MetricName=metric_name,
-            Dimensions=api_dimensions,
+        # One GetMetricData round trip covers every query; results come back
+        # in timestamp order so no client-side sorting is needed
+        series = {q["Id"]: ([], []) for q in queries}
+        paginator = cloudwatch.get_paginator("get_metric_data")
+        for page in paginator.paginate(
+            MetricDataQueries=queries,
             StartTime=start_time,
             EndTime=end_time,
-            Period=period,
-            Statistics=[statistic],
-        )
+            ScanBy="TimestampAscending",
+        ):
+            for result in page["MetricDataResults"]:
+                timestamps, values = series[result["Id"]]
+                timestamps.extend(result["Timestamps"])
+                values.extend(result["Values"])
 
-        # Sort datapoints by timestamp
-        datapoints = sorted(
-            response.get("Datapoints", []),
-            key=lambda x: x["Timestamp"],
-        )
-
-        formatted_datapoints = []
-        for dp in datapoints:
-            formatted_datapoints.append({
-                "timestamp": dp["Timestamp"].isoformat(),
-                "value": dp.get(statistic, 0),
-                "unit": dp.get("Unit", "None"),
+        results = []
+        for query, spec in zip(queries, specs, strict=True):
+            timestamps, values = series[query["Id"]]
+            # GetMetricData does not return units, so report the requested one
+            metric_unit = spec.get("unit")
+            results.append({
+                "namespace": spec["namespace"],
+                "metric_name": spec["metric_name"],
+                "statistic": query["MetricStat"]["Stat"],
+                "datapoints": [
+                    {"timestamp": ts.isoformat(), "value": value, "unit": metric_unit}
+                    for ts, value in zip(timestamps, values, strict=True)
+                ],
             })
 
+        if metrics is not None:
+            return {
+                "success": True,
+                "data": {
+                    "metrics": results,
+                    "period": period,
+                },
+            }
+
         return {
             "success": True,
             "data": {
                 "namespace": namespace,
                 "metric_name": metric_name,
-                "datapoints": formatted_datapoints,
+                "datapoints": results[0]["datapoints"],
                 "period": period,
                 "statistic": statistic,
             },
         }
 
     except NoCredentialsError:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_AUTH_ERROR",
-                "message": "No AWS credentials found",
-            },
-        }
+        return _ERR_NO_CREDENTIALS
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "Unknown")
         if error_code == "Throttling":
-            return {
-                "success": False,
-                "error": {
-                    "code": "AWS_RATE_LIMITED",
-                    "message": "Rate limit exceeded. Try again later.",
-                },
-            }
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_ERROR",
-                "message": str(e),
-            },
-        }
+            return _error_response("AWS_RATE_LIMITED", "Rate limit exceeded. Try again later.")
+        return _error_response("AWS_ERROR", str(e))
     except Exception as e:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_ERROR",
-                "message": str(e),
-            },
-        }
+        return _error_response("AWS_ERROR", str(e))
@@ -1,5 +1,17 @@
 """List EC2 instances in AWS."""
 
+from collections.abc import Iterator
+from itertools import chain, islice
+
+try:
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError, NoCredentialsError
+
+    _HAS_BOTO = True
+except ImportError:
+    _HAS_BOTO = False
+
 TOOL_DEFINITION = {
     "name": "aws_list_ec2_instances",
     "display_name": "List EC2 Instances",
@@ -56,10 +68,47 @@ TOOL_DEFINITION = {
 }
 
 
+# Adaptive retries back off on throttling; the larger pool leaves room for
+# requests a tool issues concurrently, and the timeouts fail a stalled call
+# instead of letting it hang until the tool timeout. Inputs are schema-validated
+# before the tool runs, so botocore's request validation is skipped (AWS still
+# rejects malformed requests).
+_BOTO_CFG = (
+    Config(
+        max_pool_connections=64,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        tcp_keepalive=True,
+        connect_timeout=5,
+        read_timeout=30,
+        parameter_validation=False,
+    )
+    if _HAS_BOTO
+    else None
+)
+
+# DescribeInstances accepts MaxResults between 5 and 1000
+_EC2_MIN_PAGE_SIZE = 5
+_EC2_MAX_PAGE_SIZE = 1000
+
+
+def _error_response(code: str, message: str) -> dict:
+    """Build the standard tool error envelope."""
+    return {"success": False, "error": {"code": code, "message": message}}
+
+
+_ERR_NO_BOTO3 = _error_response(
+    "AWS_IMPORT_ERROR",
+    "boto3 package not installed. Run: pip install boto3",
+)
+_ERR_NO_CREDENTIALS = _error_response(
+    "AWS_AUTH_ERROR",
+    "No AWS credentials found. Provide aws_access_key_id and aws_secret_access_key "
+    "or configure AWS credentials.",
+)
+
+
 def _get_boto_session(input_data: dict):
     """Get boto3 session with credentials from input or environment."""
-    import boto3
-
     if input_data.get("aws_access_key_id") and input_data.get("aws_secret_access_key"):
         return boto3.Session(
             aws_access_key_id=input_data["aws_access_key_id"],
@@ -71,11 +120,37 @@ def _get_boto_session(input_data: dict):
 
 def _get_instance_name(instance) -> str:
     """Extract Name tag from instance."""
-    if instance.get("Tags"):
-        for tag in instance["Tags"]:
-            if tag["Key"] == "Name":
-                return tag["Value"]
-    return ""
+    return next((tag["Value"] for tag in instance.get("Tags") or () if tag["Key"] == "Name"), "")
+
+
+def _format_instance(instance: dict) -> dict:
+    """Build the output record for a described instance."""
+    return {
+        "instance_id": instance["InstanceId"],
+        "name": _get_instance_name(instance),
+        "state": instance["State"]["Name"],
+        "instance_type": instance["InstanceType"],
+        "private_ip": instance.get("PrivateIpAddress", ""),
+        "public_ip": instance.get("PublicIpAddress", ""),
+        "availability_zone": instance["Placement"]["AvailabilityZone"],
+        "launch_time": instance["LaunchTime"].isoformat(),
+    }
+
+
+def _iter_instances(paginator, params: dict, max_results: int) -> Iterator[dict]:
+    """Yield formatted instances from a describe_instances paginator, up to max_results."""
+    # MaxItems counts reservations, so islice caps instances
+    pages = paginator.paginate(
+        **params,
+        PaginationConfig={
+            "MaxItems": max_results,
+            "PageSize": min(max(max_results, _EC2_MIN_PAGE_SIZE), _EC2_MAX_PAGE_SIZE),
+        },
+    )
+    raw_instances = chain.from_iterable(
+        reservation["Instances"] for page in pages for reservation in page["Reservations"]
+    )
+    yield from map(_format_instance, islice(raw_instances, max_results))
 
 
 def main(input_data: dict) -> dict:
@@ -87,34 +162,19 @@ def main(input_data: dict) -> dict:
     Returns:
         Dictionary with success status and instance list or error
     """
-    try:
-        import boto3
-        from botocore.exceptions import ClientError, NoCredentialsError
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_IMPORT_ERROR",
-                "message": "boto3 package not installed. Run: pip install boto3",
-            },
-        }
+    if not _HAS_BOTO:
+        return _ERR_NO_BOTO3
 
     region = input_data.get("region")
     if not region:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_INVALID_INPUT",
-                "message": "region is required",
-            },
-        }
+        return _error_response("AWS_INVALID_INPUT", "region is required")
 
     filters = input_data.get("filters", [])
     max_results = input_data.get("max_results", 100)
 
     try:
         session = _get_boto_session(input_data)
-        ec2 = session.client("ec2")
+        ec2 = session.client("ec2", config=_BOTO_CFG)
 
         # Build API params
         params = {}
@@ -124,30 +184,8 @@ def main(input_data: dict) -> dict:
                 for f in filters
             ]
 
-        # Describe instances
-        instances = []
         paginator = ec2.get_paginator("describe_instances")
-
-        for page in paginator.paginate(**params):
-            for reservation in page["Reservations"]:
-                for instance in reservation["Instances"]:
-                    instances.append({
-                        "instance_id": instance["InstanceId"],
-                        "name": _get_instance_name(instance),
-                        "state": instance["State"]["Name"],
-                        "instance_type": instance["InstanceType"],
-                        "private_ip": instance.get("PrivateIpAddress", ""),
-                        "public_ip": instance.get("PublicIpAddress", ""),
-                        "availability_zone": instance["Placement"]["AvailabilityZone"],
-                        "launch_time": instance["LaunchTime"].isoformat(),
-                    })
-
-                    if len(instances) >= max_results:
-                        break
-                if len(instances) >= max_results:
-                    break
-            if len(instances) >= max_results:
-                break
+        instances = list(_iter_instances(paginator, params, max_results))
 
         return {
             "success": True,
@@ -159,43 +197,16 @@ def main(input_data: dict) -> dict:
         }
 
     except NoCredentialsError:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_AUTH_ERROR",
-                "message": "No AWS credentials found. Provide aws_access_key_id and aws_secret_access_key or configure AWS credentials.",
-            },
-        }
+        return _ERR_NO_CREDENTIALS
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "Unknown")
         if error_code == "AuthFailure":
-            return {
-                "success": False,
-                "error": {
-                    "code": "AWS_AUTH_ERROR",
-                    "message": "Invalid AWS credentials",
-                },
-            }
+            return _error_response("AWS_AUTH_ERROR", "Invalid AWS credentials")
         elif error_code == "AccessDenied":
-            return {
-                "success": False,
-                "error": {
-                    "code": "AWS_ACCESS_DENIED",
-                    "message": "Access denied. Check IAM permissions for ec2:DescribeInstances",
-                },
-            }
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_ERROR",
-                "message": str(e),
-            },
-        }
+            return _error_response(
+                "AWS_ACCESS_DENIED",
+                "Access denied. Check IAM permissions for ec2:DescribeInstances",
+            )
+        return _error_response("AWS_ERROR", str(e))
     except Exception as e:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_ERROR",
-                "message": str(e),
-            },
-        }
+        return _error_response("AWS_ERROR", str(e))
@@ -1,5 +1,16 @@
 """List S3 buckets in AWS account."""
 
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError, NoCredentialsError
+
+    _HAS_BOTO = True
+except ImportError:
+    _HAS_BOTO = False
+
 TOOL_DEFINITION = {
     "name": "aws_list_s3_buckets",
     "display_name": "List S3 Buckets",
@@ -33,10 +44,42 @@ TOOL_DEFINITION = {
 }
 
 
+# Adaptive retries back off on throttling; the larger pool leaves room for
+# requests a tool issues concurrently, and the timeouts fail a stalled call
+# instead of letting it hang until the tool timeout. Inputs are schema-validated
+# before the tool runs, so botocore's request validation is skipped (AWS still
+# rejects malformed requests).
+_BOTO_CFG = (
+    Config(
+        max_pool_connections=64,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        tcp_keepalive=True,
+        connect_timeout=5,
+        read_timeout=30,
+        parameter_validation=False,
+    )
+    if _HAS_BOTO
+    else None
+)
+
+# ListBuckets accepts at most 10000 buckets per page
+_LIST_BUCKETS_PAGE_SIZE = 10000
+
+# Concurrent get_bucket_location calls (kept below the client's connection pool size)
+_REGION_LOOKUP_WORKERS = 16
+
+
+def _error_response(code: str, message: str) -> dict:
+    """Build the standard tool error envelope."""
+    return {"success": False, "error": {"code": code, "message": message}}
+
+
+_ERR_NO_BOTO3 = _error_response("AWS_IMPORT_ERROR", "boto3 package not installed")
+_ERR_NO_CREDENTIALS = _error_response("AWS_AUTH_ERROR", "No AWS credentials found")
+
+
 def _get_boto_session(input_data: dict):
     """Get boto3 session with credentials from input or environment."""
-    import boto3
-
     region = input_data.get("region", "us-east-1")
     if input_data.get("aws_access_key_id") and input_data.get("aws_secret_access_key"):
         return boto3.Session(
@@ -47,6 +90,42 @@ def _get_boto_session(input_data: dict):
     return boto3.Session(region_name=region)
 
 
+def _get_bucket_region(s3, bucket_name: str) -> str:
+    """Look up a bucket's region, or 'unknown' if it cannot be read."""
+    try:
+        location = s3.get_bucket_location(Bucket=bucket_name)
+    except Exception:
+        return "unknown"
+    # None means us-east-1
+    return location.get("LocationConstraint") or "us-east-1"
+
+
+def _supports_bucket_region(s3) -> bool:
+    """Check whether the client's ListBuckets model accepts MaxBuckets.
+
+    S3 only includes BucketRegion in ListBuckets results when the request
+    carries one of the newer parameters, which older botocore releases lack.
+    """
+    input_shape = s3.meta.service_model.operation_model("ListBuckets").input_shape
+    return input_shape is not None and "MaxBuckets" in input_shape.members
+
+
+def _list_buckets(s3) -> list[dict]:
+    """List all buckets, with BucketRegion populated when the API supports it."""
+    if not _supports_bucket_region(s3):
+        return s3.list_buckets().get("Buckets", [])
+
+    buckets = []
+    params = {"MaxBuckets": _LIST_BUCKETS_PAGE_SIZE}
+    while True:
+        response = s3.list_buckets(**params)
+        buckets.extend(response.get("Buckets", []))
+        token = response.get("ContinuationToken")
+        if not token:
+            return buckets
+        params["ContinuationToken"] = token
+
+
 def main(input_data: dict) -> dict:
     """List S3 buckets.
 
@@ -56,42 +135,33 @@ def main(input_data: dict) -> dict:
     Returns:
         Dictionary with success status and bucket list or error
     """
-    try:
-        import boto3
-        from botocore.exceptions import ClientError, NoCredentialsError
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_IMPORT_ERROR",
-                "message": "boto3 package not installed",
-            },
-        }
+    if not _HAS_BOTO:
+        return _ERR_NO_BOTO3
 
     try:
         session = _get_boto_session(input_data)
-        s3 = session.client("s3")
+        s3 = session.client("s3", config=_BOTO_CFG)
+
+        raw_buckets = _list_buckets(s3)
 
-        response = s3.list_buckets()
+        # Newer S3 APIs report BucketRegion inline; only look up the rest.
+        # Lookups are independent round trips, so run them concurrently on the
+        # one (thread-safe) client
+        missing = [b["Name"] for b in raw_buckets if not b.get("BucketRegion")]
+        looked_up = {}
+        if missing:
+            with ThreadPoolExecutor(max_workers=_REGION_LOOKUP_WORKERS) as executor:
+                regions = executor.map(lambda name: _get_bucket_region(s3, name), missing)
+                looked_up = dict(zip(missing, regions, strict=True))
 
-        buckets = []
-        for bucket in response.get("Buckets", []):
-            bucket_info = {
+        buckets = [
+            {
                 "name": bucket["Name"],
                 "creation_date": bucket["CreationDate"].isoformat(),
-                "region": "unknown",
+                "region": bucket.get("BucketRegion") or looked_up[bucket["Name"]],
             }
-
-            # Try to get bucket region
-            try:
-                location = s3.get_bucket_location(Bucket=bucket["Name"])
-                bucket_region = location.get("LocationConstraint")
-                # None means us-east-1
-                bucket_info["region"] = bucket_region if bucket_region else "us-east-1"
-            except Exception:
-                pass
-
-            buckets.append(bucket_info)
+            for bucket in raw_buckets
+        ]
 
         return {
             "success": True,
@@ -102,35 +172,14 @@ def main(input_data: dict) -> dict:
         }
 
     except NoCredentialsError:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_AUTH_ERROR",
-                "message": "No AWS credentials found",
-            },
-        }
+        return _ERR_NO_CREDENTIALS
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "Unknown")
         if error_code == "AccessDenied":
-            return {
-                "success": False,
-                "error": {
-                    "code": "AWS_ACCESS_DENIED",
-                    "message": "Access denied. Check IAM permissions for s3:ListAllMyBuckets",
-                },
-            }
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_ERROR",
-                "message": str(e),
-            },
-        }
+            return _error_response(
+                "AWS_ACCESS_DENIED",
+                "Access denied. Check IAM permissions for s3:ListAllMyBuckets",
+            )
+        return _error_response("AWS_ERROR", str(e))
     except Exception as e:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_ERROR",
-                "message": str(e),
-            },
-        }
+        return _error_response("AWS_ERROR", str(e))
@@ -1,5 +1,16 @@
 """List objects in an S3 bucket."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError, NoCredentialsError
+
+    _HAS_BOTO = True
+except ImportError:
+    _HAS_BOTO = False
+
 TOOL_DEFINITION = {
     "name": "aws_list_s3_objects",
     "display_name": "List S3 Objects",
@@ -16,6 +27,18 @@ TOOL_DEFINITION = {
                 "type": "string",
                 "description": "Filter objects by prefix (e.g., 'logs/2024/')",
             },
+            "prefixes": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Disjoint prefixes to list in parallel (overrides prefix)",
+            },
+            "mode": {
+                "type": "string",
+                "enum": ["list", "browse"],
+                "description": "'list' returns every object under the prefix, "
+                "'browse' returns one folder level (sub-prefixes plus a few keys)",
+                "default": "list",
+            },
             "aws_access_key_id": {"type": "string"},
             "aws_secret_access_key": {"type": "string"},
             "region": {"type": "string"},
@@ -37,6 +60,11 @@ TOOL_DEFINITION = {
                     "bucket": {"type": "string"},
                     "prefix": {"type": "string"},
                     "objects": {"type": "array"},
+                    "common_prefixes": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Sub-prefixes one level below prefix (browse mode only)",
+                    },
                     "total_count": {"type": "integer"},
                     "truncated": {"type": "boolean"},
                 },
@@ -46,10 +74,52 @@ TOOL_DEFINITION = {
 }
 
 
+# Adaptive retries back off on throttling; the larger pool leaves room for
+# requests a tool issues concurrently, and the timeouts fail a stalled call
+# instead of letting it hang until the tool timeout. Inputs are schema-validated
+# before the tool runs, so botocore's request validation is skipped (AWS still
+# rejects malformed requests).
+_BOTO_CFG = (
+    Config(
+        max_pool_connections=64,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        tcp_keepalive=True,
+        connect_timeout=5,
+        read_timeout=30,
+        parameter_validation=False,
+    )
+    if _HAS_BOTO
+    else None
+)
+
+
+# ListObjectsV2 accepts at most 1000 keys per request
+_S3_MAX_PAGE_SIZE = 1000
+
+# Concurrent per-prefix listings (kept below the client's connection pool size)
+_SHARD_WORKERS = 8
+
+# Keys returned alongside the sub-prefixes when browsing a folder level
+_BROWSE_MAX_KEYS = 50
+
+def _error_response(code: str, message: str) -> dict:
+    """Build the standard tool error envelope."""
+    return {"success": False, "error": {"code": code, "message": message}}
+
+
+_ERR_NO_BOTO3 = _error_response("AWS_IMPORT_ERROR", "boto3 package not installed")
+_ERR_NO_CREDENTIALS = _error_response("AWS_AUTH_ERROR", "No AWS credentials found")
+_ERR_NO_BUCKET = _error_response("AWS_INVALID_INPUT", "bucket is required")
+
+# S3 error codes with a friendlier message: code -> (tool error code, message template)
+_CLIENT_ERROR_MAP = {
+    "NoSuchBucket": ("AWS_NOT_FOUND", "Bucket '{bucket}' not found"),
+    "AccessDenied": ("AWS_ACCESS_DENIED", "Access denied to bucket '{bucket}'"),
+}
+
+
 def _get_boto_session(input_data: dict):
     """Get boto3 session with credentials from input or environment."""
-    import boto3
-
     region = input_data.get("region", "us-east-1")
     if input_data.get("aws_access_key_id") and input_data.get("aws_secret_access_key"):
         return boto3.Session(
@@ -60,6 +130,122 @@ def _get_boto_session(input_data: dict):
     return boto3.Session(region_name=region)
 
 
+def _format_objects(contents: list[dict]) -> list[dict]:
+    """Build the output records for a page of listed objects."""
+    return [
+        {
+            "key": obj["Key"],
+            "size_bytes": obj["Size"],
+            "last_modified": obj["LastModified"].isoformat(),
+            "storage_class": obj.get("StorageClass", "STANDARD"),
+        }
+        for obj in contents
+    ]
+
+
+def _list_prefix(s3, bucket: str, prefix: str, max_keys: int) -> tuple[list[dict], bool]:
+    """List up to max_keys objects under one prefix.
+
+    Returns:
+        Tuple of (objects, truncated)
+    """
+    params = {"Bucket": bucket}
+    if prefix:
+        params["Prefix"] = prefix
+
+    # ListObjectsV2 returns at most 1000 keys per call, so page until max_keys
+    paginator = s3.get_paginator("list_objects_v2")
+    page_iter = paginator.paginate(
+        **params,
+        PaginationConfig={"PageSize": min(max_keys, _S3_MAX_PAGE_SIZE), "MaxItems": max_keys},
+    )
+
+    objects = []
+    for page in page_iter:
+        objects += _format_objects(page.get("Contents", ()))
+
+    # Set by the paginator when MaxItems cut the listing short
+    return objects, page_iter.resume_token is not None
+
+
+def _browse_prefix(
+    s3, bucket: str, prefix: str, max_keys: int
+) -> tuple[list[dict], list[str], bool]:
+    """List one folder level under prefix.
+
+    Returns:
+        Tuple of (objects directly under prefix, sub-prefixes, truncated)
+    """
+    response = s3.list_objects_v2(
+        Bucket=bucket,
+        Prefix=prefix,
+        Delimiter="/",
+        MaxKeys=min(_BROWSE_MAX_KEYS, max_keys),
+    )
+    objects = _format_objects(response.get("Contents", ()))
+    common_prefixes = [p["Prefix"] for p in response.get("CommonPrefixes", [])]
+    return objects, common_prefixes, response.get("IsTruncated", False)
+
+
+def _discover_shards(s3, bucket: str, prefix: str) -> tuple[list[dict], list[str]] | None:
+    """Split a '/'-terminated prefix into its immediate sub-prefixes.
+
+    Returns:
+        Tuple of (objects directly under prefix, sub-prefixes), or None when
+        the prefix has too many entries to split with a single request
+    """
+    response = s3.list_objects_v2(Bucket=bucket, Prefix=prefix, Delimiter="/")
+    if response.get("IsTruncated"):
+        return None
+    direct = _format_objects(response.get("Contents", ()))
+    return direct, [p["Prefix"] for p in response.get("CommonPrefixes", [])]
+
+
+def _list_sharded(
+    s3,
+    bucket: str,
+    prefixes: list[str],
+    max_keys: int,
+    direct: list[dict] | None = None,
+) -> tuple[list[dict], bool]:
+    """List several disjoint prefixes concurrently and merge them in key order.
+
+    Args:
+        s3: S3 client (shared across worker threads)
+        bucket: Bucket name
+        prefixes: Disjoint prefixes to list
+        max_keys: Maximum number of objects to return
+        direct: Objects already listed outside the prefixes
+
+    Returns:
+        Tuple of (objects, truncated)
+    """
+    objects = list(direct or ())
+    truncated = False
+    remaining = len(prefixes)
+    with ThreadPoolExecutor(max_workers=min(_SHARD_WORKERS, len(prefixes))) as executor:
+        futures = [
+            executor.submit(_list_prefix, s3, bucket, shard, max_keys) for shard in prefixes
+        ]
+        for future in as_completed(futures):
+            shard_objects, shard_truncated = future.result()
+            objects.extend(shard_objects)
+            truncated = truncated or shard_truncated
+            remaining -= 1
+            if remaining and len(objects) >= max_keys:
+                # Enough keys collected; skip shards that have not started yet
+                for pending in futures:
+                    pending.cancel()
+                truncated = True
+                break
+
+    objects.sort(key=lambda obj: obj["key"])
+    if len(objects) > max_keys:
+        del objects[max_keys:]
+        truncated = True
+    return objects, truncated
+
+
 def main(input_data: dict) -> dict:
     """List objects in an S3 bucket.
 
@@ -69,52 +255,48 @@ def main(input_data: dict) -> dict:
     Returns:
         Dictionary with success status and object list or error
     """
-    try:
-        import boto3
-        from botocore.exceptions import ClientError, NoCredentialsError
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_IMPORT_ERROR",
-                "message": "boto3 package not installed",
-            },
-        }
+    if not _HAS_BOTO:
+        return _ERR_NO_BOTO3
 
     bucket = input_data.get("bucket")
     if not bucket:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_INVALID_INPUT",
-                "message": "bucket is required",
-            },
-        }
+        return _ERR_NO_BUCKET
 
     prefix = input_data.get("prefix", "")
+    prefixes = input_data.get("prefixes")
     max_keys = input_data.get("max_keys", 1000)
+    mode = input_data.get("mode", "list")
 
     try:
         session = _get_boto_session(input_data)
-        s3 = session.client("s3")
+        s3 = session.client("s3", config=_BOTO_CFG)
 
-        params = {
-            "Bucket": bucket,
-            "MaxKeys": max_keys,
-        }
-        if prefix:
-            params["Prefix"] = prefix
+        if mode == "browse":
+            objects, common_prefixes, truncated = _browse_prefix(s3, bucket, prefix, max_keys)
+            return {
+                "success": True,
+                "data": {
+                    "bucket": bucket,
+                    "prefix": prefix,
+                    "objects": objects,
+                    "common_prefixes": common_prefixes,
+                    "total_count": len(objects),
+                    "truncated": truncated,
+                },
+            }
 
-        response = s3.list_objects_v2(**params)
+        # A '/'-terminated prefix spanning several pages can be split into its
+        # sub-prefixes and listed in parallel
+        direct = []
+        if not prefixes and prefix.endswith("/") and max_keys > _S3_MAX_PAGE_SIZE:
+            shards = _discover_shards(s3, bucket, prefix)
+            if shards:
+                direct, prefixes = shards
 
-        objects = []
-        for obj in response.get("Contents", []):
-            objects.append({
-                "key": obj["Key"],
-                "size_bytes": obj["Size"],
-                "last_modified": obj["LastModified"].isoformat(),
-                "storage_class": obj.get("StorageClass", "STANDARD"),
-            })
+        if prefixes:
+            objects, truncated = _list_sharded(s3, bucket, prefixes, max_keys, direct)
+        else:
+            objects, truncated = _list_prefix(s3, bucket, prefix, max_keys)
 
         return {
             "success": True,
@@ -123,48 +305,18 @@ def main(input_data: dict) -> dict:
                 "prefix": prefix,
                 "objects": objects,
                 "total_count": len(objects),
-                "truncated": response.get("IsTruncated", False),
+                "truncated": truncated,
             },
         }
 
     except NoCredentialsError:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_AUTH_ERROR",
-                "message": "No AWS credentials found",
-            },
-        }
+        return _ERR_NO_CREDENTIALS
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "Unknown")
-        if error_code == "NoSuchBucket":
-            return {
-                "success": False,
-                "error": {
-                    "code": "AWS_NOT_FOUND",
-                    "message": f"Bucket '{bucket}' not found",
-                },
-            }
-        elif error_code == "AccessDenied":
-            return {
-                "success": False,
-                "error": {
-                    "code": "AWS_ACCESS_DENIED",
-                    "message": f"Access denied to bucket '{bucket}'",
-                },
-            }
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_ERROR",
-                "message": str(e),
-            },
-        }
+        mapped = _CLIENT_ERROR_MAP.get(error_code)
+        if mapped is None:
+            return _error_response("AWS_ERROR", str(e))
+        code, template = mapped
+        return _error_response(code, template.format(bucket=bucket))
     except Exception as e:
-        return {
-            "success": False,
-            "error": {
-                "code": "AWS_ERROR",
-                "message": str(e),
-            },
-        }
+        return _error_response("AWS_ERROR", str(e))
@@ -1,5 +1,19 @@
 """Describe database table schema."""
 
+try:
+    import psycopg2
+
+    _HAS_PSYCOPG2 = True
+except ImportError:
+    _HAS_PSYCOPG2 = False
+
+try:
+    import mysql.connector
+
+    _HAS_MYSQL = True
+except ImportError:
+    _HAS_MYSQL = False
+
 TOOL_DEFINITION = {
     "name": "db_describe_table",
     "display_name": "Describe Table Schema",
@@ -46,6 +60,24 @@ TOOL_DEFINITION = {
     },
 }
 
+_REQUIRED_FIELDS = ("db_type", "host", "database", "username", "password", "table_name")
+
+_ERR_NO_PSYCOPG2 = {
+    "success": False,
+    "error": {
+        "code": "DB_IMPORT_ERROR",
+        "message": "psycopg2 package not installed",
+    },
+}
+
+_ERR_NO_MYSQL = {
+    "success": False,
+    "error": {
+        "code": "DB_IMPORT_ERROR",
+        "message": "mysql-connector-python package not installed",
+    },
+}
+
 
 def main(input_data: dict) -> dict:
     """Describe a database table.
@@ -65,14 +97,15 @@ def main(input_data: dict) -> dict:
     table_name = input_data.get("table_name")
     schema = input_data.get("schema", "public")
 
-    if not all([db_type, host, database, username, password, table_name]):
-        return {
-            "success": False,
-            "error": {
-                "code": "DB_INVALID_INPUT",
-                "message": "Missing required parameters",
-            },
-        }
+    for field in _REQUIRED_FIELDS:
+        if not input_data.get(field):
+            return {
+                "success": False,
+                "error": {
+                    "code": "DB_INVALID_INPUT",
+                    "message": f"Missing required parameter: {field}",
+                },
+            }
 
     if port is None:
         port = 5432 if db_type == "postgresql" else 3306
@@ -100,18 +133,56 @@ def main(input_data: dict) -> dict:
         }
 
 
+# Columns, indexes and foreign keys in one round trip. Each row is tagged with
+# its section (0=column, 1=index, 2=foreign key) and padded to a common shape:
+# (section, ord, name, text_a, text_b, text_c, flag_a, flag_b, names)
+_PG_DESCRIBE_SQL = """
+    SELECT 0 AS section, c.ordinal_position::int AS ord, c.column_name::text,
+           c.data_type::text, c.column_default::text, NULL::text,
+           c.is_nullable = 'YES', pk.column_name IS NOT NULL, NULL::text[]
+    FROM information_schema.columns c
+    LEFT JOIN (
+        SELECT ku.column_name
+        FROM information_schema.table_constraints tc
+        JOIN information_schema.key_column_usage ku
+            ON tc.constraint_name = ku.constraint_name
+        WHERE tc.table_schema = %(schema)s AND tc.table_name = %(table)s
+            AND tc.constraint_type = 'PRIMARY KEY'
+    ) pk ON c.column_name = pk.column_name
+    WHERE c.table_schema = %(schema)s AND c.table_name = %(table)s
+
+    UNION ALL
+
+    SELECT 1, 0, i.relname::text, NULL, NULL, NULL, ix.indisunique, NULL,
+           array_agg(a.attname::text ORDER BY array_position(ix.indkey, a.attnum))
+    FROM pg_index ix
+    JOIN pg_class t ON t.oid = ix.indrelid
+    JOIN pg_class i ON i.oid = ix.indexrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
+    WHERE n.nspname = %(schema)s AND t.relname = %(table)s
+    GROUP BY i.relname, ix.indisunique
+
+    UNION ALL
+
+    SELECT 2, 0, tc.constraint_name::text, kcu.column_name::text,
+           ccu.table_name::text, ccu.column_name::text, NULL, NULL, NULL
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage kcu
+        ON tc.constraint_name = kcu.constraint_name
+    JOIN information_schema.constraint_column_usage ccu
+        ON ccu.constraint_name = tc.constraint_name
+    WHERE tc.table_schema = %(schema)s AND tc.table_name = %(table)s
+        AND tc.constraint_type = 'FOREIGN KEY'
+
+    ORDER BY 1, 2
+"""
+
+
 def _describe_postgresql_table(host, port, database, username, password, table_name, schema):
     """Describe a PostgreSQL table."""
-    try:
-        import psycopg2
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "DB_IMPORT_ERROR",
-                "message": "psycopg2 package not installed",
-            },
-        }
+    if not _HAS_PSYCOPG2:
+        return _ERR_NO_PSYCOPG2
 
     conn = None
     try:
@@ -123,103 +194,44 @@ def _describe_postgresql_table(host, port, database, username, password, table_n
             password=password,
         )
 
-        # Get columns
-        column_query = """
-            SELECT
-                c.column_name,
-                c.data_type,
-                c.is_nullable = 'YES' as nullable,
-                c.column_default,
-                CASE WHEN pk.column_name IS NOT NULL THEN true ELSE false END as primary_key
-            FROM information_schema.columns c
-            LEFT JOIN (
-                SELECT ku.column_name
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage ku
-                    ON tc.constraint_name = ku.constraint_name
-                WHERE tc.table_schema = %s AND tc.table_name = %s AND tc.constraint_type = 'PRIMARY KEY'
-            ) pk ON c.column_name = pk.column_name
-            WHERE c.table_schema = %s AND c.table_name = %s
-            ORDER BY c.ordinal_position
-        """
-
         with conn.cursor() as cursor:
-            cursor.execute(column_query, (schema, table_name, schema, table_name))
-            column_rows = cursor.fetchall()
-
-            if not column_rows:
-                return {
-                    "success": False,
-                    "error": {
-                        "code": "DB_NOT_FOUND",
-                        "message": f"Table '{table_name}' not found in schema '{schema}'",
-                    },
-                }
+            cursor.execute(_PG_DESCRIBE_SQL, {"schema": schema, "table": table_name})
+            rows = cursor.fetchall()
 
         columns = []
-        for row in column_rows:
-            columns.append({
-                "name": row[0],
-                "data_type": row[1],
-                "nullable": row[2],
-                "default": row[3],
-                "primary_key": row[4],
-            })
-
-        # Get indexes
-        index_query = """
-            SELECT
-                i.relname as index_name,
-                array_agg(a.attname ORDER BY array_position(ix.indkey, a.attnum)) as columns,
-                ix.indisunique as is_unique
-            FROM pg_index ix
-            JOIN pg_class t ON t.oid = ix.indrelid
-            JOIN pg_class i ON i.oid = ix.indexrelid
-            JOIN pg_namespace n ON n.oid = t.relnamespace
-            JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
-            WHERE n.nspname = %s AND t.relname = %s
-            GROUP BY i.relname, ix.indisunique
-        """
-
-        with conn.cursor() as cursor:
-            cursor.execute(index_query, (schema, table_name))
-            index_rows = cursor.fetchall()
-
         indexes = []
-        for row in index_rows:
-            indexes.append({
-                "name": row[0],
-                "columns": row[1],
-                "unique": row[2],
-            })
-
-        # Get foreign keys
-        fk_query = """
-            SELECT
-                tc.constraint_name,
-                kcu.column_name,
-                ccu.table_name AS references_table,
-                ccu.column_name AS references_column
-            FROM information_schema.table_constraints tc
-            JOIN information_schema.key_column_usage kcu
-                ON tc.constraint_name = kcu.constraint_name
-            JOIN information_schema.constraint_column_usage ccu
-                ON ccu.constraint_name = tc.constraint_name
-            WHERE tc.table_schema = %s AND tc.table_name = %s AND tc.constraint_type = 'FOREIGN KEY'
-        """
-
-        with conn.cursor() as cursor:
-            cursor.execute(fk_query, (schema, table_name))
-            fk_rows = cursor.fetchall()
-
         foreign_keys = []
-        for row in fk_rows:
-            foreign_keys.append({
-                "name": row[0],
-                "column": row[1],
-                "references_table": row[2],
-                "references_column": row[3],
-            })
+        for section, _, name, text_a, text_b, text_c, flag_a, flag_b, names in rows:
+            if section == 0:
+                columns.append({
+                    "name": name,
+                    "data_type": text_a,
+                    "nullable": flag_a,
+                    "default": text_b,
+                    "primary_key": flag_b,
+                })
+            elif section == 1:
+                indexes.append({
+                    "name": name,
+                    "columns": names,
+                    "unique": flag_a,
+                })
+            else:
+                foreign_keys.append({
+                    "name": name,
+                    "column": text_a,
+                    "references_table": text_b,
+                    "references_column": text_c,
+                })
+
+        if not columns:
+            return {
+                "success": False,
+                "error": {
+                    "code": "DB_NOT_FOUND",
+                    "message": f"Table '{table_name}' not found in schema '{schema}'",
+                },
+            }
 
         return {
             "success": True,
@@ -245,18 +257,43 @@ def _describe_postgresql_table(host, port, database, username, password, table_n
             conn.close()
 
 
+_MYSQL_COLUMNS_SQL = """
+    SELECT
+        COLUMN_NAME,
+        DATA_TYPE,
+        IS_NULLABLE = 'YES' as nullable,
+        COLUMN_DEFAULT,
+        COLUMN_KEY = 'PRI' as primary_key
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+    ORDER BY ORDINAL_POSITION
+"""
+
+_MYSQL_INDEXES_SQL = """
+    SELECT
+        INDEX_NAME,
+        GROUP_CONCAT(COLUMN_NAME ORDER BY SEQ_IN_INDEX) as columns,
+        NOT NON_UNIQUE as is_unique
+    FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+    GROUP BY INDEX_NAME, NON_UNIQUE
+"""
+
+_MYSQL_FOREIGN_KEYS_SQL = """
+    SELECT
+        CONSTRAINT_NAME,
+        COLUMN_NAME,
+        REFERENCED_TABLE_NAME,
+        REFERENCED_COLUMN_NAME
+    FROM information_schema.KEY_COLUMN_USAGE
+    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND REFERENCED_TABLE_NAME IS NOT NULL
+"""
+
+
 def _describe_mysql_table(host, port, database, username, password, table_name):
     """Describe a MySQL table."""
-    try:
-        import mysql.connector
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "DB_IMPORT_ERROR",
-                "message": "mysql-connector-python package not installed",
-            },
-        }
+    if not _HAS_MYSQL:
+        return _ERR_NO_MYSQL
 
     conn = None
     try:
@@ -269,20 +306,8 @@ def _describe_mysql_table(host, port, database, username, password, table_name):
         )
 
         # Get columns
-        column_query = """
-            SELECT
-                COLUMN_NAME,
-                DATA_TYPE,
-                IS_NULLABLE = 'YES' as nullable,
-                COLUMN_DEFAULT,
-                COLUMN_KEY = 'PRI' as primary_key
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-            ORDER BY ORDINAL_POSITION
-        """
-
         cursor = conn.cursor()
-        cursor.execute(column_query, (database, table_name))
+        cursor.execute(_MYSQL_COLUMNS_SQL, (database, table_name))
         column_rows = cursor.fetchall()
 
         if not column_rows:
@@ -305,17 +330,7 @@ def _describe_mysql_table(host, port, database, username, password, table_name):
             })
 
         # Get indexes
-        index_query = """
-            SELECT
-                INDEX_NAME,
-                GROUP_CONCAT(COLUMN_NAME ORDER BY SEQ_IN_INDEX) as columns,
-                NOT NON_UNIQUE as is_unique
-            FROM information_schema.STATISTICS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-            GROUP BY INDEX_NAME, NON_UNIQUE
-        """
-
-        cursor.execute(index_query, (database, table_name))
+        cursor.execute(_MYSQL_INDEXES_SQL, (database, table_name))
         index_rows = cursor.fetchall()
 
         indexes = []
@@ -327,17 +342,7 @@ def _describe_mysql_table(host, port, database, username, password, table_name):
             })
 
         # Get foreign keys
-        fk_query = """
-            SELECT
-                CONSTRAINT_NAME,
-                COLUMN_NAME,
-                REFERENCED_TABLE_NAME,
-                REFERENCED_COLUMN_NAME
-            FROM information_schema.KEY_COLUMN_USAGE
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND REFERENCED_TABLE_NAME IS NOT NULL
-        """
-
-        cursor.execute(fk_query, (database, table_name))
+        cursor.execute(_MYSQL_FOREIGN_KEYS_SQL, (database, table_name))
         fk_rows = cursor.fetchall()
 
         foreign_keys = []
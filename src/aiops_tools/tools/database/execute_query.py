@@ -1,6 +1,34 @@
 """Execute read-only SQL queries."""
 
 import time
+from itertools import islice
+
+try:
+    import psycopg2
+    from psycopg2 import OperationalError, ProgrammingError
+    from psycopg2.extensions import DECIMAL, new_type, register_type
+
+    # NUMERIC columns come back as their exact text instead of Decimal
+    # objects, which the JSON serializer cannot encode; a float would drop
+    # digits beyond double precision
+    _PG_DEC2STR = new_type(DECIMAL.values, "DEC2STR", lambda value, cursor: value)
+
+    _HAS_PSYCOPG2 = True
+except ImportError:
+    _HAS_PSYCOPG2 = False
+
+try:
+    import mysql.connector
+    from mysql.connector import Error as MySQLError
+    from mysql.connector import FieldType
+
+    _MYSQL_DECIMAL_TYPES = {FieldType.DECIMAL, FieldType.NEWDECIMAL}
+
+    _HAS_MYSQL = True
+except ImportError:
+    _HAS_MYSQL = False
+
+from aiops_tools.tools.database.query_validator import validate_sql
 
 TOOL_DEFINITION = {
     "name": "db_execute_query",
@@ -70,6 +98,30 @@ TOOL_DEFINITION = {
     },
 }
 
+_REQUIRED_FIELDS = ("db_type", "host", "database", "username", "password", "query")
+
+_ERR_NO_PSYCOPG2 = {
+    "success": False,
+    "error": {
+        "code": "DB_IMPORT_ERROR",
+        "message": "psycopg2 package not installed. Run: pip install psycopg2-binary",
+    },
+}
+
+_ERR_NO_MYSQL = {
+    "success": False,
+    "error": {
+        "code": "DB_IMPORT_ERROR",
+        "message": (
+            "mysql-connector-python package not installed. "
+            "Run: pip install mysql-connector-python"
+        ),
+    },
+}
+
+_PG_CURSOR_NAME = "aiops_ro_stream"
+_PG_MAX_ITERSIZE = 1000
+
 
 def main(input_data: dict) -> dict:
     """Execute a read-only SQL query.
@@ -80,8 +132,6 @@ def main(input_data: dict) -> dict:
     Returns:
         Dictionary with success status and query results or error
     """
-    from aiops_tools.tools.database.query_validator import validate_sql
-
     # Extract parameters
     db_type = input_data.get("db_type")
     host = input_data.get("host")
@@ -94,14 +144,15 @@ def main(input_data: dict) -> dict:
     max_rows = input_data.get("max_rows", 1000)
 
     # Validate required fields
-    if not all([db_type, host, database, username, password, query]):
-        return {
-            "success": False,
-            "error": {
-                "code": "DB_INVALID_INPUT",
-                "message": "Missing required parameters: db_type, host, database, username, password, query",
-            },
-        }
+    for field in _REQUIRED_FIELDS:
+        if not input_data.get(field):
+            return {
+                "success": False,
+                "error": {
+                    "code": "DB_INVALID_INPUT",
+                    "message": f"Missing required parameter: {field}",
+                },
+            }
 
     # Validate SQL
     is_valid, error_msg = validate_sql(query)
@@ -145,17 +196,8 @@ def main(input_data: dict) -> dict:
 
 def _execute_postgresql(host, port, database, username, password, query, timeout, max_rows, start_time):
     """Execute query on PostgreSQL."""
-    try:
-        import psycopg2
-        from psycopg2 import OperationalError, ProgrammingError
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "DB_IMPORT_ERROR",
-                "message": "psycopg2 package not installed. Run: pip install psycopg2-binary",
-            },
-        }
+    if not _HAS_PSYCOPG2:
+        return _ERR_NO_PSYCOPG2
 
     conn = None
     try:
@@ -169,20 +211,31 @@ def _execute_postgresql(host, port, database, username, password, query, timeout
         )
         conn.set_session(readonly=True)
 
+        # A named (server-side) cursor streams SELECT results in itersize
+        # batches instead of buffering the whole result set client-side.
+        # PostgreSQL only allows SELECT in DECLARE CURSOR.
+        is_select = query.lstrip().split(None, 1)[0].upper() == "SELECT"
+
+        # connect_timeout only bounds the handshake; have the server cancel
+        # the statement itself once timeout elapses. SET LOCAL ends with the
+        # transaction, which is discarded when the connection is closed.
         with conn.cursor() as cursor:
+            cursor.execute("SET LOCAL statement_timeout = %s", (timeout * 1000,))
+
+        with conn.cursor(name=_PG_CURSOR_NAME if is_select else None) as cursor:
+            cursor.itersize = min(max_rows + 1, _PG_MAX_ITERSIZE)
+            register_type(_PG_DEC2STR, cursor)
             cursor.execute(query)
 
-            # Get column names
+            # Fetch rows with limit
+            rows = list(islice(cursor, max_rows + 1))
+
+            # Named cursors only populate description after the first fetch
             columns = [desc[0] for desc in cursor.description] if cursor.description else []
 
-            # Fetch rows with limit
-            rows = cursor.fetchmany(max_rows + 1)
             truncated = len(rows) > max_rows
             if truncated:
-                rows = rows[:max_rows]
-
-            # Convert to list of lists for JSON serialization
-            rows = [list(row) for row in rows]
+                del rows[max_rows:]
 
             execution_time_ms = int((time.time() - start_time) * 1000)
 
@@ -220,17 +273,8 @@ def _execute_postgresql(host, port, database, username, password, query, timeout
 
 def _execute_mysql(host, port, database, username, password, query, timeout, max_rows, start_time):
     """Execute query on MySQL."""
-    try:
-        import mysql.connector
-        from mysql.connector import Error as MySQLError
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "DB_IMPORT_ERROR",
-                "message": "mysql-connector-python package not installed. Run: pip install mysql-connector-python",
-            },
-        }
+    if not _HAS_MYSQL:
+        return _ERR_NO_MYSQL
 
     conn = None
     try:
@@ -243,7 +287,14 @@ def _execute_mysql(host, port, database, username, password, query, timeout, max
             connection_timeout=timeout,
         )
 
-        cursor = conn.cursor()
+        # Server-side execution limit for SELECTs (ignored as a comment by
+        # servers without optimizer hints)
+        stripped = query.lstrip()
+        if stripped[:6].upper() == "SELECT":
+            query = f"SELECT /*+ MAX_EXECUTION_TIME({timeout * 1000}) */{stripped[6:]}"
+
+        # Unbuffered so only the rows fetched below are read off the wire
+        cursor = conn.cursor(buffered=False)
         cursor.execute(query)
 
         # Get column names
@@ -253,10 +304,20 @@ def _execute_mysql(host, port, database, username, password, query, timeout, max
         rows = cursor.fetchmany(max_rows + 1)
         truncated = len(rows) > max_rows
         if truncated:
-            rows = rows[:max_rows]
-
-        # Convert to list of lists
-        rows = [list(row) for row in rows]
+            del rows[max_rows:]
+
+        # DECIMAL values become their exact text, as on PostgreSQL
+        decimal_idx = [
+            i
+            for i, desc in enumerate(cursor.description or ())
+            if desc[1] in _MYSQL_DECIMAL_TYPES
+        ]
+        if decimal_idx:
+            rows = [list(row) for row in rows]
+            for row in rows:
+                for i in decimal_idx:
+                    if row[i] is not None:
+                        row[i] = str(row[i])
 
         execution_time_ms = int((time.time() - start_time) * 1000)
 
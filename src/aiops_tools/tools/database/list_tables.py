@@ -1,5 +1,19 @@
 """List database tables."""
 
+try:
+    import psycopg2
+
+    _HAS_PSYCOPG2 = True
+except ImportError:
+    _HAS_PSYCOPG2 = False
+
+try:
+    import mysql.connector
+
+    _HAS_MYSQL = True
+except ImportError:
+    _HAS_MYSQL = False
+
 TOOL_DEFINITION = {
     "name": "db_list_tables",
     "display_name": "List Database Tables",
@@ -52,6 +66,27 @@ TOOL_DEFINITION = {
     },
 }
 
+_REQUIRED_FIELDS = ("db_type", "host", "database", "username", "password")
+
+_ERR_NO_PSYCOPG2 = {
+    "success": False,
+    "error": {
+        "code": "DB_IMPORT_ERROR",
+        "message": "psycopg2 package not installed",
+    },
+}
+
+_ERR_NO_MYSQL = {
+    "success": False,
+    "error": {
+        "code": "DB_IMPORT_ERROR",
+        "message": "mysql-connector-python package not installed",
+    },
+}
+
+_PG_CURSOR_NAME = "aiops_list_tables"
+_PG_ITERSIZE = 1000
+
 
 def main(input_data: dict) -> dict:
     """List tables in a database.
@@ -70,14 +105,15 @@ def main(input_data: dict) -> dict:
     password = input_data.get("password")
     schema = input_data.get("schema", "public")
 
-    if not all([db_type, host, database, username, password]):
-        return {
-            "success": False,
-            "error": {
-                "code": "DB_INVALID_INPUT",
-                "message": "Missing required parameters",
-            },
-        }
+    for field in _REQUIRED_FIELDS:
+        if not input_data.get(field):
+            return {
+                "success": False,
+                "error": {
+                    "code": "DB_INVALID_INPUT",
+                    "message": f"Missing required parameter: {field}",
+                },
+            }
 
     if port is None:
         port = 5432 if db_type == "postgresql" else 3306
@@ -105,18 +141,35 @@ def main(input_data: dict) -> dict:
         }
 
 
+# Reads pg_class directly rather than information_schema.tables: sizes and
+# stats are looked up by OID instead of by re-quoted text names. The relkind
+# and privilege filters keep the same rows information_schema.tables returns
+# (tables, partitioned tables, views and foreign tables the user can access).
+_PG_LIST_SQL = """
+    SELECT
+        c.relname,
+        c.relkind,
+        COALESCE(s.n_live_tup, 0) AS row_count,
+        COALESCE(pg_total_relation_size(c.oid), 0) AS size_bytes
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+    WHERE n.nspname = %s
+        AND c.relkind IN ('r', 'p', 'v', 'f')
+        AND (
+            pg_has_role(c.relowner, 'USAGE')
+            OR has_table_privilege(
+                c.oid, 'SELECT, INSERT, UPDATE, DELETE, TRUNCATE, REFERENCES, TRIGGER'
+            )
+        )
+    ORDER BY c.relname
+"""
+
+
 def _list_postgresql_tables(host, port, database, username, password, schema):
     """List tables in PostgreSQL."""
-    try:
-        import psycopg2
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "DB_IMPORT_ERROR",
-                "message": "psycopg2 package not installed",
-            },
-        }
+    if not _HAS_PSYCOPG2:
+        return _ERR_NO_PSYCOPG2
 
     conn = None
     try:
@@ -128,30 +181,20 @@ def _list_postgresql_tables(host, port, database, username, password, schema):
             password=password,
         )
 
-        query = """
-            SELECT
-                t.table_name,
-                t.table_type,
-                COALESCE(s.n_live_tup, 0) as row_count,
-                COALESCE(pg_total_relation_size(quote_ident(t.table_schema) || '.' || quote_ident(t.table_name)), 0) as size_bytes
-            FROM information_schema.tables t
-            LEFT JOIN pg_stat_user_tables s ON t.table_name = s.relname AND t.table_schema = s.schemaname
-            WHERE t.table_schema = %s
-            ORDER BY t.table_name
-        """
-
-        with conn.cursor() as cursor:
-            cursor.execute(query, (schema,))
-            rows = cursor.fetchall()
-
-        tables = []
-        for row in rows:
-            tables.append({
-                "name": row[0],
-                "type": "view" if row[1] == "VIEW" else "table",
-                "row_count": row[2],
-                "size_bytes": row[3],
-            })
+        # Server-side cursor: rows stream in batches instead of being
+        # buffered in full before the loop starts
+        with conn.cursor(name=_PG_CURSOR_NAME) as cursor:
+            cursor.itersize = _PG_ITERSIZE
+            cursor.execute(_PG_LIST_SQL, (schema,))
+            tables = [
+                {
+                    "name": name,
+                    "type": "view" if relkind == "v" else "table",
+                    "row_count": row_count,
+                    "size_bytes": size_bytes,
+                }
+                for name, relkind, row_count, size_bytes in cursor
+            ]
 
         return {
             "success": True,
@@ -177,16 +220,8 @@ def _list_postgresql_tables(host, port, database, username, password, schema):
 
 def _list_mysql_tables(host, port, database, username, password):
     """List tables in MySQL."""
-    try:
-        import mysql.connector
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "DB_IMPORT_ERROR",
-                "message": "mysql-connector-python package not installed",
-            },
-        }
+    if not _HAS_MYSQL:
+        return _ERR_NO_MYSQL
 
     conn = None
     try:
@@ -209,18 +244,18 @@ def _list_mysql_tables(host, port, database, username, password):
             ORDER BY TABLE_NAME
         """
 
-        cursor = conn.cursor()
+        cursor = conn.cursor(buffered=False)
         cursor.execute(query, (database,))
-        rows = cursor.fetchall()
-
-        tables = []
-        for row in rows:
-            tables.append({
-                "name": row[0],
-                "type": "view" if row[1] == "VIEW" else "table",
-                "row_count": row[2] or 0,
-                "size_bytes": row[3] or 0,
-            })
+
+        tables = [
+            {
+                "name": name,
+                "type": "view" if table_type == "VIEW" else "table",
+                "row_count": row_count or 0,
+                "size_bytes": size_bytes or 0,
+            }
+            for name, table_type, row_count, size_bytes in cursor
+        ]
 
         return {
             "success": True,
@@ -14,6 +14,13 @@ DANGEROUS_PATTERNS = [
     r"--",  # SQL comments that might hide malicious code
 ]
 
+# Patterns fused into one alternation so a query is scanned once
+_DANGEROUS_RE = re.compile("|".join(f"(?:{p})" for p in DANGEROUS_PATTERNS), re.IGNORECASE)
+
+_FIRST_TOKEN_RE = re.compile(r"\s*(\S+)")
+
+_IDENT_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)?$")
+
 
 def validate_sql(sql: str) -> tuple[bool, str | None]:
     """Validate that SQL is a read-only statement.
@@ -26,27 +33,26 @@ def validate_sql(sql: str) -> tuple[bool, str | None]:
         - (True, None) if valid
         - (False, "error message") if invalid
     """
-    if not sql or not sql.strip():
+    # First whitespace-delimited token, without building a stripped copy
+    match = _FIRST_TOKEN_RE.match(sql) if sql else None
+    if not match:
         return False, "Empty SQL query"
-
-    # Normalize whitespace and get first word
-    normalized = sql.strip()
-    first_word = normalized.split()[0].upper()
+    first_word = match.group(1).upper()
 
     # Check if statement type is allowed
     if first_word not in ALLOWED_STATEMENTS:
         return False, f"Only {', '.join(sorted(ALLOWED_STATEMENTS))} statements are allowed. Got: {first_word}"
 
     # Check for dangerous patterns
-    for pattern in DANGEROUS_PATTERNS:
-        if re.search(pattern, normalized, re.IGNORECASE):
-            return False, f"Query contains potentially dangerous pattern"
+    if _DANGEROUS_RE.search(sql):
+        return False, "Query contains potentially dangerous pattern"
 
     # Check for multiple statements (semicolon followed by another statement)
     # Allow semicolon at end, but not multiple statements
-    statements = [s.strip() for s in normalized.rstrip(";").split(";") if s.strip()]
-    if len(statements) > 1:
-        return False, "Multiple SQL statements are not allowed"
+    if ";" in sql:
+        statements = [s for s in sql.rstrip().rstrip(";").split(";") if s.strip()]
+        if len(statements) > 1:
+            return False, "Multiple SQL statements are not allowed"
 
     return True, None
 
@@ -64,6 +70,6 @@ def sanitize_identifier(identifier: str) -> str:
         ValueError: If identifier contains invalid characters
     """
     # Only allow alphanumeric, underscore, and dot (for schema.table)
-    if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)?$", identifier):
+    if not _IDENT_RE.match(identifier):
         raise ValueError(f"Invalid identifier: {identifier}")
     return identifier
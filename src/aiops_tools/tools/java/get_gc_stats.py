@@ -1,5 +1,19 @@
 """Get JVM garbage collection statistics via JMX/Jolokia."""
 
+from datetime import UTC, datetime
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import httpx
+
+    _HAS_HTTPX = True
+except ImportError:
+    _HAS_HTTPX = False
+
 TOOL_DEFINITION = {
     "name": "java_get_gc_stats",
     "display_name": "Get GC Statistics",
@@ -68,11 +82,42 @@ def main(input_data: dict) -> dict:
         }
 
 
+_GC_SEARCH = "java.lang:type=GarbageCollector,*"
+_POOL_SEARCH = "java.lang:type=MemoryPool,*"
+
+
+# Only the attributes the output uses are requested, which keeps Jolokia from
+# serializing every attribute of each MBean
+_GC_ATTRIBUTES = ["CollectionCount", "CollectionTime", "MemoryPoolNames"]
+_POOL_ATTRIBUTES = ["Type", "Usage", "PeakUsage"]
+
+
+def _read_mbeans(
+    client, base_url: str, reads: list[tuple[str, list[str]]]
+) -> list[tuple[str, dict]]:
+    """Read (mbean, attributes) pairs in one Jolokia bulk request, skipping failed reads."""
+    if not reads:
+        return []
+    response = client.post(
+        base_url,
+        json=[
+            {"type": "read", "mbean": mbean, "attribute": attributes}
+            for mbean, attributes in reads
+        ],
+    )
+    if response.status_code != 200:
+        return []
+    # Bulk responses come back in request order, each with its own status
+    return [
+        (mbean, result.get("value", {}))
+        for (mbean, _), result in zip(reads, _json_loads(response.content), strict=True)
+        if result.get("status") == 200
+    ]
+
+
 def _get_gc_via_jolokia(base_url: str, username: str | None, password: str | None) -> dict:
     """Get GC stats via Jolokia REST API."""
-    try:
-        import httpx
-    except ImportError:
+    if not _HAS_HTTPX:
         return {
             "success": False,
             "error": {
@@ -81,8 +126,6 @@ def _get_gc_via_jolokia(base_url: str, username: str | None, password: str | Non
             },
         }
 
-    from datetime import datetime, timezone
-
     base_url = base_url.rstrip("/")
     if not base_url.endswith("/jolokia"):
         if "/jolokia" not in base_url:
@@ -92,10 +135,22 @@ def _get_gc_via_jolokia(base_url: str, username: str | None, password: str | Non
     if username and password:
         auth = (username, password)
 
+    # One client per call so the requests below share keep-alive connections
+    client = httpx.Client(
+        auth=auth,
+        timeout=httpx.Timeout(30, connect=5),
+        limits=httpx.Limits(max_keepalive_connections=10),
+    )
+
     try:
-        # Search for GC MBeans
-        search_url = f"{base_url}/search/java.lang:type=GarbageCollector,*"
-        search_response = httpx.get(search_url, auth=auth, timeout=30)
+        # Search for GC and memory pool MBeans in one bulk request
+        search_response = client.post(
+            base_url,
+            json=[
+                {"type": "search", "mbean": _GC_SEARCH},
+                {"type": "search", "mbean": _POOL_SEARCH},
+            ],
+        )
 
         if search_response.status_code == 401:
             return {
@@ -106,67 +161,62 @@ def _get_gc_via_jolokia(base_url: str, username: str | None, password: str | Non
                 },
             }
 
-        search_data = search_response.json()
-        gc_mbeans = search_data.get("value", [])
+        gc_search, pool_search = _json_loads(search_response.content)
+        gc_mbeans = gc_search.get("value", [])
+        pool_mbeans = pool_search.get("value", []) if pool_search.get("status") == 200 else []
+
+        # Read every collector and pool in a second bulk request
+        results = _read_mbeans(
+            client,
+            base_url,
+            [(mbean, _GC_ATTRIBUTES) for mbean in gc_mbeans]
+            + [(mbean, _POOL_ATTRIBUTES) for mbean in pool_mbeans],
+        )
+        gc_names = set(gc_mbeans)
 
         collectors = []
-        for mbean in gc_mbeans:
-            # Get GC attributes
-            # URL encode the mbean name (replace special chars)
-            encoded_mbean = mbean.replace(":", "%3A").replace(",", "%2C").replace("=", "%3D")
-            gc_url = f"{base_url}/read/{encoded_mbean}"
-            gc_response = httpx.get(gc_url, auth=auth, timeout=30)
-
-            if gc_response.status_code == 200:
-                gc_data = gc_response.json().get("value", {})
-
-                # Extract collector name from MBean name
-                name = "Unknown"
-                if "name=" in mbean:
-                    name = mbean.split("name=")[1].split(",")[0]
-
-                collectors.append({
-                    "name": name,
-                    "collection_count": gc_data.get("CollectionCount", 0),
-                    "collection_time_ms": gc_data.get("CollectionTime", 0),
-                    "memory_pools": gc_data.get("MemoryPoolNames", []),
-                })
-
-        # Get memory pools
-        pool_search_url = f"{base_url}/search/java.lang:type=MemoryPool,*"
-        pool_response = httpx.get(pool_search_url, auth=auth, timeout=30)
-        pool_mbeans = pool_response.json().get("value", []) if pool_response.status_code == 200 else []
+        for mbean, gc_data in results:
+            if mbean not in gc_names:
+                continue
+
+            # Extract collector name from MBean name
+            name = "Unknown"
+            if "name=" in mbean:
+                name = mbean.split("name=")[1].split(",")[0]
+
+            collectors.append({
+                "name": name,
+                "collection_count": gc_data.get("CollectionCount", 0),
+                "collection_time_ms": gc_data.get("CollectionTime", 0),
+                "memory_pools": gc_data.get("MemoryPoolNames", []),
+            })
 
         memory_pools = []
-        for mbean in pool_mbeans:
-            encoded_mbean = mbean.replace(":", "%3A").replace(",", "%2C").replace("=", "%3D")
-            pool_url = f"{base_url}/read/{encoded_mbean}"
-            pool_data_response = httpx.get(pool_url, auth=auth, timeout=30)
-
-            if pool_data_response.status_code == 200:
-                pool_data = pool_data_response.json().get("value", {})
+        for mbean, pool_data in results:
+            if mbean in gc_names:
+                continue
 
-                name = "Unknown"
-                if "name=" in mbean:
-                    name = mbean.split("name=")[1].split(",")[0]
+            name = "Unknown"
+            if "name=" in mbean:
+                name = mbean.split("name=")[1].split(",")[0]
 
-                usage = pool_data.get("Usage", {})
-                peak = pool_data.get("PeakUsage", {})
+            usage = pool_data.get("Usage", {})
+            peak = pool_data.get("PeakUsage", {})
 
-                memory_pools.append({
-                    "name": name,
-                    "type": pool_data.get("Type", "UNKNOWN"),
-                    "used_bytes": usage.get("used", 0),
-                    "max_bytes": usage.get("max", -1),
-                    "peak_used_bytes": peak.get("used", 0),
-                })
+            memory_pools.append({
+                "name": name,
+                "type": pool_data.get("Type", "UNKNOWN"),
+                "used_bytes": usage.get("used", 0),
+                "max_bytes": usage.get("max", -1),
+                "peak_used_bytes": peak.get("used", 0),
+            })
 
         return {
             "success": True,
             "data": {
                 "collectors": collectors,
                 "memory_pools": memory_pools,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": datetime.now(UTC).isoformat(),
             },
         }
 
@@ -186,3 +236,5 @@ def _get_gc_via_jolokia(base_url: str, username: str | None, password: str | Non
                 "message": str(e),
             },
         }
+    finally:
+        client.close()
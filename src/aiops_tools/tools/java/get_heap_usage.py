@@ -1,5 +1,19 @@
 """Get JVM heap memory usage via JMX/Jolokia."""
 
+from datetime import UTC, datetime
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import httpx
+
+    _HAS_HTTPX = True
+except ImportError:
+    _HAS_HTTPX = False
+
 TOOL_DEFINITION = {
     "name": "java_get_heap_usage",
     "display_name": "Get JVM Heap Usage",
@@ -65,8 +79,6 @@ def main(input_data: dict) -> dict:
     Returns:
         Dictionary with success status and memory data or error
     """
-    from datetime import datetime, timezone
-
     jmx_url = input_data.get("jmx_url")
     username = input_data.get("username")
     password = input_data.get("password")
@@ -93,11 +105,15 @@ def main(input_data: dict) -> dict:
         }
 
 
+_MEMORY_READS = [
+    {"type": "read", "mbean": "java.lang:type=Memory", "attribute": "HeapMemoryUsage"},
+    {"type": "read", "mbean": "java.lang:type=Memory", "attribute": "NonHeapMemoryUsage"},
+]
+
+
 def _get_heap_via_jolokia(base_url: str, username: str | None, password: str | None) -> dict:
     """Get heap usage via Jolokia REST API."""
-    try:
-        import httpx
-    except ImportError:
+    if not _HAS_HTTPX:
         return {
             "success": False,
             "error": {
@@ -106,8 +122,6 @@ def _get_heap_via_jolokia(base_url: str, username: str | None, password: str | N
             },
         }
 
-    from datetime import datetime, timezone
-
     # Normalize URL
     base_url = base_url.rstrip("/")
     if not base_url.endswith("/jolokia"):
@@ -119,10 +133,16 @@ def _get_heap_via_jolokia(base_url: str, username: str | None, password: str | N
     if username and password:
         auth = (username, password)
 
+    # One client per call so the requests below share keep-alive connections
+    client = httpx.Client(
+        auth=auth,
+        timeout=httpx.Timeout(30, connect=5),
+        limits=httpx.Limits(max_keepalive_connections=10),
+    )
+
     try:
-        # Get heap memory
-        heap_url = f"{base_url}/read/java.lang:type=Memory/HeapMemoryUsage"
-        response = httpx.get(heap_url, auth=auth, timeout=30)
+        # Heap and non-heap usage in one bulk request
+        response = client.post(base_url, json=_MEMORY_READS)
 
         if response.status_code == 401:
             return {
@@ -142,7 +162,7 @@ def _get_heap_via_jolokia(base_url: str, username: str | None, password: str | N
                 },
             }
 
-        heap_data = response.json()
+        heap_data, non_heap_data = _json_loads(response.content)
         if heap_data.get("status") != 200:
             return {
                 "success": False,
@@ -154,11 +174,9 @@ def _get_heap_via_jolokia(base_url: str, username: str | None, password: str | N
 
         heap_value = heap_data.get("value", {})
 
-        # Get non-heap memory
-        non_heap_url = f"{base_url}/read/java.lang:type=Memory/NonHeapMemoryUsage"
-        non_heap_response = httpx.get(non_heap_url, auth=auth, timeout=30)
-        non_heap_data = non_heap_response.json() if non_heap_response.status_code == 200 else {}
-        non_heap_value = non_heap_data.get("value", {})
+        non_heap_value = {}
+        if non_heap_data.get("status") == 200:
+            non_heap_value = non_heap_data.get("value", {})
 
         # Calculate heap percentage
         max_heap = heap_value.get("max", 0)
@@ -180,7 +198,7 @@ def _get_heap_via_jolokia(base_url: str, username: str | None, password: str | N
                     "committed_bytes": non_heap_value.get("committed", 0),
                     "max_bytes": non_heap_value.get("max", -1),
                 },
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": datetime.now(UTC).isoformat(),
             },
         }
 
@@ -200,3 +218,5 @@ def _get_heap_via_jolokia(base_url: str, username: str | None, password: str | N
                 "message": str(e),
             },
         }
+    finally:
+        client.close()
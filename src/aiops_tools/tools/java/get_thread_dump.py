@@ -1,5 +1,19 @@
 """Get JVM thread dump via JMX/Jolokia."""
 
+from datetime import UTC, datetime
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import httpx
+
+    _HAS_HTTPX = True
+except ImportError:
+    _HAS_HTTPX = False
+
 TOOL_DEFINITION = {
     "name": "java_get_thread_dump",
     "display_name": "Get Thread Dump",
@@ -34,6 +48,10 @@ TOOL_DEFINITION = {
                     "peak_count": {"type": "integer"},
                     "threads": {"type": "array"},
                     "deadlocked_threads": {"type": "array"},
+                    "deadlock_check": {
+                        "type": "string",
+                        "enum": ["ok", "failed", "timeout", "skipped"],
+                    },
                     "timestamp": {"type": "string"},
                 },
             },
@@ -77,11 +95,74 @@ def main(input_data: dict) -> dict:
         }
 
 
+_THREAD_MBEAN = "java.lang:type=Threading"
+
+# Only the first threads are detailed to bound the response size
+_MAX_THREADS = 100
+
+_SUMMARY_REQUESTS = [
+    {
+        "type": "read",
+        "mbean": _THREAD_MBEAN,
+        "attribute": ["ThreadCount", "DaemonThreadCount", "PeakThreadCount"],
+    },
+    {"type": "read", "mbean": _THREAD_MBEAN, "attribute": "AllThreadIds"},
+]
+
+# findDeadlockedThreads() walks every monitor and is the call most likely to
+# hang on a wedged JVM, so it runs on its own with a short timeout
+_DEADLOCK_REQUEST = {
+    "type": "exec",
+    "mbean": _THREAD_MBEAN,
+    "operation": "findDeadlockedThreads()",
+}
+_DEADLOCK_TIMEOUT = 5
+
+# className.methodName(fileName:lineNumber), as in a jstack frame
+_FRAME_FORMAT = "%s.%s(%s:%s)"
+
+
+def _format_thread(info_data: dict, thread_id: int) -> dict:
+    """Build the output record for one ThreadInfo."""
+    stack_trace = [
+        _FRAME_FORMAT
+        % (
+            frame.get("className", ""),
+            frame.get("methodName", ""),
+            frame.get("fileName", ""),
+            frame.get("lineNumber", -1),
+        )
+        for frame in info_data.get("stackTrace") or ()
+    ]
+
+    return {
+        "name": info_data.get("threadName", "Unknown"),
+        "id": info_data.get("threadId", thread_id),
+        "state": info_data.get("threadState", "UNKNOWN"),
+        "daemon": info_data.get("daemon", False),
+        "priority": info_data.get("priority", 5),
+        "stack_trace": stack_trace,
+        "locked_monitors": [],
+        "locked_synchronizers": [],
+    }
+
+
+def _check_deadlocks(client, base_url: str) -> tuple[list, str]:
+    """Run findDeadlockedThreads(); returns (thread IDs, deadlock_check status)."""
+    try:
+        response = client.post(base_url, json=_DEADLOCK_REQUEST, timeout=_DEADLOCK_TIMEOUT)
+    except httpx.TimeoutException:
+        return [], "timeout"
+
+    result = _json_loads(response.content) if response.status_code == 200 else {}
+    if result.get("status") != 200:
+        return [], "failed"
+    return list(result.get("value") or ()), "ok"
+
+
 def _get_threads_via_jolokia(base_url: str, username: str | None, password: str | None, max_depth: int) -> dict:
     """Get thread dump via Jolokia REST API."""
-    try:
-        import httpx
-    except ImportError:
+    if not _HAS_HTTPX:
         return {
             "success": False,
             "error": {
@@ -90,8 +171,6 @@ def _get_threads_via_jolokia(base_url: str, username: str | None, password: str
             },
         }
 
-    from datetime import datetime, timezone
-
     base_url = base_url.rstrip("/")
     if not base_url.endswith("/jolokia"):
         if "/jolokia" not in base_url:
@@ -101,13 +180,18 @@ def _get_threads_via_jolokia(base_url: str, username: str | None, password: str
     if username and password:
         auth = (username, password)
 
+    # One client per call so the requests below share keep-alive connections
+    client = httpx.Client(
+        auth=auth,
+        timeout=httpx.Timeout(30, connect=5),
+        limits=httpx.Limits(max_keepalive_connections=10),
+    )
+
     try:
-        # Get thread count info
-        thread_mbean = "java.lang:type=Threading"
-        count_url = f"{base_url}/read/{thread_mbean}/ThreadCount,DaemonThreadCount,PeakThreadCount"
-        count_response = httpx.get(count_url, auth=auth, timeout=30)
+        # Counts and thread IDs in one bulk request
+        summary_response = client.post(base_url, json=_SUMMARY_REQUESTS)
 
-        if count_response.status_code == 401:
+        if summary_response.status_code == 401:
             return {
                 "success": False,
                 "error": {
@@ -116,58 +200,45 @@ def _get_threads_via_jolokia(base_url: str, username: str | None, password: str
                 },
             }
 
-        count_data = count_response.json().get("value", {})
+        count_result, ids_result = _json_loads(summary_response.content)
+        count_data = count_result.get("value", {}) if count_result.get("status") == 200 else {}
+        thread_ids = ids_result.get("value", []) if ids_result.get("status") == 200 else []
 
-        # Get all thread IDs
-        thread_ids_url = f"{base_url}/read/{thread_mbean}/AllThreadIds"
-        ids_response = httpx.get(thread_ids_url, auth=auth, timeout=30)
-        thread_ids = ids_response.json().get("value", [])
+        # Nothing to detail or check for deadlocks
+        if not thread_ids:
+            return {
+                "success": True,
+                "data": {
+                    "thread_count": count_data.get("ThreadCount", 0),
+                    "daemon_count": count_data.get("DaemonThreadCount", 0),
+                    "peak_count": count_data.get("PeakThreadCount", 0),
+                    "threads": [],
+                    "deadlocked_threads": [],
+                    "deadlock_check": "skipped",
+                    "timestamp": datetime.now(UTC).isoformat(),
+                },
+            }
 
-        # Get thread info for all threads (using exec operation)
-        # Jolokia exec format: /exec/mbean/operation/arg1/arg2...
+        # Thread info for up to _MAX_THREADS threads in a single exec; the
+        # server truncates each stack trace to max_depth frames
+        thread_ids = thread_ids[:_MAX_THREADS]
         threads = []
+        info_request = {
+            "type": "exec",
+            "mbean": _THREAD_MBEAN,
+            "operation": "getThreadInfo([J,int)",
+            "arguments": [thread_ids, max_depth],
+        }
+        info_response = client.post(base_url, json=info_request)
+        info_result = _json_loads(info_response.content) if info_response.status_code == 200 else {}
+        if info_result.get("status") == 200:
+            # One entry per requested ID, null for threads that have exited
+            for thread_id, info_data in zip(thread_ids, info_result["value"], strict=True):
+                if info_data:
+                    threads.append(_format_thread(info_data, thread_id))
 
-        # Get thread info in batches to avoid URL length issues
-        for thread_id in thread_ids[:100]:  # Limit to first 100 threads
-            try:
-                # Get basic thread info
-                info_url = f"{base_url}/exec/{thread_mbean}/getThreadInfo(long)/{thread_id}"
-                info_response = httpx.get(info_url, auth=auth, timeout=10)
-                if info_response.status_code == 200:
-                    info_data = info_response.json().get("value", {})
-                    if info_data:
-                        stack_trace = []
-                        if info_data.get("stackTrace"):
-                            for frame in info_data["stackTrace"][:max_depth]:
-                                class_name = frame.get("className", "")
-                                method_name = frame.get("methodName", "")
-                                line_number = frame.get("lineNumber", -1)
-                                file_name = frame.get("fileName", "")
-                                stack_trace.append(f"{class_name}.{method_name}({file_name}:{line_number})")
-
-                        threads.append({
-                            "name": info_data.get("threadName", "Unknown"),
-                            "id": info_data.get("threadId", thread_id),
-                            "state": info_data.get("threadState", "UNKNOWN"),
-                            "daemon": info_data.get("daemon", False),
-                            "priority": info_data.get("priority", 5),
-                            "stack_trace": stack_trace,
-                            "locked_monitors": [],
-                            "locked_synchronizers": [],
-                        })
-            except Exception:
-                continue
-
-        # Check for deadlocked threads
-        deadlocked = []
-        try:
-            deadlock_url = f"{base_url}/exec/{thread_mbean}/findDeadlockedThreads()"
-            deadlock_response = httpx.get(deadlock_url, auth=auth, timeout=10)
-            deadlock_data = deadlock_response.json().get("value")
-            if deadlock_data:
-                deadlocked = list(deadlock_data)
-        except Exception:
-            pass
+        # A timed-out deadlock check still returns the thread data gathered so far
+        deadlocked, deadlock_check = _check_deadlocks(client, base_url)
 
         return {
             "success": True,
@@ -177,7 +248,8 @@ def _get_threads_via_jolokia(base_url: str, username: str | None, password: str
                 "peak_count": count_data.get("PeakThreadCount", 0),
                 "threads": threads,
                 "deadlocked_threads": deadlocked,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "deadlock_check": deadlock_check,
+                "timestamp": datetime.now(UTC).isoformat(),
             },
         }
 
@@ -197,3 +269,5 @@ def _get_threads_via_jolokia(base_url: str, username: str | None, password: str
                 "message": str(e),
             },
         }
+    finally:
+        client.close()
@@ -1,5 +1,17 @@
 """List available MBeans via JMX/Jolokia."""
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import httpx
+
+    _HAS_HTTPX = True
+except ImportError:
+    _HAS_HTTPX = False
+
 TOOL_DEFINITION = {
     "name": "java_list_mbeans",
     "display_name": "List MBeans",
@@ -78,12 +90,19 @@ def main(input_data: dict) -> dict:
         }
 
 
+def _extract_type(properties: str) -> str | None:
+    """Return the value of the ``type`` key in an ObjectName's key property list."""
+    for prop in properties.split(","):
+        key, _, value = prop.partition("=")
+        if key == "type":
+            return value
+    return None
+
+
 def _list_mbeans_via_jolokia(base_url: str, username: str | None, password: str | None,
                               domain: str | None, pattern: str | None) -> dict:
     """List MBeans via Jolokia REST API."""
-    try:
-        import httpx
-    except ImportError:
+    if not _HAS_HTTPX:
         return {
             "success": False,
             "error": {
@@ -101,6 +120,13 @@ def _list_mbeans_via_jolokia(base_url: str, username: str | None, password: str
     if username and password:
         auth = (username, password)
 
+    # One client per call so the requests below share keep-alive connections
+    client = httpx.Client(
+        auth=auth,
+        timeout=httpx.Timeout(30, connect=5),
+        limits=httpx.Limits(max_keepalive_connections=10),
+    )
+
     try:
         # Build search pattern
         if pattern:
@@ -112,7 +138,7 @@ def _list_mbeans_via_jolokia(base_url: str, username: str | None, password: str
 
         # Search for MBeans
         search_url = f"{base_url}/search/{search_pattern}"
-        search_response = httpx.get(search_url, auth=auth, timeout=30)
+        search_response = client.get(search_url)
 
         if search_response.status_code == 401:
             return {
@@ -132,38 +158,32 @@ def _list_mbeans_via_jolokia(base_url: str, username: str | None, password: str
                 },
             }
 
-        search_data = search_response.json()
+        search_data = _json_loads(search_response.content)
         mbean_names = search_data.get("value", [])
 
-        # Extract unique domains
-        domains = set()
-        mbeans = []
-
-        for mbean_name in mbean_names[:200]:  # Limit to 200 MBeans
-            # Parse domain from mbean name (format: domain:key=value,...)
-            if ":" in mbean_name:
-                mbean_domain = mbean_name.split(":")[0]
-                domains.add(mbean_domain)
-
-                # Extract type if present
-                mbean_type = None
-                if "type=" in mbean_name:
-                    type_part = mbean_name.split("type=")[1]
-                    mbean_type = type_part.split(",")[0]
-
-                mbeans.append({
-                    "object_name": mbean_name,
-                    "domain": mbean_domain,
-                    "type": mbean_type,
-                    "attributes": [],  # Could fetch with another call, but expensive
-                    "operations": [],
-                })
+        # Object names have the form domain:key=value,...; names without a
+        # domain separator are skipped
+        partitioned = [
+            (mbean_name, *mbean_name.partition(":"))
+            for mbean_name in mbean_names[:200]  # Limit to 200 MBeans
+        ]
+        mbeans = [
+            {
+                "object_name": mbean_name,
+                "domain": mbean_domain,
+                "type": _extract_type(properties),
+                "attributes": [],  # Could fetch with another call, but expensive
+                "operations": [],
+            }
+            for mbean_name, mbean_domain, sep, properties in partitioned
+            if sep
+        ]
 
         return {
             "success": True,
             "data": {
                 "total_count": len(mbean_names),
-                "domains": sorted(list(domains)),
+                "domains": sorted({mbean["domain"] for mbean in mbeans}),
                 "mbeans": mbeans,
             },
         }
@@ -184,3 +204,5 @@ def _list_mbeans_via_jolokia(base_url: str, username: str | None, password: str
                 "message": str(e),
             },
         }
+    finally:
+        client.close()
@@ -1,6 +1,21 @@
 """Describe a Kubernetes pod with detailed information."""
 
-from datetime import datetime, timezone
+import time
+from datetime import datetime
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    from kubernetes import client, config
+    from kubernetes.client.rest import ApiException
+    from urllib3.util.retry import Retry
+
+    _HAS_K8S = True
+except ImportError:
+    _HAS_K8S = False
 
 TOOL_DEFINITION = {
     "name": "k8s_describe_pod",
@@ -44,19 +59,99 @@ TOOL_DEFINITION = {
 }
 
 
-def _format_age(timestamp: datetime | None) -> str:
-    """Format timestamp as age string."""
+# Only the most recent events are reported
+_MAX_EVENTS = 10
+
+# Concurrent requests on one ApiClient share this many keep-alive connections
+_POOL_MAXSIZE = 20
+
+# Transient apiserver errors are retried with backoff; urllib3 only retries
+# idempotent methods, so patches are never replayed
+_RETRIES = 3
+_RETRY_BACKOFF = 0.2
+
+# Every API call passes this as _request_timeout (connect, read) so a stalled
+# apiserver fails the call instead of hanging it until the executor timeout
+_REQUEST_TIMEOUT = (3, 30)
+
+
+def _error_response(code: str, message: str) -> dict:
+    """Build the standard tool error envelope."""
+    return {"success": False, "error": {"code": code, "message": message}}
+
+
+_ERR_NO_K8S = _error_response(
+    "K8S_IMPORT_ERROR", "kubernetes package not installed. Run: pip install kubernetes"
+)
+
+
+def _load_api_client(kubeconfig: str | None, context: str | None):
+    """Load the Kubernetes configuration and build an ApiClient on a copy of it.
+
+    The copy gets a larger connection pool and retries on 5xx; after the last
+    retry the response is returned (raise_on_status is off) so the apiserver's
+    status surfaces as an ApiException.
+
+    Returns:
+        (api_client, None), or (None, error envelope) when the configuration
+        cannot be loaded
+    """
+    try:
+        if kubeconfig:
+            config.load_kube_config(config_file=kubeconfig, context=context)
+        else:
+            try:
+                config.load_incluster_config()
+            except config.ConfigException:
+                config.load_kube_config(context=context)
+    except Exception as e:
+        return None, _error_response(
+            "K8S_CONFIG_ERROR", f"Failed to load Kubernetes configuration: {e}"
+        )
+
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = _POOL_MAXSIZE
+    configuration.retries = Retry(
+        total=_RETRIES,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    return client.ApiClient(configuration), None
+
+
+def _event_time(event: dict) -> str:
+    """Return an event's most recent RFC 3339 timestamp, or "" when it has none."""
+    return (
+        event.get("lastTimestamp") or event.get("firstTimestamp") or event.get("eventTime") or ""
+    )
+
+
+def _format_age(timestamp: str, now_ts: float) -> str:
+    """Format an RFC 3339 timestamp as age string relative to now_ts (epoch seconds)."""
     if not timestamp:
         return "N/A"
-    now = datetime.now(timezone.utc)
-    delta = now - timestamp
-    if delta.days > 0:
-        return f"{delta.days}d ago"
-    hours = delta.seconds // 3600
-    if hours > 0:
+    seconds = int(now_ts - datetime.fromisoformat(timestamp).timestamp())
+    days, rem = divmod(max(seconds, 0), 86400)
+    if days:
+        return f"{days}d ago"
+    hours, rem = divmod(rem, 3600)
+    if hours:
         return f"{hours}h ago"
-    minutes = (delta.seconds % 3600) // 60
-    return f"{minutes}m ago"
+    return f"{rem // 60}m ago"
+
+
+def _container_state(state: dict) -> str:
+    """Summarize a containerStatuses[].state as Running, Waiting (reason) or Terminated (reason)."""
+    if "running" in state:
+        return "Running"
+    waiting = state.get("waiting")
+    if waiting is not None:
+        return f"Waiting ({waiting.get('reason')})"
+    terminated = state.get("terminated")
+    if terminated is not None:
+        return f"Terminated ({terminated.get('reason')})"
+    return "Unknown"
 
 
 def main(input_data: dict) -> dict:
@@ -68,122 +163,103 @@ def main(input_data: dict) -> dict:
     Returns:
         Dictionary with success status and pod details or error
     """
-    try:
-        from kubernetes import client, config
-        from kubernetes.client.rest import ApiException
+    if not _HAS_K8S:
+        return _ERR_NO_K8S
 
+    try:
         pod_name = input_data.get("pod_name")
         if not pod_name:
-            return {
-                "success": False,
-                "error": {
-                    "code": "K8S_INVALID_INPUT",
-                    "message": "pod_name is required",
-                },
-            }
+            return _error_response("K8S_INVALID_INPUT", "pod_name is required")
 
         namespace = input_data.get("namespace", "default")
         kubeconfig = input_data.get("kubeconfig")
         context = input_data.get("context")
 
-        # Load kubernetes configuration
-        try:
-            if kubeconfig:
-                config.load_kube_config(config_file=kubeconfig, context=context)
-            else:
-                try:
-                    config.load_incluster_config()
-                except config.ConfigException:
-                    config.load_kube_config(context=context)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": {
-                    "code": "K8S_CONFIG_ERROR",
-                    "message": f"Failed to load Kubernetes configuration: {e}",
-                },
-            }
+        api_client, error = _load_api_client(kubeconfig, context)
+        if error:
+            return error
+        v1 = client.CoreV1Api(api_client)
 
-        v1 = client.CoreV1Api()
+        # Events are fetched on the API client's worker pool while the pod is read.
+        # resource_version="0" lets the apiserver answer from its watch cache
+        # instead of a quorum read from etcd; slightly stale events are fine here.
+        field_selector = f"involvedObject.name={pod_name},involvedObject.namespace={namespace}"
+        events_request = v1.list_namespaced_event(
+            namespace,
+            field_selector=field_selector,
+            resource_version="0",
+            async_req=True,
+            _preload_content=False,
+            _request_timeout=_REQUEST_TIMEOUT,
+        )
 
-        # Get pod details
+        # Get pod details as raw JSON; building the generated model objects for
+        # a full Pod costs far more than the handful of fields used here
         try:
-            pod = v1.read_namespaced_pod(pod_name, namespace)
+            response = v1.read_namespaced_pod(
+                pod_name, namespace, _preload_content=False, _request_timeout=_REQUEST_TIMEOUT
+            )
+            pod = _json_loads(response.data)
         except ApiException as e:
             if e.status == 404:
-                return {
-                    "success": False,
-                    "error": {
-                        "code": "K8S_NOT_FOUND",
-                        "message": f"Pod '{pod_name}' not found in namespace '{namespace}'",
-                    },
-                }
+                return _error_response(
+                    "K8S_NOT_FOUND",
+                    f"Pod '{pod_name}' not found in namespace '{namespace}'",
+                )
             raise
 
-        # Get pod events
+        # Get pod events. List order is not chronological, so the newest are
+        # picked by timestamp rather than by position
         events = []
         try:
-            field_selector = f"involvedObject.name={pod_name},involvedObject.namespace={namespace}"
-            event_list = v1.list_namespaced_event(namespace, field_selector=field_selector)
-            for event in event_list.items[-10:]:  # Last 10 events
+            event_items = _json_loads(events_request.get().data).get("items") or ()
+            now_ts = time.time()
+            for event in sorted(event_items, key=_event_time)[-_MAX_EVENTS:]:
+                # A timestamp that does not parse only costs that event its age
+                try:
+                    age = _format_age(_event_time(event), now_ts)
+                except ValueError:
+                    age = "N/A"
                 events.append({
-                    "type": event.type,
-                    "reason": event.reason,
-                    "message": event.message,
-                    "age": _format_age(event.last_timestamp or event.first_timestamp),
+                    "type": event.get("type"),
+                    "reason": event.get("reason"),
+                    "message": event.get("message"),
+                    "age": age,
                 })
         except Exception:
             pass  # Events are optional
 
+        metadata = pod["metadata"]
+        spec = pod.get("spec") or {}
+        status = pod.get("status") or {}
+
         # Build container info
-        containers = []
-        if pod.status.container_statuses:
-            for cs in pod.status.container_statuses:
-                state = "Unknown"
-                if cs.state.running:
-                    state = "Running"
-                elif cs.state.waiting:
-                    state = f"Waiting ({cs.state.waiting.reason})"
-                elif cs.state.terminated:
-                    state = f"Terminated ({cs.state.terminated.reason})"
-
-                containers.append({
-                    "name": cs.name,
-                    "image": cs.image,
-                    "state": state,
-                    "ready": cs.ready,
-                    "restart_count": cs.restart_count,
-                })
+        containers = [
+            {
+                "name": cs.get("name"),
+                "image": cs.get("image"),
+                "state": _container_state(cs.get("state") or {}),
+                "ready": cs.get("ready"),
+                "restart_count": cs.get("restartCount"),
+            }
+            for cs in status.get("containerStatuses") or ()
+        ]
 
         return {
             "success": True,
             "data": {
-                "name": pod.metadata.name,
-                "namespace": pod.metadata.namespace,
-                "status": pod.status.phase,
-                "node": pod.spec.node_name or "N/A",
-                "ip": pod.status.pod_ip or "N/A",
-                "host_ip": pod.status.host_ip or "N/A",
-                "start_time": pod.status.start_time.isoformat() if pod.status.start_time else None,
-                "labels": dict(pod.metadata.labels) if pod.metadata.labels else {},
+                "name": metadata.get("name"),
+                "namespace": metadata.get("namespace"),
+                "status": status.get("phase"),
+                "node": spec.get("nodeName") or "N/A",
+                "ip": status.get("podIP") or "N/A",
+                "host_ip": status.get("hostIP") or "N/A",
+                "start_time": status.get("startTime"),
+                "labels": metadata.get("labels") or {},
                 "containers": containers,
                 "events": events,
             },
         }
 
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "K8S_IMPORT_ERROR",
-                "message": "kubernetes package not installed. Run: pip install kubernetes",
-            },
-        }
     except Exception as e:
-        return {
-            "success": False,
-            "error": {
-                "code": "K8S_ERROR",
-                "message": str(e),
-            },
-        }
+        return _error_response("K8S_ERROR", str(e))
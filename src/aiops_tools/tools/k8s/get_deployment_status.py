@@ -1,5 +1,19 @@
 """Get Kubernetes deployment status."""
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    from kubernetes import client, config
+    from kubernetes.client.rest import ApiException
+    from urllib3.util.retry import Retry
+
+    _HAS_K8S = True
+except ImportError:
+    _HAS_K8S = False
+
 TOOL_DEFINITION = {
     "name": "k8s_get_deployment_status",
     "display_name": "Get Deployment Status",
@@ -47,6 +61,65 @@ TOOL_DEFINITION = {
     },
 }
 
+_DEPLOYMENT_PATH = "/apis/apps/v1/namespaces/{namespace}/deployments/{name}"
+
+# Concurrent requests on one ApiClient share this many keep-alive connections
+_POOL_MAXSIZE = 20
+
+# Transient apiserver errors are retried with backoff; urllib3 only retries
+# idempotent methods, so patches are never replayed
+_RETRIES = 3
+_RETRY_BACKOFF = 0.2
+
+# Every API call passes this as _request_timeout (connect, read) so a stalled
+# apiserver fails the call instead of hanging it until the executor timeout
+_REQUEST_TIMEOUT = (3, 30)
+
+
+def _error_response(code: str, message: str) -> dict:
+    """Build the standard tool error envelope."""
+    return {"success": False, "error": {"code": code, "message": message}}
+
+
+_ERR_NO_K8S = _error_response(
+    "K8S_IMPORT_ERROR", "kubernetes package not installed. Run: pip install kubernetes"
+)
+
+
+def _load_api_client(kubeconfig: str | None, context: str | None):
+    """Load the Kubernetes configuration and build an ApiClient on a copy of it.
+
+    The copy gets a larger connection pool and retries on 5xx; after the last
+    retry the response is returned (raise_on_status is off) so the apiserver's
+    status surfaces as an ApiException.
+
+    Returns:
+        (api_client, None), or (None, error envelope) when the configuration
+        cannot be loaded
+    """
+    try:
+        if kubeconfig:
+            config.load_kube_config(config_file=kubeconfig, context=context)
+        else:
+            try:
+                config.load_incluster_config()
+            except config.ConfigException:
+                config.load_kube_config(context=context)
+    except Exception as e:
+        return None, _error_response(
+            "K8S_CONFIG_ERROR", f"Failed to load Kubernetes configuration: {e}"
+        )
+
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = _POOL_MAXSIZE
+    configuration.retries = Retry(
+        total=_RETRIES,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    return client.ApiClient(configuration), None
+
 
 def main(input_data: dict) -> dict:
     """Get deployment status.
@@ -57,104 +130,85 @@ def main(input_data: dict) -> dict:
     Returns:
         Dictionary with success status and deployment details or error
     """
-    try:
-        from kubernetes import client, config
-        from kubernetes.client.rest import ApiException
+    if not _HAS_K8S:
+        return _ERR_NO_K8S
 
+    try:
         deployment_name = input_data.get("deployment_name")
         if not deployment_name:
-            return {
-                "success": False,
-                "error": {
-                    "code": "K8S_INVALID_INPUT",
-                    "message": "deployment_name is required",
-                },
-            }
+            return _error_response("K8S_INVALID_INPUT", "deployment_name is required")
 
         namespace = input_data.get("namespace", "default")
         kubeconfig = input_data.get("kubeconfig")
         context = input_data.get("context")
 
-        # Load kubernetes configuration
-        try:
-            if kubeconfig:
-                config.load_kube_config(config_file=kubeconfig, context=context)
-            else:
-                try:
-                    config.load_incluster_config()
-                except config.ConfigException:
-                    config.load_kube_config(context=context)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": {
-                    "code": "K8S_CONFIG_ERROR",
-                    "message": f"Failed to load Kubernetes configuration: {e}",
-                },
-            }
-
-        apps_v1 = client.AppsV1Api()
+        api_client, error = _load_api_client(kubeconfig, context)
+        if error:
+            return error
+        apps_v1 = client.AppsV1Api(api_client)
 
-        # Get deployment
+        # Get deployment as raw JSON rather than generated model objects.
+        # AppsV1Api.read_namespaced_deployment cannot pass resourceVersion, so
+        # the GET goes through the ApiClient directly; resourceVersion=0 lets
+        # the apiserver serve it from its watch cache instead of a quorum read
+        # from etcd, which is plenty fresh for status polling.
         try:
-            deployment = apps_v1.read_namespaced_deployment(deployment_name, namespace)
+            response = apps_v1.api_client.call_api(
+                _DEPLOYMENT_PATH,
+                "GET",
+                path_params={"namespace": namespace, "name": deployment_name},
+                query_params=[("resourceVersion", "0")],
+                header_params={"Accept": "application/json"},
+                auth_settings=["BearerToken"],
+                _return_http_data_only=True,
+                _preload_content=False,
+                _request_timeout=_REQUEST_TIMEOUT,
+            )
+            deployment = _json_loads(response.data)
         except ApiException as e:
             if e.status == 404:
-                return {
-                    "success": False,
-                    "error": {
-                        "code": "K8S_NOT_FOUND",
-                        "message": f"Deployment '{deployment_name}' not found in namespace '{namespace}'",
-                    },
-                }
+                return _error_response(
+                    "K8S_NOT_FOUND",
+                    f"Deployment '{deployment_name}' not found in namespace '{namespace}'",
+                )
             raise
 
+        metadata = deployment["metadata"]
+        spec = deployment.get("spec") or {}
+        status = deployment.get("status") or {}
+
         # Build conditions list
-        conditions = []
-        if deployment.status.conditions:
-            for cond in deployment.status.conditions:
-                conditions.append({
-                    "type": cond.type,
-                    "status": cond.status,
-                    "reason": cond.reason,
-                    "message": cond.message,
-                })
+        conditions = [
+            {
+                "type": cond.get("type"),
+                "status": cond.get("status"),
+                "reason": cond.get("reason"),
+                "message": cond.get("message"),
+            }
+            for cond in status.get("conditions") or ()
+        ]
 
         # Get strategy type
         strategy = "Unknown"
-        if deployment.spec.strategy:
-            strategy = deployment.spec.strategy.type
+        if spec.get("strategy"):
+            strategy = spec["strategy"].get("type")
 
         return {
             "success": True,
             "data": {
-                "name": deployment.metadata.name,
-                "namespace": deployment.metadata.namespace,
+                "name": metadata.get("name"),
+                "namespace": metadata.get("namespace"),
                 "replicas": {
-                    "desired": deployment.spec.replicas or 0,
-                    "ready": deployment.status.ready_replicas or 0,
-                    "available": deployment.status.available_replicas or 0,
-                    "updated": deployment.status.updated_replicas or 0,
+                    "desired": spec.get("replicas") or 0,
+                    "ready": status.get("readyReplicas") or 0,
+                    "available": status.get("availableReplicas") or 0,
+                    "updated": status.get("updatedReplicas") or 0,
                 },
                 "conditions": conditions,
                 "strategy": strategy,
-                "labels": dict(deployment.metadata.labels) if deployment.metadata.labels else {},
+                "labels": metadata.get("labels") or {},
             },
         }
 
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "K8S_IMPORT_ERROR",
-                "message": "kubernetes package not installed. Run: pip install kubernetes",
-            },
-        }
     except Exception as e:
-        return {
-            "success": False,
-            "error": {
-                "code": "K8S_ERROR",
-                "message": str(e),
-            },
-        }
+        return _error_response("K8S_ERROR", str(e))
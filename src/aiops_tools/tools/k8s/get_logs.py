@@ -1,5 +1,16 @@
 """Get logs from a Kubernetes pod."""
 
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from kubernetes import client, config
+    from kubernetes.client.rest import ApiException
+    from urllib3.util.retry import Retry
+
+    _HAS_K8S = True
+except ImportError:
+    _HAS_K8S = False
+
 TOOL_DEFINITION = {
     "name": "k8s_get_logs",
     "display_name": "Get Pod Logs",
@@ -14,8 +25,9 @@ TOOL_DEFINITION = {
                 "default": "default",
             },
             "pod_name": {
-                "type": "string",
-                "description": "Name of the pod to get logs from",
+                "type": ["string", "array"],
+                "items": {"type": "string"},
+                "description": "Name of the pod to get logs from, or a list of pod names",
             },
             "container": {
                 "type": "string",
@@ -26,6 +38,10 @@ TOOL_DEFINITION = {
                 "description": "Number of lines to return from end of logs",
                 "default": 100,
             },
+            "since_seconds": {
+                "type": "integer",
+                "description": "Only return logs newer than this many seconds",
+            },
             "kubeconfig": {
                 "type": "string",
                 "description": "Path to kubeconfig file",
@@ -48,118 +64,201 @@ TOOL_DEFINITION = {
                     "container": {"type": "string"},
                     "logs": {"type": "string"},
                     "line_count": {"type": "integer"},
+                    "pods": {
+                        "type": "array",
+                        "description": "Per-pod results when pod_name is a list",
+                    },
                 },
             },
         },
     },
 }
 
+# Concurrent requests on one ApiClient share this many keep-alive connections
+_POOL_MAXSIZE = 20
+
+# Transient apiserver errors are retried with backoff; urllib3 only retries
+# idempotent methods, so patches are never replayed
+_RETRIES = 3
+_RETRY_BACKOFF = 0.2
+
+# Every API call passes this as _request_timeout (connect, read) so a stalled
+# apiserver fails the call instead of hanging it until the executor timeout
+_REQUEST_TIMEOUT = (3, 30)
+
+# Multi-pod requests fan out over one ApiClient; one worker per pooled
+# connection keeps urllib3 from discarding connections
+_LOG_WORKERS = _POOL_MAXSIZE
+
+_LOG_CHUNK_SIZE = 64 * 1024
+
+
+def _error_response(code: str, message: str) -> dict:
+    """Build the standard tool error envelope."""
+    return {"success": False, "error": {"code": code, "message": message}}
+
+
+_ERR_NO_K8S = _error_response(
+    "K8S_IMPORT_ERROR", "kubernetes package not installed. Run: pip install kubernetes"
+)
+
+
+def _load_api_client(kubeconfig: str | None, context: str | None):
+    """Load the Kubernetes configuration and build an ApiClient on a copy of it.
+
+    The copy gets a larger connection pool and retries on 5xx; after the last
+    retry the response is returned (raise_on_status is off) so the apiserver's
+    status surfaces as an ApiException.
+
+    Returns:
+        (api_client, None), or (None, error envelope) when the configuration
+        cannot be loaded
+    """
+    try:
+        if kubeconfig:
+            config.load_kube_config(config_file=kubeconfig, context=context)
+        else:
+            try:
+                config.load_incluster_config()
+            except config.ConfigException:
+                config.load_kube_config(context=context)
+    except Exception as e:
+        return None, _error_response(
+            "K8S_CONFIG_ERROR", f"Failed to load Kubernetes configuration: {e}"
+        )
+
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = _POOL_MAXSIZE
+    configuration.retries = Retry(
+        total=_RETRIES,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    return client.ApiClient(configuration), None
+
+
+def _read_pod_log(v1, pod_name: str, namespace: str, log_kwargs: dict) -> dict:
+    """Fetch one pod's logs and build its tool result.
+
+    log_kwargs holds the read_namespaced_pod_log filters shared by every pod
+    in the request (tail_lines, optional container and since_seconds).
+    """
+    if not _HAS_K8S:
+        return _ERR_NO_K8S
+
+    try:
+        response = v1.read_namespaced_pod_log(
+            pod_name,
+            namespace,
+            _preload_content=False,
+            _request_timeout=_REQUEST_TIMEOUT,
+            **log_kwargs,
+        )
+    except ApiException as e:
+        if e.status == 404:
+            return _error_response(
+                "K8S_NOT_FOUND", f"Pod '{pod_name}' not found in namespace '{namespace}'"
+            )
+        elif e.status == 400 and "container" in str(e.body).lower():
+            return _error_response(
+                "K8S_CONTAINER_ERROR",
+                "Pod has multiple containers. Please specify 'container' parameter.",
+            )
+        raise
+
+    # Read the body in chunks, counting newlines on the raw bytes as they
+    # arrive, instead of buffering it into a str and splitting it into lines
+    body = bytearray()
+    line_count = 0
+    try:
+        for chunk in response.stream(_LOG_CHUNK_SIZE):
+            body += chunk
+            line_count += chunk.count(b"\n")
+    finally:
+        response.release_conn()
+    if body and not body.endswith(b"\n"):
+        line_count += 1
+    logs = body.decode("utf-8", "replace")
+
+    return {
+        "success": True,
+        "data": {
+            "pod_name": pod_name,
+            "container": log_kwargs.get("container") or "default",
+            "logs": logs,
+            "line_count": line_count,
+        },
+    }
+
+
+def _read_pod_log_entry(v1, pod_name: str, namespace: str, log_kwargs: dict) -> dict:
+    """Fetch one pod's logs for a multi-pod request; failures become that pod's entry."""
+    try:
+        result = _read_pod_log(v1, pod_name, namespace, log_kwargs)
+    except Exception as e:
+        result = _error_response("K8S_ERROR", str(e))
+    if result["success"]:
+        return result["data"]
+    return {"pod_name": pod_name, "error": result["error"]}
+
 
 def main(input_data: dict) -> dict:
-    """Get logs from a Kubernetes pod.
+    """Get logs from one or more Kubernetes pods.
 
     Args:
-        input_data: Dictionary with pod_name, optional namespace, container, tail_lines
+        input_data: Dictionary with pod_name (a name or list of names), optional
+            namespace, container, tail_lines, since_seconds
 
     Returns:
-        Dictionary with success status and logs or error
+        Dictionary with success status and logs or error; for a list of pods,
+        data.pods holds one entry (logs or error) per pod
     """
     try:
-        from kubernetes import client, config
-        from kubernetes.client.rest import ApiException
-
         pod_name = input_data.get("pod_name")
         if not pod_name:
-            return {
-                "success": False,
-                "error": {
-                    "code": "K8S_INVALID_INPUT",
-                    "message": "pod_name is required",
-                },
-            }
+            return _error_response("K8S_INVALID_INPUT", "pod_name is required")
 
         namespace = input_data.get("namespace", "default")
         container = input_data.get("container")
         tail_lines = input_data.get("tail_lines", 100)
+        since_seconds = input_data.get("since_seconds")
         kubeconfig = input_data.get("kubeconfig")
         context = input_data.get("context")
 
-        # Load kubernetes configuration
-        try:
-            if kubeconfig:
-                config.load_kube_config(config_file=kubeconfig, context=context)
-            else:
-                try:
-                    config.load_incluster_config()
-                except config.ConfigException:
-                    config.load_kube_config(context=context)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": {
-                    "code": "K8S_CONFIG_ERROR",
-                    "message": f"Failed to load Kubernetes configuration: {e}",
-                },
-            }
-
-        v1 = client.CoreV1Api()
-
-        # Get pod logs
-        try:
-            kwargs = {
-                "name": pod_name,
-                "namespace": namespace,
-                "tail_lines": tail_lines,
-            }
-            if container:
-                kwargs["container"] = container
-
-            logs = v1.read_namespaced_pod_log(**kwargs)
-
-        except ApiException as e:
-            if e.status == 404:
-                return {
-                    "success": False,
-                    "error": {
-                        "code": "K8S_NOT_FOUND",
-                        "message": f"Pod '{pod_name}' not found in namespace '{namespace}'",
-                    },
-                }
-            elif e.status == 400 and "container" in str(e.body).lower():
-                return {
-                    "success": False,
-                    "error": {
-                        "code": "K8S_CONTAINER_ERROR",
-                        "message": "Pod has multiple containers. Please specify 'container' parameter.",
-                    },
-                }
-            raise
+        api_client, error = _load_api_client(kubeconfig, context)
+        if error:
+            return error
+        v1 = client.CoreV1Api(api_client)
+
+        # since_seconds lets the kubelet skip older log data instead of scanning
+        # the whole file to find the tail
+        log_kwargs = {"tail_lines": tail_lines}
+        if container:
+            log_kwargs["container"] = container
+        if since_seconds:
+            log_kwargs["since_seconds"] = since_seconds
+
+        if isinstance(pod_name, str):
+            return _read_pod_log(v1, pod_name, namespace, log_kwargs)
 
-        line_count = len(logs.splitlines()) if logs else 0
+        # Fetch each pod's logs concurrently; one failing pod does not fail the rest
+        pod_names = list(dict.fromkeys(pod_name))
+        with ThreadPoolExecutor(max_workers=min(len(pod_names), _LOG_WORKERS)) as executor:
+            pods = list(
+                executor.map(
+                    lambda name: _read_pod_log_entry(v1, name, namespace, log_kwargs),
+                    pod_names,
+                )
+            )
 
         return {
             "success": True,
             "data": {
-                "pod_name": pod_name,
                 "container": container or "default",
-                "logs": logs,
-                "line_count": line_count,
+                "pods": pods,
             },
         }
 
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "K8S_IMPORT_ERROR",
-                "message": "kubernetes package not installed. Run: pip install kubernetes",
-            },
-        }
     except Exception as e:
-        return {
-            "success": False,
-            "error": {
-                "code": "K8S_ERROR",
-                "message": str(e),
-            },
-        }
+        return _error_response("K8S_ERROR", str(e))
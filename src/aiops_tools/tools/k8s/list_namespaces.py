@@ -1,6 +1,20 @@
 """List Kubernetes namespaces."""
 
-from datetime import datetime, timezone
+import time
+from datetime import datetime
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    from kubernetes import client, config
+    from urllib3.util.retry import Retry
+
+    _HAS_K8S = True
+except ImportError:
+    _HAS_K8S = False
 
 TOOL_DEFINITION = {
     "name": "k8s_list_namespaces",
@@ -38,19 +52,74 @@ TOOL_DEFINITION = {
     },
 }
 
+# Concurrent requests on one ApiClient share this many keep-alive connections
+_POOL_MAXSIZE = 20
+
+# Transient apiserver errors are retried with backoff; urllib3 only retries
+# idempotent methods, so patches are never replayed
+_RETRIES = 3
+_RETRY_BACKOFF = 0.2
+
+# Every API call passes this as _request_timeout (connect, read) so a stalled
+# apiserver fails the call instead of hanging it until the executor timeout
+_REQUEST_TIMEOUT = (3, 30)
+
+
+def _error_response(code: str, message: str) -> dict:
+    """Build the standard tool error envelope."""
+    return {"success": False, "error": {"code": code, "message": message}}
 
-def _get_age(creation_timestamp: datetime) -> str:
-    """Calculate human-readable age from creation timestamp."""
-    now = datetime.now(timezone.utc)
-    delta = now - creation_timestamp
 
-    if delta.days > 0:
-        return f"{delta.days}d"
-    hours = delta.seconds // 3600
-    if hours > 0:
+_ERR_NO_K8S = _error_response(
+    "K8S_IMPORT_ERROR", "kubernetes package not installed. Run: pip install kubernetes"
+)
+
+
+def _load_api_client(kubeconfig: str | None, context: str | None):
+    """Load the Kubernetes configuration and build an ApiClient on a copy of it.
+
+    The copy gets a larger connection pool and retries on 5xx; after the last
+    retry the response is returned (raise_on_status is off) so the apiserver's
+    status surfaces as an ApiException.
+
+    Returns:
+        (api_client, None), or (None, error envelope) when the configuration
+        cannot be loaded
+    """
+    try:
+        if kubeconfig:
+            config.load_kube_config(config_file=kubeconfig, context=context)
+        else:
+            try:
+                config.load_incluster_config()
+            except config.ConfigException:
+                config.load_kube_config(context=context)
+    except Exception as e:
+        return None, _error_response(
+            "K8S_CONFIG_ERROR", f"Failed to load Kubernetes configuration: {e}"
+        )
+
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = _POOL_MAXSIZE
+    configuration.retries = Retry(
+        total=_RETRIES,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    return client.ApiClient(configuration), None
+
+
+def _get_age(creation_timestamp: str, now_ts: float) -> str:
+    """Calculate human-readable age from an RFC 3339 creation timestamp."""
+    seconds = int(now_ts - datetime.fromisoformat(creation_timestamp).timestamp())
+    days, rem = divmod(max(seconds, 0), 86400)
+    if days:
+        return f"{days}d"
+    hours, rem = divmod(rem, 3600)
+    if hours:
         return f"{hours}h"
-    minutes = (delta.seconds % 3600) // 60
-    return f"{minutes}m"
+    return f"{rem // 60}m"
 
 
 def main(input_data: dict) -> dict:
@@ -62,42 +131,32 @@ def main(input_data: dict) -> dict:
     Returns:
         Dictionary with success status and namespace list or error
     """
-    try:
-        from kubernetes import client, config
+    if not _HAS_K8S:
+        return _ERR_NO_K8S
 
+    try:
         kubeconfig = input_data.get("kubeconfig")
         context = input_data.get("context")
 
-        # Load kubernetes configuration
-        try:
-            if kubeconfig:
-                config.load_kube_config(config_file=kubeconfig, context=context)
-            else:
-                try:
-                    config.load_incluster_config()
-                except config.ConfigException:
-                    config.load_kube_config(context=context)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": {
-                    "code": "K8S_CONFIG_ERROR",
-                    "message": f"Failed to load Kubernetes configuration: {e}",
-                },
+        api_client, error = _load_api_client(kubeconfig, context)
+        if error:
+            return error
+        v1 = client.CoreV1Api(api_client)
+
+        # List namespaces as raw JSON; only three fields per namespace are used,
+        # so building the generated model objects would be wasted work
+        response = v1.list_namespace(_preload_content=False, _request_timeout=_REQUEST_TIMEOUT)
+        namespaces = _json_loads(response.data)
+
+        now_ts = time.time()
+        namespace_list = [
+            {
+                "name": ns["metadata"]["name"],
+                "status": (ns.get("status") or {}).get("phase"),
+                "age": _get_age(ns["metadata"]["creationTimestamp"], now_ts),
             }
-
-        v1 = client.CoreV1Api()
-
-        # List namespaces
-        namespaces = v1.list_namespace()
-
-        namespace_list = []
-        for ns in namespaces.items:
-            namespace_list.append({
-                "name": ns.metadata.name,
-                "status": ns.status.phase,
-                "age": _get_age(ns.metadata.creation_timestamp),
-            })
+            for ns in namespaces.get("items") or ()
+        ]
 
         return {
             "success": True,
@@ -106,19 +165,5 @@ def main(input_data: dict) -> dict:
             },
         }
 
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "K8S_IMPORT_ERROR",
-                "message": "kubernetes package not installed. Run: pip install kubernetes",
-            },
-        }
     except Exception as e:
-        return {
-            "success": False,
-            "error": {
-                "code": "K8S_ERROR",
-                "message": str(e),
-            },
-        }
+        return _error_response("K8S_ERROR", str(e))
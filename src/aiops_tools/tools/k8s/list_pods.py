@@ -1,6 +1,21 @@
 """List Kubernetes pods in a namespace."""
 
-from datetime import datetime, timezone
+import time
+from datetime import datetime
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    from kubernetes import client, config
+    from kubernetes.client.rest import ApiException
+    from urllib3.util.retry import Retry
+
+    _HAS_K8S = True
+except ImportError:
+    _HAS_K8S = False
 
 TOOL_DEFINITION = {
     "name": "k8s_list_pods",
@@ -27,6 +42,12 @@ TOOL_DEFINITION = {
                 "type": "string",
                 "description": "Label selector to filter pods (e.g., 'app=nginx')",
             },
+            "format": {
+                "type": "string",
+                "enum": ["objects", "rows"],
+                "description": "'rows' returns column names plus one array per pod",
+                "default": "objects",
+            },
         },
     },
     "output_schema": {
@@ -51,138 +72,173 @@ TOOL_DEFINITION = {
                             },
                         },
                     },
+                    "columns": {"type": "array", "items": {"type": "string"}},
+                    "rows": {"type": "array", "items": {"type": "array"}},
                 },
             },
         },
     },
 }
 
+# Concurrent requests on one ApiClient share this many keep-alive connections
+_POOL_MAXSIZE = 20
 
-def _get_age(creation_timestamp: datetime) -> str:
-    """Calculate human-readable age from creation timestamp."""
-    now = datetime.now(timezone.utc)
-    delta = now - creation_timestamp
+# Transient apiserver errors are retried with backoff; urllib3 only retries
+# idempotent methods, so patches are never replayed
+_RETRIES = 3
+_RETRY_BACKOFF = 0.2
 
-    if delta.days > 0:
-        return f"{delta.days}d"
-    hours = delta.seconds // 3600
-    if hours > 0:
-        return f"{hours}h"
-    minutes = (delta.seconds % 3600) // 60
-    return f"{minutes}m"
+# Every API call passes this as _request_timeout (connect, read) so a stalled
+# apiserver fails the call instead of hanging it until the executor timeout
+_REQUEST_TIMEOUT = (3, 30)
 
+# Field order of each pod row; format "rows" returns these once as columns
+_POD_COLUMNS = ("name", "status", "ready", "restarts", "age", "node")
+
+
+def _error_response(code: str, message: str) -> dict:
+    """Build the standard tool error envelope."""
+    return {"success": False, "error": {"code": code, "message": message}}
 
-def _get_ready_count(container_statuses: list | None) -> str:
-    """Get ready/total container count string."""
-    if not container_statuses:
-        return "0/0"
-    ready = sum(1 for cs in container_statuses if cs.ready)
-    total = len(container_statuses)
-    return f"{ready}/{total}"
 
+_ERR_NO_K8S = _error_response(
+    "K8S_IMPORT_ERROR", "kubernetes package not installed. Run: pip install kubernetes"
+)
+
+
+def _load_api_client(kubeconfig: str | None, context: str | None):
+    """Load the Kubernetes configuration and build an ApiClient on a copy of it.
+
+    The copy gets a larger connection pool and retries on 5xx; after the last
+    retry the response is returned (raise_on_status is off) so the apiserver's
+    status surfaces as an ApiException.
+
+    Returns:
+        (api_client, None), or (None, error envelope) when the configuration
+        cannot be loaded
+    """
+    try:
+        if kubeconfig:
+            config.load_kube_config(config_file=kubeconfig, context=context)
+        else:
+            try:
+                config.load_incluster_config()
+            except config.ConfigException:
+                config.load_kube_config(context=context)
+    except Exception as e:
+        return None, _error_response(
+            "K8S_CONFIG_ERROR", f"Failed to load Kubernetes configuration: {e}"
+        )
+
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = _POOL_MAXSIZE
+    configuration.retries = Retry(
+        total=_RETRIES,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    return client.ApiClient(configuration), None
+
+
+def _get_age(creation_timestamp: str, now_ts: float) -> str:
+    """Calculate human-readable age from an RFC 3339 creation timestamp."""
+    seconds = int(now_ts - datetime.fromisoformat(creation_timestamp).timestamp())
+    days, rem = divmod(max(seconds, 0), 86400)
+    if days:
+        return f"{days}d"
+    hours, rem = divmod(rem, 3600)
+    if hours:
+        return f"{hours}h"
+    return f"{rem // 60}m"
 
-def _get_restart_count(container_statuses: list | None) -> int:
-    """Get total restart count across all containers."""
+
+def _get_ready_and_restarts(container_statuses: list | None) -> tuple[str, int]:
+    """Get the ready/total container string and total restart count in one pass."""
     if not container_statuses:
-        return 0
-    return sum(cs.restart_count for cs in container_statuses)
+        return "0/0", 0
+    ready = 0
+    restarts = 0
+    for cs in container_statuses:
+        if cs.get("ready"):
+            ready += 1
+        restarts += cs.get("restartCount", 0)
+    return f"{ready}/{len(container_statuses)}", restarts
 
 
 def main(input_data: dict) -> dict:
     """List pods in a Kubernetes namespace.
 
     Args:
-        input_data: Dictionary with optional namespace, kubeconfig, context, label_selector
+        input_data: Dictionary with optional namespace, kubeconfig, context, label_selector,
+            format
 
     Returns:
-        Dictionary with success status and pod list or error
+        Dictionary with success status and pod list or error; with format "rows",
+        data holds columns and one row per pod instead of pods
     """
-    try:
-        from kubernetes import client, config
-        from kubernetes.client.rest import ApiException
+    if not _HAS_K8S:
+        return _ERR_NO_K8S
 
+    try:
         namespace = input_data.get("namespace", "default")
         kubeconfig = input_data.get("kubeconfig")
         context = input_data.get("context")
         label_selector = input_data.get("label_selector")
+        fmt = input_data.get("format", "objects")
 
-        # Load kubernetes configuration
-        try:
-            if kubeconfig:
-                config.load_kube_config(config_file=kubeconfig, context=context)
-            else:
-                try:
-                    config.load_incluster_config()
-                except config.ConfigException:
-                    config.load_kube_config(context=context)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": {
-                    "code": "K8S_CONFIG_ERROR",
-                    "message": f"Failed to load Kubernetes configuration: {e}",
-                },
-            }
+        api_client, error = _load_api_client(kubeconfig, context)
+        if error:
+            return error
+        v1 = client.CoreV1Api(api_client)
 
-        v1 = client.CoreV1Api()
-
-        # List pods
+        # List pods as raw JSON; a Pod carries the full spec (env, volumes,
+        # managedFields) but only a few fields are used, so building the
+        # generated model objects for each one would be wasted work
         try:
             if label_selector:
-                pods = v1.list_namespaced_pod(namespace, label_selector=label_selector)
+                pods = v1.list_namespaced_pod(
+                    namespace,
+                    label_selector=label_selector,
+                    _preload_content=False,
+                    _request_timeout=_REQUEST_TIMEOUT,
+                )
             else:
-                pods = v1.list_namespaced_pod(namespace)
+                pods = v1.list_namespaced_pod(
+                    namespace, _preload_content=False, _request_timeout=_REQUEST_TIMEOUT
+                )
+            pods = _json_loads(pods.data)
         except ApiException as e:
             if e.status == 404:
-                return {
-                    "success": False,
-                    "error": {
-                        "code": "K8S_NOT_FOUND",
-                        "message": f"Namespace '{namespace}' not found",
-                    },
-                }
+                return _error_response("K8S_NOT_FOUND", f"Namespace '{namespace}' not found")
             elif e.status == 403:
-                return {
-                    "success": False,
-                    "error": {
-                        "code": "K8S_FORBIDDEN",
-                        "message": f"Access denied to namespace '{namespace}'",
-                    },
-                }
+                return _error_response("K8S_FORBIDDEN", f"Access denied to namespace '{namespace}'")
             raise
 
-        pod_list = []
-        for pod in pods.items:
-            pod_list.append({
-                "name": pod.metadata.name,
-                "status": pod.status.phase,
-                "ready": _get_ready_count(pod.status.container_statuses),
-                "restarts": _get_restart_count(pod.status.container_statuses),
-                "age": _get_age(pod.metadata.creation_timestamp),
-                "node": pod.spec.node_name or "N/A",
-            })
-
-        return {
-            "success": True,
-            "data": {
+        now_ts = time.time()
+        rows = []
+        for pod in pods.get("items") or ():
+            status = pod.get("status") or {}
+            ready, restarts = _get_ready_and_restarts(status.get("containerStatuses"))
+            rows.append((
+                pod["metadata"]["name"],
+                status.get("phase"),
+                ready,
+                restarts,
+                _get_age(pod["metadata"]["creationTimestamp"], now_ts),
+                (pod.get("spec") or {}).get("nodeName") or "N/A",
+            ))
+
+        # Rows skip building a dict per pod and serialize as plain arrays
+        if fmt == "rows":
+            data = {"namespace": namespace, "columns": list(_POD_COLUMNS), "rows": rows}
+        else:
+            data = {
                 "namespace": namespace,
-                "pods": pod_list,
-            },
-        }
-
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "K8S_IMPORT_ERROR",
-                "message": "kubernetes package not installed. Run: pip install kubernetes",
-            },
-        }
+                "pods": [dict(zip(_POD_COLUMNS, row, strict=True)) for row in rows],
+            }
+
+        return {"success": True, "data": data}
+
     except Exception as e:
-        return {
-            "success": False,
-            "error": {
-                "code": "K8S_ERROR",
-                "message": str(e),
-            },
-        }
+        return _error_response("K8S_ERROR", str(e))
@@ -2,6 +2,15 @@
 
 from datetime import datetime, timezone
 
+try:
+    from kubernetes import client, config
+    from kubernetes.client.rest import ApiException
+    from urllib3.util.retry import Retry
+
+    _HAS_K8S = True
+except ImportError:
+    _HAS_K8S = False
+
 TOOL_DEFINITION = {
     "name": "k8s_restart_deployment",
     "display_name": "Restart Deployment",
@@ -40,6 +49,63 @@ TOOL_DEFINITION = {
     },
 }
 
+# Concurrent requests on one ApiClient share this many keep-alive connections
+_POOL_MAXSIZE = 20
+
+# Transient apiserver errors are retried with backoff; urllib3 only retries
+# idempotent methods, so patches are never replayed
+_RETRIES = 3
+_RETRY_BACKOFF = 0.2
+
+# Every API call passes this as _request_timeout (connect, read) so a stalled
+# apiserver fails the call instead of hanging it until the executor timeout
+_REQUEST_TIMEOUT = (3, 30)
+
+
+def _error_response(code: str, message: str) -> dict:
+    """Build the standard tool error envelope."""
+    return {"success": False, "error": {"code": code, "message": message}}
+
+
+_ERR_NO_K8S = _error_response(
+    "K8S_IMPORT_ERROR", "kubernetes package not installed. Run: pip install kubernetes"
+)
+
+
+def _load_api_client(kubeconfig: str | None, context: str | None):
+    """Load the Kubernetes configuration and build an ApiClient on a copy of it.
+
+    The copy gets a larger connection pool and retries on 5xx; after the last
+    retry the response is returned (raise_on_status is off) so the apiserver's
+    status surfaces as an ApiException.
+
+    Returns:
+        (api_client, None), or (None, error envelope) when the configuration
+        cannot be loaded
+    """
+    try:
+        if kubeconfig:
+            config.load_kube_config(config_file=kubeconfig, context=context)
+        else:
+            try:
+                config.load_incluster_config()
+            except config.ConfigException:
+                config.load_kube_config(context=context)
+    except Exception as e:
+        return None, _error_response(
+            "K8S_CONFIG_ERROR", f"Failed to load Kubernetes configuration: {e}"
+        )
+
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = _POOL_MAXSIZE
+    configuration.retries = Retry(
+        total=_RETRIES,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    return client.ApiClient(configuration), None
+
 
 def main(input_data: dict) -> dict:
     """Restart a Kubernetes deployment.
@@ -50,89 +116,59 @@ def main(input_data: dict) -> dict:
     Returns:
         Dictionary with success status and restart confirmation or error
     """
-    try:
-        from kubernetes import client, config
-        from kubernetes.client.rest import ApiException
+    if not _HAS_K8S:
+        return _ERR_NO_K8S
 
+    try:
         deployment_name = input_data.get("deployment_name")
         if not deployment_name:
-            return {
-                "success": False,
-                "error": {
-                    "code": "K8S_INVALID_INPUT",
-                    "message": "deployment_name is required",
-                },
-            }
+            return _error_response("K8S_INVALID_INPUT", "deployment_name is required")
 
         namespace = input_data.get("namespace", "default")
         kubeconfig = input_data.get("kubeconfig")
         context = input_data.get("context")
 
-        # Load kubernetes configuration
-        try:
-            if kubeconfig:
-                config.load_kube_config(config_file=kubeconfig, context=context)
-            else:
-                try:
-                    config.load_incluster_config()
-                except config.ConfigException:
-                    config.load_kube_config(context=context)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": {
-                    "code": "K8S_CONFIG_ERROR",
-                    "message": f"Failed to load Kubernetes configuration: {e}",
-                },
-            }
-
-        apps_v1 = client.AppsV1Api()
-
-        # Get current deployment to verify it exists
-        try:
-            deployment = apps_v1.read_namespaced_deployment(deployment_name, namespace)
-        except ApiException as e:
-            if e.status == 404:
-                return {
-                    "success": False,
-                    "error": {
-                        "code": "K8S_NOT_FOUND",
-                        "message": f"Deployment '{deployment_name}' not found in namespace '{namespace}'",
-                    },
-                }
-            elif e.status == 403:
-                return {
-                    "success": False,
-                    "error": {
-                        "code": "K8S_FORBIDDEN",
-                        "message": f"Access denied to deployment '{deployment_name}'",
-                    },
-                }
-            raise
+        api_client, error = _load_api_client(kubeconfig, context)
+        if error:
+            return error
+        apps_v1 = client.AppsV1Api(api_client)
 
-        # Perform rollout restart by updating annotation
+        # Perform rollout restart by updating annotation (what `kubectl rollout
+        # restart` does). A strategic-merge patch carrying only the annotation
+        # replaces the read-then-send-back-the-whole-object round trip; a
+        # missing deployment surfaces as a 404 on the patch itself.
         restart_time = datetime.now(timezone.utc).isoformat()
-
-        # Ensure annotations exist
-        if deployment.spec.template.metadata.annotations is None:
-            deployment.spec.template.metadata.annotations = {}
-
-        deployment.spec.template.metadata.annotations["kubectl.kubernetes.io/restartedAt"] = restart_time
+        body = {
+            "spec": {
+                "template": {
+                    "metadata": {
+                        "annotations": {"kubectl.kubernetes.io/restartedAt": restart_time},
+                    },
+                },
+            },
+        }
 
         try:
             apps_v1.patch_namespaced_deployment(
                 deployment_name,
                 namespace,
-                deployment,
+                body,
+                _content_type="application/strategic-merge-patch+json",
+                _preload_content=False,
+                _request_timeout=_REQUEST_TIMEOUT,
             )
         except ApiException as e:
-            return {
-                "success": False,
-                "error": {
-                    "code": "K8S_PATCH_ERROR",
-                    "message": f"Failed to restart deployment: {e.reason}",
-                },
-            }
+            if e.status == 404:
+                return _error_response(
+                    "K8S_NOT_FOUND",
+                    f"Deployment '{deployment_name}' not found in namespace '{namespace}'",
+                )
+            elif e.status == 403:
+                return _error_response(
+                    "K8S_FORBIDDEN",
+                    f"Access denied to deployment '{deployment_name}'",
+                )
+            return _error_response("K8S_PATCH_ERROR", f"Failed to restart deployment: {e.reason}")
 
         return {
             "success": True,
@@ -144,19 +180,5 @@ def main(input_data: dict) -> dict:
             },
         }
 
-    except ImportError:
-        return {
-            "success": False,
-            "error": {
-                "code": "K8S_IMPORT_ERROR",
-                "message": "kubernetes package not installed. Run: pip install kubernetes",
-            },
-        }
     except Exception as e:
-        return {
-            "success": False,
-            "error": {
-                "code": "K8S_ERROR",
-                "message": str(e),
-            },
-        }
+        return _error_response("K8S_ERROR", str(e))
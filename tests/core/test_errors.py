@@ -0,0 +1,43 @@
+"""Tests for the shared error templates."""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+import aiops_tools
+from aiops_tools.core.errors import ERROR_TEMPLATES, ErrorCode, get_error_template
+
+SRC_DIR = Path(aiops_tools.__file__).parent
+
+
+def _template_keys_used() -> set[str]:
+    keys = set()
+    for path in SRC_DIR.rglob("*.py"):
+        for node in ast.walk(ast.parse(path.read_text())):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id == "get_error_template"
+            ):
+                keys.add(ast.literal_eval(node.args[0]))
+    return keys
+
+
+def test_every_template_key_in_use_is_defined():
+    keys = _template_keys_used()
+
+    assert keys
+    assert keys <= ERROR_TEMPLATES.keys()
+
+
+def test_template_fields():
+    template = get_error_template("invalid_tool_name")
+
+    assert template.code is ErrorCode.INVALID_FORMAT
+    assert template.suggestion
+
+
+def test_unknown_template_key():
+    with pytest.raises(KeyError):
+        get_error_template("no_such_template")
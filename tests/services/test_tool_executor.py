@@ -0,0 +1,50 @@
+"""Tests for the subprocess tool executor."""
+
+from aiops_tools.services.tool_executor import execute_script
+
+
+def test_result_is_parsed_from_stdout():
+    script = "def main(input_data):\n    return {'echo': input_data['value']}\n"
+
+    result = execute_script(script, {"value": "héllo"}, timeout=30)
+
+    assert result.success is True
+    assert result.result == {"echo": "héllo"}
+
+
+def test_datetimes_and_int_keys_are_serialized():
+    script = (
+        "import datetime\n"
+        "def main(input_data):\n"
+        "    ts = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)\n"
+        "    return {'ts': ts, 'by_id': {1: 'a'}}\n"
+    )
+
+    result = execute_script(script, {}, timeout=30)
+
+    assert result.result == {"ts": "2024-01-01T00:00:00+00:00", "by_id": {"1": "a"}}
+
+
+def test_ints_wider_than_64_bits_fall_back_to_json():
+    script = "def main(input_data):\n    return {'big': 2 ** 70}\n"
+
+    result = execute_script(script, {}, timeout=30)
+
+    assert result.result == {"big": 2**70}
+
+
+def test_failing_script_reports_stderr():
+    script = "def main(input_data):\n    raise ValueError('boom')\n"
+
+    result = execute_script(script, {}, timeout=30)
+
+    assert result.success is False
+    assert "ValueError: boom" in result.error
+
+
+def test_printed_output_stays_ahead_of_the_result():
+    script = "def main(input_data):\n    print('note')\n    return {'ok': True}\n"
+
+    result = execute_script(script, {}, timeout=30)
+
+    assert result.stdout == 'note\n{"ok":true}'
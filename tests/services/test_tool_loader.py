@@ -0,0 +1,75 @@
+"""Tests for reading pre-built tool definitions and scripts."""
+
+import importlib
+import pkgutil
+import sys
+
+import pytest
+
+from aiops_tools.services import tool_loader
+from aiops_tools.services.tool_loader import (
+    build_tool_record,
+    get_tool_definition,
+)
+
+
+def test_literal_definition_is_read_from_source():
+    source = "import os\nTOOL_DEFINITION = {'name': 'x', 'tags': ['a']}\n"
+
+    assert tool_loader._literal_tool_definition(source) == {"name": "x", "tags": ["a"]}
+
+
+def test_annotated_definition_is_read_from_source():
+    source = "TOOL_DEFINITION: dict = {'name': 'x'}\n"
+
+    assert tool_loader._literal_tool_definition(source) == {"name": "x"}
+
+
+def test_missing_definition_falls_back_to_import(monkeypatch):
+    monkeypatch.setattr(tool_loader, "get_tool_script", lambda *args: "x = 1\n")
+
+    definition = get_tool_definition("k8s", "list_pods")
+
+    assert definition["name"] == "k8s_list_pods"
+
+
+def test_non_literal_definition_falls_back_to_import(monkeypatch):
+    script = "TOOL_DEFINITION = {'name': NAME}\n"
+    monkeypatch.setattr(tool_loader, "get_tool_script", lambda *args: script)
+
+    definition = get_tool_definition("k8s", "describe_pod")
+
+    assert definition["name"] == "k8s_describe_pod"
+
+
+def test_definition_lookup_does_not_import_the_tool(monkeypatch):
+    module_name = "aiops_tools.tools.k8s.get_logs"
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+
+    definition = get_tool_definition("k8s", "get_logs")
+
+    assert definition["name"] == "k8s_get_logs"
+    assert module_name not in sys.modules
+
+
+def test_unknown_tool():
+    assert get_tool_definition("k8s", "no_such_tool") is None
+    assert build_tool_record("k8s", "no_such_tool") is None
+
+
+@pytest.mark.parametrize("category", ["aws", "database", "java", "k8s"])
+def test_every_tool_module_builds_a_record(category):
+    package = importlib.import_module(f"aiops_tools.tools.{category}")
+    tool_names = [
+        module.name
+        for module in pkgutil.iter_modules(package.__path__)
+        if "TOOL_DEFINITION" in tool_loader.get_tool_script(category, module.name)
+    ]
+
+    records = [build_tool_record(category, name) for name in tool_names]
+
+    assert records and all(records)
+    assert {record["name"] for record in records} == {
+        importlib.import_module(f"aiops_tools.tools.{category}.{name}").TOOL_DEFINITION["name"]
+        for name in tool_names
+    }
@@ -0,0 +1,129 @@
+"""Tests for tool script and schema validation."""
+
+import dataclasses
+
+import pytest
+
+from aiops_tools.services import tool_validator
+from aiops_tools.services.tool_validator import (
+    ValidationResult,
+    validate_input_against_schema,
+    validate_json_schema,
+    validate_python_syntax,
+)
+
+
+def test_valid_script():
+    result = validate_python_syntax("def main(input_data):\n    return {}\n")
+
+    assert result == ValidationResult(valid=True, errors=())
+
+
+def test_script_without_main():
+    result = validate_python_syntax("def helper():\n    pass\n")
+
+    assert not result.valid
+    assert result.errors[0].message == "Script must define a 'main' function"
+
+
+def test_validation_result_is_frozen():
+    result = validate_python_syntax("")
+
+    assert not result.valid
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.valid = True
+
+
+def test_invalid_json_schema():
+    result = validate_json_schema({"type": "not-a-type"})
+
+    assert not result.valid
+    assert result.errors[0].field == "input_schema"
+
+
+def test_input_formats_are_checked():
+    schema = {"type": "object", "properties": {"email": {"type": "string", "format": "email"}}}
+
+    assert validate_input_against_schema({"email": "ops@example.com"}, schema).valid
+    assert not validate_input_against_schema({"email": "nobody"}, schema).valid
+
+
+def test_cache_key_reuses_validator():
+    schema = {"type": "object", "required": ["name"]}
+    key = ("tool-id", 1)
+
+    validate_input_against_schema({"name": "x"}, schema, cache_key=key)
+    cached = tool_validator._INPUT_VALIDATORS[key]
+    result = validate_input_against_schema({}, schema, cache_key=key)
+
+    assert tool_validator._INPUT_VALIDATORS[key] is cached
+    assert result.errors[0].message == "'name' is a required property"
+
+
+def test_nested_main_counts():
+    script = "class Tool:\n    def main(self, input_data):\n        return {}\n"
+
+    assert validate_python_syntax(script).valid
+
+
+def test_syntax_error_caret_points_at_offending_column():
+    result = validate_python_syntax("def main(input_data):\n    return {)\n")
+
+    message = result.errors[0].message
+    code_line, caret_line = message.splitlines()[1:]
+    assert code_line == "  Code: return {)"
+    assert caret_line.index("^") == code_line.index(")")
+
+
+FLAT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "count": {"type": "integer", "default": 1},
+        "mode": {"type": "string", "enum": ["fast", "slow"]},
+    },
+    "required": ["name"],
+}
+
+
+def test_flat_schema_uses_compiled_validator():
+    assert tool_validator._compile_simple_validator(FLAT_SCHEMA) is not None
+
+
+@pytest.mark.parametrize(
+    ("input_data", "valid"),
+    [
+        ({"name": "x"}, True),
+        ({"name": "x", "count": 2, "mode": "fast"}, True),
+        ({"name": "x", "count": 2.0}, True),
+        ({}, False),
+        ({"name": 1}, False),
+        ({"name": "x", "count": True}, False),
+        ({"name": "x", "mode": "other"}, False),
+    ],
+)
+def test_flat_schema_matches_jsonschema(input_data, valid):
+    fast = validate_input_against_schema(input_data, FLAT_SCHEMA)
+    slow = tool_validator._build_input_validator({**FLAT_SCHEMA, "additionalProperties": True})
+
+    assert fast.valid is valid
+    assert (slow(input_data) is None) is valid
+
+
+def test_flat_schema_error_reports_field_path():
+    result = validate_input_against_schema({"name": 1}, FLAT_SCHEMA)
+
+    assert result.errors[0].field == "input_data.name"
+    assert result.errors[0].details["validator"] == "type"
+
+
+def test_union_type_falls_back_to_jsonschema():
+    schema = {"type": "object", "properties": {"note": {"type": ["string", "null"]}}}
+
+    assert tool_validator._compile_simple_validator(schema) is None
+    assert validate_input_against_schema({"note": None}, schema).valid
+    assert not validate_input_against_schema({"note": 1}, schema).valid
+
+
+def test_empty_schema_accepts_anything():
+    assert validate_input_against_schema({"anything": 1}, {}).valid
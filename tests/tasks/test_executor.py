@@ -0,0 +1,26 @@
+"""Tests for the Celery task configuration."""
+
+import msgpack
+from kombu.serialization import dumps
+
+from aiops_tools.core.config import settings
+from aiops_tools.tasks.executor import celery_app
+
+
+def test_task_payloads_are_encoded_with_msgpack():
+    payload = {"execution_id": "e-1", "script_content": "def main(d): ...", "input_data": {"n": 1}}
+
+    content_type, _, body = dumps(payload, serializer=celery_app.conf.task_serializer)
+
+    assert content_type == "application/x-msgpack"
+    assert msgpack.unpackb(body) == payload
+
+
+def test_json_messages_are_still_accepted():
+    assert celery_app.conf.accept_content == ["msgpack", "json"]
+    assert celery_app.conf.result_serializer == "msgpack"
+
+
+def test_time_limits_follow_tool_timeout():
+    assert celery_app.conf.task_soft_time_limit == settings.tool_execution_timeout
+    assert celery_app.conf.task_time_limit == settings.tool_execution_timeout + 10
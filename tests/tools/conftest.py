@@ -0,0 +1,80 @@
+"""Shared fakes for the pre-built tool tests."""
+
+from collections import defaultdict
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import boto3
+import httpx
+import mysql.connector
+import psycopg2
+import pytest
+from kubernetes import client as k8s_client
+from kubernetes import config as k8s_config
+
+
+@pytest.fixture
+def aws_clients(monkeypatch):
+    """Route boto3 client creation to one MagicMock per service name."""
+    clients = defaultdict(MagicMock)
+
+    def client(service_name, *args, **kwargs):
+        return clients[service_name]
+
+    monkeypatch.setattr(boto3, "client", client)
+    monkeypatch.setattr(boto3, "Session", lambda **kwargs: MagicMock(client=client))
+    return clients
+
+
+def _connection(monkeypatch, module) -> MagicMock:
+    conn = MagicMock()
+    cursor = conn.cursor.return_value
+    cursor.__enter__.return_value = cursor
+    monkeypatch.setattr(module, "connect", MagicMock(return_value=conn))
+    return conn
+
+
+@pytest.fixture
+def pg_conn(monkeypatch):
+    """Route psycopg2.connect to one MagicMock connection; its cursor is conn.cursor()."""
+    return _connection(monkeypatch, psycopg2)
+
+
+@pytest.fixture
+def mysql_conn(monkeypatch):
+    """Route mysql.connector.connect to one MagicMock connection."""
+    return _connection(monkeypatch, mysql.connector)
+
+
+@pytest.fixture
+def jolokia(monkeypatch):
+    """Serve httpx clients from ``jolokia.handler`` through an httpx.MockTransport.
+
+    Each request is recorded in ``jolokia.requests`` before the handler answers it.
+    """
+    server = SimpleNamespace(handler=None, requests=[])
+    real_client = httpx.Client
+
+    def handle(request):
+        server.requests.append(request)
+        return server.handler(request)
+
+    def client(*args, **kwargs):
+        return real_client(*args, transport=httpx.MockTransport(handle), **kwargs)
+
+    monkeypatch.setattr(httpx, "Client", client)
+    return server
+
+
+@pytest.fixture
+def k8s(monkeypatch):
+    """Skip kubeconfig loading and hand out one MagicMock per Kubernetes API class.
+
+    ``k8s.core`` and ``k8s.apps`` stand in for CoreV1Api and AppsV1Api.
+    """
+    apis = SimpleNamespace(core=MagicMock(), apps=MagicMock())
+    monkeypatch.setattr(k8s_config, "load_kube_config", MagicMock())
+    monkeypatch.setattr(k8s_config, "load_incluster_config", MagicMock())
+    monkeypatch.setattr(k8s_client, "CoreV1Api", lambda *args: apis.core)
+    monkeypatch.setattr(k8s_client, "AppsV1Api", lambda *args: apis.apps)
+    return apis
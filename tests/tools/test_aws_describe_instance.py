@@ -0,0 +1,42 @@
+"""Tests for the aws_describe_instance tool."""
+
+from datetime import UTC, datetime
+
+from aiops_tools.tools.aws import describe_instance
+
+INPUT = {"region": "us-east-1", "instance_id": "i-1"}
+
+
+def test_main_formats_instance(aws_clients):
+    ec2 = aws_clients["ec2"]
+    ec2.describe_instances.return_value = {
+        "Reservations": [{
+            "Instances": [{
+                "InstanceId": "i-1",
+                "State": {"Name": "running"},
+                "InstanceType": "t3.micro",
+                "Placement": {"AvailabilityZone": "us-east-1a"},
+                "LaunchTime": datetime(2024, 1, 1, tzinfo=UTC),
+                "Tags": [{"Key": "Name", "Value": "web"}],
+                "SecurityGroups": [{"GroupId": "sg-1", "GroupName": "default"}],
+            }],
+        }],
+    }
+
+    result = describe_instance.main(INPUT)
+
+    assert result["success"] is True
+    assert result["data"]["name"] == "web"
+    assert result["data"]["launch_time"] == "2024-01-01T00:00:00+00:00"
+    assert result["data"]["security_groups"] == [{"id": "sg-1", "name": "default"}]
+    ec2.describe_instances.assert_called_once_with(InstanceIds=["i-1"])
+
+
+def test_main_reports_missing_instance(aws_clients):
+    aws_clients["ec2"].describe_instances.return_value = {"Reservations": []}
+
+    assert describe_instance.main(INPUT)["error"]["code"] == "AWS_NOT_FOUND"
+
+
+def test_main_requires_instance_id():
+    assert describe_instance.main({"region": "us-east-1"})["error"]["code"] == "AWS_INVALID_INPUT"
@@ -0,0 +1,57 @@
+"""Tests for the aws_describe_rds tool."""
+
+from datetime import UTC, datetime
+
+from botocore.exceptions import ClientError, NoCredentialsError
+
+from aiops_tools.tools.aws import describe_rds
+
+INPUT = {"region": "us-east-1", "db_instance_identifier": "orders-db"}
+
+DB_INSTANCE = {
+    "DBInstanceIdentifier": "orders-db",
+    "DBInstanceClass": "db.t3.medium",
+    "Engine": "postgres",
+    "EngineVersion": "16.1",
+    "DBInstanceStatus": "available",
+    "Endpoint": {"Address": "orders-db.example.com", "Port": 5432},
+    "AllocatedStorage": 100,
+    "DBSubnetGroup": {"VpcId": "vpc-1"},
+    "LatestRestorableTime": datetime(2024, 1, 1, tzinfo=UTC),
+    "TagList": [{"Key": "team", "Value": "payments"}],
+}
+
+
+def test_main_formats_instance(aws_clients):
+    rds = aws_clients["rds"]
+    rds.describe_db_instances.return_value = {"DBInstances": [DB_INSTANCE]}
+
+    result = describe_rds.main(INPUT)
+
+    assert result["success"] is True
+    data = result["data"]
+    assert data["endpoint"] == {"address": "orders-db.example.com", "port": 5432}
+    assert data["vpc_id"] == "vpc-1"
+    assert data["tags"] == {"team": "payments"}
+    assert data["latest_restorable_time"] == "2024-01-01T00:00:00+00:00"
+    rds.describe_db_instances.assert_called_once_with(DBInstanceIdentifier="orders-db")
+
+
+def test_main_maps_not_found(aws_clients):
+    aws_clients["rds"].describe_db_instances.side_effect = ClientError(
+        {"Error": {"Code": "DBInstanceNotFound", "Message": "missing"}}, "DescribeDBInstances"
+    )
+
+    assert describe_rds.main(INPUT)["error"]["code"] == "AWS_NOT_FOUND"
+
+
+def test_main_reports_missing_credentials(aws_clients):
+    aws_clients["rds"].describe_db_instances.side_effect = NoCredentialsError()
+
+    assert describe_rds.main(INPUT)["error"]["code"] == "AWS_AUTH_ERROR"
+
+
+def test_main_reports_missing_boto3(monkeypatch):
+    monkeypatch.setattr(describe_rds, "_HAS_BOTO", False)
+
+    assert describe_rds.main(INPUT)["error"]["code"] == "AWS_IMPORT_ERROR"
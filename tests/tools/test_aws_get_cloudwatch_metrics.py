@@ -0,0 +1,119 @@
+"""Tests for the aws_get_cloudwatch_metrics tool."""
+
+from datetime import UTC, datetime, timedelta
+
+from aiops_tools.tools.aws import get_cloudwatch_metrics
+
+NOW = datetime(2024, 1, 1, 12, tzinfo=UTC)
+T1 = NOW - timedelta(minutes=10)
+T2 = NOW - timedelta(minutes=5)
+
+
+def _paginate(cloudwatch, pages: list[dict]):
+    paginate = cloudwatch.get_paginator.return_value.paginate
+    paginate.return_value = iter(pages)
+    return paginate
+
+
+def test_single_metric_merges_pages(aws_clients):
+    paginate = _paginate(aws_clients["cloudwatch"], [
+        {"MetricDataResults": [{"Id": "m0", "Timestamps": [T1], "Values": [1.0]}]},
+        {"MetricDataResults": [{"Id": "m0", "Timestamps": [T2], "Values": [2.0]}]},
+    ])
+
+    result = get_cloudwatch_metrics.main({
+        "region": "us-east-1",
+        "namespace": "AWS/EC2",
+        "metric_name": "CPUUtilization",
+        "dimensions": [{"name": "InstanceId", "value": "i-1"}],
+        "unit": "Percent",
+    })
+
+    assert result["success"] is True
+    assert result["data"]["datapoints"] == [
+        {"timestamp": T1.isoformat(), "value": 1.0, "unit": "Percent"},
+        {"timestamp": T2.isoformat(), "value": 2.0, "unit": "Percent"},
+    ]
+    query = paginate.call_args.kwargs["MetricDataQueries"][0]
+    assert query["MetricStat"]["Unit"] == "Percent"
+    assert query["MetricStat"]["Metric"]["Dimensions"] == [{"Name": "InstanceId", "Value": "i-1"}]
+    assert paginate.call_args.kwargs["ScanBy"] == "TimestampAscending"
+
+
+def test_batch_returns_one_entry_per_metric(aws_clients):
+    _paginate(aws_clients["cloudwatch"], [{
+        "MetricDataResults": [
+            {"Id": "m0", "Timestamps": [T1], "Values": [5.0]},
+            {"Id": "m1", "Timestamps": [], "Values": []},
+        ],
+    }])
+
+    result = get_cloudwatch_metrics.main({
+        "region": "us-east-1",
+        "statistic": "Maximum",
+        "metrics": [
+            {"namespace": "AWS/EC2", "metric_name": "CPUUtilization", "unit": "Percent"},
+            {"namespace": "AWS/RDS", "metric_name": "FreeStorageSpace", "statistic": "Minimum"},
+        ],
+    })
+
+    metrics = result["data"]["metrics"]
+    assert [m["statistic"] for m in metrics] == ["Maximum", "Minimum"]
+    assert metrics[0]["datapoints"][0]["unit"] == "Percent"
+    assert metrics[1]["datapoints"] == []
+
+
+def test_unit_is_null_when_not_requested(aws_clients):
+    _paginate(aws_clients["cloudwatch"], [
+        {"MetricDataResults": [{"Id": "m0", "Timestamps": [T1], "Values": [1.0]}]},
+    ])
+
+    result = get_cloudwatch_metrics.main({
+        "region": "us-east-1",
+        "metrics": [{"namespace": "AWS/EC2", "metric_name": "CPUUtilization"}],
+    })
+
+    assert result["data"]["metrics"][0]["datapoints"][0]["unit"] is None
+
+
+def test_batch_size_is_bounded():
+    result = get_cloudwatch_metrics.main({
+        "region": "us-east-1",
+        "metrics": [{"namespace": "AWS/EC2", "metric_name": "CPUUtilization"}] * 501,
+    })
+
+    assert result["error"]["code"] == "AWS_INVALID_INPUT"
+
+
+def test_malformed_batch_entry_is_rejected(aws_clients):
+    result = get_cloudwatch_metrics.main({
+        "region": "us-east-1",
+        "metrics": [
+            {"namespace": "AWS/EC2", "metric_name": "CPUUtilization"},
+            {"namespace": "AWS/EC2", "dimensions": [{"name": "InstanceId"}]},
+        ],
+    })
+
+    assert result["error"] == {
+        "code": "AWS_INVALID_INPUT",
+        "message": "metrics[1]: metric_name is required",
+    }
+    aws_clients["cloudwatch"].get_paginator.assert_not_called()
+
+
+def test_parse_time_accepts_relative_and_iso():
+    before = datetime.now(UTC)
+    relative = get_cloudwatch_metrics._parse_time("-30m")
+
+    assert before - timedelta(minutes=30) <= relative <= datetime.now(UTC) - timedelta(minutes=30)
+    absolute = get_cloudwatch_metrics._parse_time("2024-01-01T00:00:00Z")
+
+    assert absolute == datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def test_parse_time_resolves_against_given_now():
+    parse = get_cloudwatch_metrics._parse_time
+
+    assert parse("-1h", now=NOW) == NOW - timedelta(hours=1)
+    assert parse("now", now=NOW) == NOW
+    assert parse(None, default_delta=timedelta(hours=-1), now=NOW) == NOW - timedelta(hours=1)
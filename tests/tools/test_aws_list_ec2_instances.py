@@ -0,0 +1,84 @@
+"""Tests for the aws_list_ec2_instances tool."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from aiops_tools.tools.aws import list_ec2_instances
+
+
+def _instance(instance_id: str, name: str | None = None) -> dict:
+    instance = {
+        "InstanceId": instance_id,
+        "State": {"Name": "running"},
+        "InstanceType": "t3.micro",
+        "PrivateIpAddress": "10.0.0.1",
+        "Placement": {"AvailabilityZone": "us-east-1a"},
+        "LaunchTime": datetime(2024, 1, 1, tzinfo=UTC),
+    }
+    if name:
+        instance["Tags"] = [{"Key": "Name", "Value": name}]
+    return instance
+
+
+def _paginate(ec2, pages: list[dict]):
+    paginate = ec2.get_paginator.return_value.paginate
+    paginate.return_value = iter(pages)
+    return paginate
+
+
+def test_iter_instances_is_lazy_and_caps_results():
+    paginator = MagicMock()
+    paginator.paginate.return_value = iter([
+        {"Reservations": [{"Instances": [_instance("i-1"), _instance("i-2")]}]},
+        {"Reservations": [{"Instances": [_instance("i-3")]}]},
+    ])
+
+    instances = list_ec2_instances._iter_instances(paginator, {}, 2)
+
+    paginator.paginate.assert_not_called()
+    assert [i["instance_id"] for i in instances] == ["i-1", "i-2"]
+
+
+def test_instance_name_comes_from_name_tag():
+    instance = {"Tags": [{"Key": "team", "Value": "ops"}, {"Key": "Name", "Value": "web"}]}
+
+    assert list_ec2_instances._get_instance_name(instance) == "web"
+    assert list_ec2_instances._get_instance_name({"Tags": [{"Key": "team", "Value": "ops"}]}) == ""
+    assert list_ec2_instances._get_instance_name({}) == ""
+
+
+def test_main_flattens_reservations_and_caps_results(aws_clients):
+    _paginate(aws_clients["ec2"], [
+        {"Reservations": [{"Instances": [_instance("i-1", "web"), _instance("i-2")]}]},
+        {"Reservations": [{"Instances": [_instance("i-3")]}, {"Instances": [_instance("i-4")]}]},
+    ])
+
+    result = list_ec2_instances.main({"region": "us-east-1", "max_results": 3})
+
+    instances = result["data"]["instances"]
+    assert [i["instance_id"] for i in instances] == ["i-1", "i-2", "i-3"]
+    assert instances[0]["name"] == "web"
+    assert instances[1]["public_ip"] == ""
+    assert instances[0]["launch_time"] == "2024-01-01T00:00:00+00:00"
+
+
+@pytest.mark.parametrize(("max_results", "page_size"), [(1, 5), (100, 100), (5000, 1000)])
+def test_main_clamps_page_size(aws_clients, max_results, page_size):
+    paginate = _paginate(aws_clients["ec2"], [])
+
+    list_ec2_instances.main({
+        "region": "us-east-1",
+        "max_results": max_results,
+        "filters": [{"name": "instance-state-name", "values": ["running"]}],
+    })
+
+    paginate.assert_called_once_with(
+        Filters=[{"Name": "instance-state-name", "Values": ["running"]}],
+        PaginationConfig={"MaxItems": max_results, "PageSize": page_size},
+    )
+
+
+def test_main_requires_region():
+    assert list_ec2_instances.main({})["error"]["code"] == "AWS_INVALID_INPUT"
@@ -0,0 +1,71 @@
+"""Tests for the aws_list_s3_buckets tool."""
+
+from datetime import UTC, datetime
+
+from aiops_tools.tools.aws import list_s3_buckets
+
+CREATED = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def test_regions_are_looked_up_per_bucket(aws_clients):
+    s3 = aws_clients["s3"]
+    s3.list_buckets.return_value = {
+        "Buckets": [
+            {"Name": "a", "CreationDate": CREATED},
+            {"Name": "b", "CreationDate": CREATED},
+            {"Name": "c", "CreationDate": CREATED},
+        ],
+    }
+    locations = {"a": {"LocationConstraint": "eu-west-1"}, "b": {"LocationConstraint": None}}
+
+    def get_bucket_location(**params):
+        if params["Bucket"] not in locations:
+            raise Exception("AccessDenied")
+        return locations[params["Bucket"]]
+
+    s3.get_bucket_location.side_effect = get_bucket_location
+
+    result = list_s3_buckets.main({})
+
+    assert result["success"] is True
+    assert result["data"]["total_count"] == 3
+    assert [(b["name"], b["region"]) for b in result["data"]["buckets"]] == [
+        ("a", "eu-west-1"),
+        ("b", "us-east-1"),
+        ("c", "unknown"),
+    ]
+    assert result["data"]["buckets"][0]["creation_date"] == "2024-01-01T00:00:00+00:00"
+
+
+def test_no_buckets(aws_clients):
+    aws_clients["s3"].list_buckets.return_value = {"Buckets": []}
+
+    result = list_s3_buckets.main({})
+
+    assert result["data"] == {"buckets": [], "total_count": 0}
+    aws_clients["s3"].get_bucket_location.assert_not_called()
+
+
+def test_bucket_region_from_list_buckets(aws_clients):
+    s3 = aws_clients["s3"]
+    s3.meta.service_model.operation_model.return_value.input_shape.members = {"MaxBuckets": None}
+    s3.list_buckets.side_effect = [
+        {
+            "Buckets": [{"Name": "a", "CreationDate": CREATED, "BucketRegion": "eu-west-1"}],
+            "ContinuationToken": "next",
+        },
+        {"Buckets": [{"Name": "b", "CreationDate": CREATED}]},
+    ]
+    s3.get_bucket_location.return_value = {"LocationConstraint": "ap-south-1"}
+
+    result = list_s3_buckets.main({})
+
+    assert [(b["name"], b["region"]) for b in result["data"]["buckets"]] == [
+        ("a", "eu-west-1"),
+        ("b", "ap-south-1"),
+    ]
+    assert s3.list_buckets.call_args_list[1].kwargs == {
+        "MaxBuckets": 10000,
+        "ContinuationToken": "next",
+    }
+    s3.get_bucket_location.assert_called_once_with(Bucket="b")
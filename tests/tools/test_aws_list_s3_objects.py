@@ -0,0 +1,133 @@
+"""Tests for the aws_list_s3_objects tool."""
+
+from datetime import UTC, datetime
+
+from botocore.exceptions import ClientError
+
+from aiops_tools.tools.aws import list_s3_objects
+
+MODIFIED = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+class _PageIterator(list):
+    """Paginator result stand-in exposing resume_token like botocore's."""
+
+    def __init__(self, pages, resume_token=None):
+        super().__init__(pages)
+        self.resume_token = resume_token
+
+
+def _obj(key: str) -> dict:
+    return {"Key": key, "Size": 1, "LastModified": MODIFIED}
+
+
+def test_list_reports_truncation_from_paginator(aws_clients):
+    paginate = aws_clients["s3"].get_paginator.return_value.paginate
+    paginate.return_value = _PageIterator(
+        [{"Contents": [_obj("a.log"), _obj("b.log")]}], resume_token="more"
+    )
+
+    result = list_s3_objects.main({"bucket": "b", "prefix": "a", "max_keys": 2})
+
+    assert [o["key"] for o in result["data"]["objects"]] == ["a.log", "b.log"]
+    assert result["data"]["objects"][0]["last_modified"] == "2024-01-01T00:00:00+00:00"
+    assert result["data"]["truncated"] is True
+    paginate.assert_called_once_with(
+        Bucket="b", Prefix="a", PaginationConfig={"PageSize": 2, "MaxItems": 2}
+    )
+
+
+def test_list_pages_past_one_thousand_keys(aws_clients):
+    paginate = aws_clients["s3"].get_paginator.return_value.paginate
+    paginate.return_value = _PageIterator([
+        {"Contents": [_obj(f"p1/{i}") for i in range(1000)]},
+        {"Contents": [_obj(f"p2/{i}") for i in range(500)]},
+    ])
+
+    result = list_s3_objects.main({"bucket": "b", "max_keys": 1500})
+
+    assert result["data"]["total_count"] == 1500
+    assert result["data"]["truncated"] is False
+    paginate.assert_called_once_with(
+        Bucket="b", PaginationConfig={"PageSize": 1000, "MaxItems": 1500}
+    )
+
+
+def test_main_requires_bucket():
+    assert list_s3_objects.main({})["error"]["code"] == "AWS_INVALID_INPUT"
+
+
+def test_sharded_prefixes_are_merged_in_key_order(aws_clients):
+    def paginate(**params):
+        keys = {"y/": ["y/2", "y/1"], "x/": ["x/1"]}[params["Prefix"]]
+        return _PageIterator([{"Contents": [_obj(k) for k in keys]}])
+
+    aws_clients["s3"].get_paginator.return_value.paginate.side_effect = paginate
+
+    result = list_s3_objects.main({"bucket": "b", "prefixes": ["y/", "x/"], "max_keys": 10})
+
+    assert [o["key"] for o in result["data"]["objects"]] == ["x/1", "y/1", "y/2"]
+    assert result["data"]["truncated"] is False
+
+
+def test_slash_prefix_is_split_into_sub_prefixes(aws_clients):
+    s3 = aws_clients["s3"]
+    s3.list_objects_v2.return_value = {
+        "Contents": [_obj("logs/readme.txt")],
+        "CommonPrefixes": [{"Prefix": "logs/a/"}, {"Prefix": "logs/b/"}],
+    }
+    s3.get_paginator.return_value.paginate.side_effect = lambda **params: _PageIterator(
+        [{"Contents": [_obj(params["Prefix"] + "1")]}]
+    )
+
+    result = list_s3_objects.main({"bucket": "b", "prefix": "logs/", "max_keys": 2000})
+
+    assert [o["key"] for o in result["data"]["objects"]] == [
+        "logs/a/1",
+        "logs/b/1",
+        "logs/readme.txt",
+    ]
+    assert result["data"]["truncated"] is False
+    s3.list_objects_v2.assert_called_once_with(Bucket="b", Prefix="logs/", Delimiter="/")
+
+
+def test_browse_returns_one_folder_level(aws_clients):
+    s3 = aws_clients["s3"]
+    s3.list_objects_v2.return_value = {
+        "Contents": [_obj("logs/readme.txt")],
+        "CommonPrefixes": [{"Prefix": "logs/a/"}],
+        "IsTruncated": True,
+    }
+
+    result = list_s3_objects.main({"bucket": "b", "prefix": "logs/", "mode": "browse"})
+
+    assert result["data"]["common_prefixes"] == ["logs/a/"]
+    assert [o["key"] for o in result["data"]["objects"]] == ["logs/readme.txt"]
+    assert result["data"]["truncated"] is True
+    s3.list_objects_v2.assert_called_once_with(
+        Bucket="b", Prefix="logs/", Delimiter="/", MaxKeys=50
+    )
+    s3.get_paginator.assert_not_called()
+
+
+def test_missing_boto3_is_reported(monkeypatch):
+    monkeypatch.setattr(list_s3_objects, "_HAS_BOTO", False)
+
+    assert list_s3_objects.main({"bucket": "b"})["error"]["code"] == "AWS_IMPORT_ERROR"
+
+
+def test_missing_bucket_is_mapped_to_not_found(aws_clients):
+    error = ClientError({"Error": {"Code": "NoSuchBucket", "Message": "gone"}}, "ListObjectsV2")
+    aws_clients["s3"].get_paginator.return_value.paginate.side_effect = error
+
+    result = list_s3_objects.main({"bucket": "b", "prefix": "a"})
+
+    assert result["error"] == {"code": "AWS_NOT_FOUND", "message": "Bucket 'b' not found"}
+
+
+def test_unexpected_errors_are_reported_as_aws_errors(aws_clients):
+    aws_clients["s3"].get_paginator.side_effect = RuntimeError("boom")
+
+    result = list_s3_objects.main({"bucket": "b", "prefix": "a"})
+
+    assert result["error"] == {"code": "AWS_ERROR", "message": "boom"}
@@ -0,0 +1,78 @@
+"""Tests for the db_describe_table tool."""
+
+from aiops_tools.tools.database import describe_table
+
+INPUT = {
+    "host": "db",
+    "database": "app",
+    "username": "reader",
+    "password": "secret",
+    "table_name": "orders",
+}
+
+
+def test_postgresql_splits_sections(pg_conn):
+    cursor = pg_conn.cursor.return_value
+    cursor.fetchall.return_value = [
+        (0, 1, "id", "integer", None, None, False, True, None),
+        (0, 2, "user_id", "integer", None, None, True, False, None),
+        (1, 0, "orders_pkey", None, None, None, True, None, ["id"]),
+        (2, 0, "orders_user_fk", "user_id", "users", "id", None, None, None),
+    ]
+
+    result = describe_table.main({**INPUT, "db_type": "postgresql"})
+
+    assert result["success"] is True
+    data = result["data"]
+    assert [c["name"] for c in data["columns"]] == ["id", "user_id"]
+    assert data["columns"][0]["primary_key"] is True
+    assert data["indexes"] == [{"name": "orders_pkey", "columns": ["id"], "unique": True}]
+    assert data["foreign_keys"][0]["references_table"] == "users"
+    cursor.execute.assert_called_once_with(
+        describe_table._PG_DESCRIBE_SQL, {"schema": "public", "table": "orders"}
+    )
+    pg_conn.close.assert_called_once()
+
+
+def test_postgresql_missing_table(pg_conn):
+    pg_conn.cursor.return_value.fetchall.return_value = []
+
+    result = describe_table.main({**INPUT, "db_type": "postgresql"})
+
+    assert result["error"]["code"] == "DB_NOT_FOUND"
+
+
+def test_mysql_runs_module_level_queries(mysql_conn):
+    cursor = mysql_conn.cursor.return_value
+    cursor.fetchall.side_effect = [
+        [("id", "int", 0, None, 1)],
+        [("PRIMARY", "id", 1)],
+        [("fk_user", "user_id", "users", "id")],
+    ]
+
+    result = describe_table.main({**INPUT, "db_type": "mysql"})
+
+    assert result["success"] is True
+    assert result["data"]["columns"][0] == {
+        "name": "id",
+        "data_type": "int",
+        "nullable": False,
+        "default": None,
+        "primary_key": True,
+    }
+    assert result["data"]["indexes"][0]["columns"] == ["id"]
+    assert [call.args for call in cursor.execute.call_args_list] == [
+        (describe_table._MYSQL_COLUMNS_SQL, ("app", "orders")),
+        (describe_table._MYSQL_INDEXES_SQL, ("app", "orders")),
+        (describe_table._MYSQL_FOREIGN_KEYS_SQL, ("app", "orders")),
+    ]
+
+
+def test_mysql_missing_table_stops_after_columns(mysql_conn):
+    cursor = mysql_conn.cursor.return_value
+    cursor.fetchall.return_value = []
+
+    result = describe_table.main({**INPUT, "db_type": "mysql"})
+
+    assert result["error"]["code"] == "DB_NOT_FOUND"
+    cursor.execute.assert_called_once()
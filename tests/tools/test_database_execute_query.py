@@ -0,0 +1,131 @@
+"""Tests for the db_execute_query tool."""
+
+from decimal import Decimal
+
+import pytest
+from mysql.connector import FieldType
+
+from aiops_tools.tools.database import execute_query
+
+PG_INPUT = {
+    "db_type": "postgresql",
+    "host": "db",
+    "database": "app",
+    "username": "reader",
+    "password": "secret",
+    "query": "SELECT id, amount FROM orders",
+}
+
+
+@pytest.fixture(autouse=True)
+def register_type(monkeypatch):
+    """psycopg2's register_type only accepts real cursors; record calls instead."""
+    calls = []
+    monkeypatch.setattr(execute_query, "register_type", lambda *args: calls.append(args))
+    return calls
+
+
+def test_rejects_write_statements():
+    result = execute_query.main({**PG_INPUT, "query": "DELETE FROM orders"})
+
+    assert result["success"] is False
+    assert result["error"]["code"] == "DB_REJECTED"
+
+
+def test_reports_missing_parameter():
+    result = execute_query.main({**PG_INPUT, "password": ""})
+
+    assert result["error"] == {
+        "code": "DB_INVALID_INPUT",
+        "message": "Missing required parameter: password",
+    }
+
+
+def test_postgresql_streams_select_and_truncates(pg_conn):
+    cursor = pg_conn.cursor.return_value
+    cursor.__iter__.return_value = iter([(1, "1.50"), (2, "2.00"), (3, "3.25")])
+    cursor.description = [("id",), ("amount",)]
+
+    result = execute_query.main({**PG_INPUT, "max_rows": 2})
+
+    assert result["success"] is True
+    assert result["data"]["columns"] == ["id", "amount"]
+    assert result["data"]["rows"] == [(1, "1.50"), (2, "2.00")]
+    assert result["data"]["truncated"] is True
+    pg_conn.cursor.assert_called_with(name=execute_query._PG_CURSOR_NAME)
+    assert cursor.itersize == 3
+
+
+def test_postgresql_sets_statement_timeout(pg_conn):
+    cursor = pg_conn.cursor.return_value
+    cursor.__iter__.return_value = iter([])
+
+    execute_query.main({**PG_INPUT, "timeout": 5})
+
+    assert cursor.execute.call_args_list[0].args == (
+        "SET LOCAL statement_timeout = %s",
+        (5000,),
+    )
+
+
+def test_postgresql_show_uses_client_side_cursor(pg_conn):
+    cursor = pg_conn.cursor.return_value
+    cursor.__iter__.return_value = iter([("on",)])
+    cursor.description = [("ssl",)]
+
+    result = execute_query.main({**PG_INPUT, "query": "SHOW ssl"})
+
+    assert result["data"]["rows"] == [("on",)]
+    pg_conn.cursor.assert_called_with(name=None)
+
+
+def test_mysql_uses_unbuffered_cursor(mysql_conn):
+    cursor = mysql_conn.cursor.return_value
+    cursor.description = [("id", FieldType.LONG)]
+    cursor.fetchmany.return_value = [(1,), (2,)]
+
+    result = execute_query.main({**PG_INPUT, "db_type": "mysql", "timeout": 5})
+
+    assert result["data"]["rows"] == [(1,), (2,)]
+    assert result["data"]["truncated"] is False
+    mysql_conn.cursor.assert_called_once_with(buffered=False)
+    cursor.execute.assert_called_once_with(
+        "SELECT /*+ MAX_EXECUTION_TIME(5000) */ id, amount FROM orders"
+    )
+
+
+def test_missing_driver_is_reported(monkeypatch):
+    monkeypatch.setattr(execute_query, "_HAS_PSYCOPG2", False)
+
+    result = execute_query.main(PG_INPUT)
+
+    assert result["error"]["code"] == "DB_IMPORT_ERROR"
+
+
+def test_postgresql_numeric_caster_is_scoped_to_cursor(pg_conn, register_type):
+    pg_conn.cursor.return_value.__iter__.return_value = iter([])
+
+    execute_query.main(PG_INPUT)
+
+    assert register_type == [(execute_query._PG_DEC2STR, pg_conn.cursor.return_value)]
+
+
+def test_postgresql_numeric_caster_keeps_exact_text():
+    value = "12345678901234567890.123456789"
+
+    assert execute_query._PG_DEC2STR(value, None) == value
+    assert execute_query._PG_DEC2STR(None, None) is None
+
+
+def test_mysql_decimal_columns_become_text(mysql_conn):
+    cursor = mysql_conn.cursor.return_value
+    cursor.description = [
+        ("id", FieldType.LONG),
+        ("amount", FieldType.NEWDECIMAL),
+        ("note", FieldType.VAR_STRING),
+    ]
+    cursor.fetchmany.return_value = [(1, Decimal("1.50"), "a"), (2, None, "b")]
+
+    result = execute_query.main({**PG_INPUT, "db_type": "mysql"})
+
+    assert result["data"]["rows"] == [[1, "1.50", "a"], [2, None, "b"]]
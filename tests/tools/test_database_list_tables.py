@@ -0,0 +1,48 @@
+"""Tests for the db_list_tables tool."""
+
+import mysql.connector
+
+from aiops_tools.tools.database import list_tables
+
+INPUT = {"host": "db", "database": "app", "username": "reader", "password": "secret"}
+
+
+def test_postgresql_streams_from_named_cursor(pg_conn):
+    cursor = pg_conn.cursor.return_value
+    cursor.__iter__.return_value = iter([("orders", "r", 10, 8192), ("recent", "v", 0, 0)])
+
+    result = list_tables.main({**INPUT, "db_type": "postgresql", "schema": "sales"})
+
+    assert result["success"] is True
+    assert result["data"]["schema"] == "sales"
+    assert result["data"]["tables"] == [
+        {"name": "orders", "type": "table", "row_count": 10, "size_bytes": 8192},
+        {"name": "recent", "type": "view", "row_count": 0, "size_bytes": 0},
+    ]
+    pg_conn.cursor.assert_called_once_with(name=list_tables._PG_CURSOR_NAME)
+    cursor.execute.assert_called_once_with(list_tables._PG_LIST_SQL, ("sales",))
+    pg_conn.close.assert_called_once()
+
+
+def test_mysql_defaults_missing_stats_to_zero(mysql_conn):
+    mysql_conn.cursor.return_value.__iter__.return_value = iter(
+        [("orders", "BASE TABLE", None, None)]
+    )
+
+    result = list_tables.main({**INPUT, "db_type": "mysql"})
+
+    assert result["data"]["tables"] == [
+        {"name": "orders", "type": "table", "row_count": 0, "size_bytes": 0}
+    ]
+    mysql_conn.cursor.assert_called_once_with(buffered=False)
+
+
+def test_connection_failure_is_reported(monkeypatch):
+    def refuse(**kwargs):
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(mysql.connector, "connect", refuse)
+
+    result = list_tables.main({**INPUT, "db_type": "mysql"})
+
+    assert result["error"] == {"code": "DB_CONNECTION_ERROR", "message": "connection refused"}
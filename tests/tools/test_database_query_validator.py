@@ -0,0 +1,48 @@
+"""Tests for the read-only SQL validator."""
+
+import pytest
+
+from aiops_tools.tools.database.query_validator import sanitize_identifier, validate_sql
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT 1",
+        "  select * from users",
+        "SHOW TABLES",
+        "EXPLAIN SELECT * FROM orders",
+        "DESC users",
+        "SELECT 1;",
+        "SELECT 1;  ",
+    ],
+)
+def test_read_only_statements_are_accepted(sql):
+    assert validate_sql(sql) == (True, None)
+
+
+@pytest.mark.parametrize(
+    ("sql", "message"),
+    [
+        ("", "Empty SQL query"),
+        ("   ", "Empty SQL query"),
+        ("DELETE FROM users", "Got: DELETE"),
+        ("SELECT 1; DROP TABLE users", "dangerous pattern"),
+        ("SELECT * FROM users INTO OUTFILE '/tmp/x'", "dangerous pattern"),
+        ("SELECT LOAD_FILE('/etc/passwd')", "dangerous pattern"),
+        ("SELECT 1 -- comment", "dangerous pattern"),
+        ("SELECT 1; SELECT 2", "Multiple SQL statements"),
+    ],
+)
+def test_unsafe_statements_are_rejected(sql, message):
+    is_valid, error = validate_sql(sql)
+
+    assert is_valid is False
+    assert message in error
+
+
+def test_sanitize_identifier():
+    assert sanitize_identifier("users") == "users"
+    assert sanitize_identifier("public.users") == "public.users"
+    with pytest.raises(ValueError):
+        sanitize_identifier("users; DROP TABLE x")
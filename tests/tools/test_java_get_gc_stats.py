@@ -0,0 +1,66 @@
+"""Tests for the java_get_gc_stats tool."""
+
+import json
+
+import httpx
+
+from aiops_tools.tools.java import get_gc_stats
+
+GC_MBEAN = "java.lang:name=G1 Young Generation,type=GarbageCollector"
+POOL_MBEAN = "java.lang:name=G1 Eden Space,type=MemoryPool"
+VALUES = {
+    GC_MBEAN: {"CollectionCount": 3, "CollectionTime": 40, "MemoryPoolNames": ["G1 Eden Space"]},
+    POOL_MBEAN: {"Type": "HEAP", "Usage": {"used": 7, "max": -1}, "PeakUsage": {"used": 9}},
+}
+
+
+def _answer(op: dict) -> dict:
+    if op["type"] == "search":
+        found = GC_MBEAN if "GarbageCollector" in op["mbean"] else POOL_MBEAN
+        return {"status": 200, "value": [found]}
+    if op["mbean"] in VALUES:
+        return {"status": 200, "value": VALUES[op["mbean"]]}
+    return {"status": 404, "error": "not found"}
+
+
+def _bulk(request):
+    return httpx.Response(200, json=[_answer(op) for op in json.loads(request.content)])
+
+
+def test_collectors_and_pools_are_read_in_two_bulk_requests(jolokia):
+    jolokia.handler = _bulk
+
+    result = get_gc_stats.main({"jmx_url": "http://app:8778/jolokia"})
+
+    assert result["data"]["collectors"] == [{
+        "name": "G1 Young Generation",
+        "collection_count": 3,
+        "collection_time_ms": 40,
+        "memory_pools": ["G1 Eden Space"],
+    }]
+    assert result["data"]["memory_pools"][0]["peak_used_bytes"] == 9
+    assert [r.method for r in jolokia.requests] == ["POST", "POST"]
+    reads = json.loads(jolokia.requests[1].content)
+    assert reads[0]["attribute"] == ["CollectionCount", "CollectionTime", "MemoryPoolNames"]
+    assert str(jolokia.requests[0].url) == "http://app:8778/jolokia"
+
+
+def test_failed_mbean_reads_are_skipped(jolokia, monkeypatch):
+    monkeypatch.delitem(VALUES, POOL_MBEAN)
+    jolokia.handler = _bulk
+
+    result = get_gc_stats.main({"jmx_url": "http://app:8778"})
+
+    assert [c["name"] for c in result["data"]["collectors"]] == ["G1 Young Generation"]
+    assert result["data"]["memory_pools"] == []
+
+
+def test_connection_errors_are_reported(jolokia):
+    def refuse(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    jolokia.handler = refuse
+
+    result = get_gc_stats.main({"jmx_url": "http://app:8778"})
+
+    assert result["error"]["code"] == "JMX_CONNECTION_ERROR"
@@ -0,0 +1,62 @@
+"""Tests for the java_get_heap_usage tool."""
+
+import json
+
+import httpx
+
+from aiops_tools.tools.java import get_heap_usage
+
+INPUT = {"jmx_url": "http://app:8778"}
+
+
+def _bulk(values):
+    def handler(request):
+        return httpx.Response(
+            200,
+            json=[
+                {"status": 200, "value": values[op["attribute"]]}
+                if op["attribute"] in values
+                else {"status": 404, "error": "not found"}
+                for op in json.loads(request.content)
+            ],
+        )
+
+    return handler
+
+
+def test_heap_and_non_heap_are_read_in_one_request(jolokia):
+    jolokia.handler = _bulk({
+        "HeapMemoryUsage": {"used": 50, "committed": 80, "max": 200, "init": 10},
+        "NonHeapMemoryUsage": {"used": 5, "committed": 8, "max": -1},
+    })
+
+    result = get_heap_usage.main(INPUT)
+
+    assert result["data"]["heap"]["used_percent"] == 25.0
+    assert result["data"]["non_heap"]["used_bytes"] == 5
+    assert len(jolokia.requests) == 1
+    assert str(jolokia.requests[0].url) == "http://app:8778/jolokia"
+
+
+def test_failed_non_heap_read_yields_empty_values(jolokia):
+    jolokia.handler = _bulk({"HeapMemoryUsage": {"used": 1, "max": 0}})
+
+    result = get_heap_usage.main(INPUT)
+
+    assert result["data"]["heap"]["used_percent"] == 0
+    assert result["data"]["non_heap"] == {"used_bytes": 0, "committed_bytes": 0, "max_bytes": -1}
+
+
+def test_auth_failure_is_reported(jolokia):
+    jolokia.handler = lambda request: httpx.Response(401)
+
+    result = get_heap_usage.main({**INPUT, "username": "u", "password": "p"})
+
+    assert result["error"]["code"] == "JMX_AUTH_ERROR"
+    assert jolokia.requests[0].headers["authorization"].startswith("Basic ")
+
+
+def test_rmi_urls_are_rejected():
+    result = get_heap_usage.main({"jmx_url": "service:jmx:rmi:///jndi/rmi://app:9010/jmxrmi"})
+
+    assert result["error"]["code"] == "JMX_NOT_SUPPORTED"
@@ -0,0 +1,95 @@
+"""Tests for the java_get_thread_dump tool."""
+
+import json
+
+import httpx
+
+from aiops_tools.tools.java import get_thread_dump
+
+INPUT = {"jmx_url": "http://app:8778"}
+THREAD_INFO = {
+    "threadName": "main",
+    "threadId": 1,
+    "threadState": "RUNNABLE",
+    "stackTrace": [
+        {"className": "App", "methodName": "run", "fileName": "App.java", "lineNumber": 10},
+    ],
+}
+
+
+def _answer(op: dict) -> dict:
+    if op["attribute"] == "AllThreadIds":
+        return {"status": 200, "value": [1, 2]}
+    return {"status": 200, "value": {"ThreadCount": 2, "DaemonThreadCount": 1}}
+
+
+def _handler(request):
+    body = json.loads(request.content)
+    if isinstance(body, list):
+        return httpx.Response(200, json=[_answer(op) for op in body])
+    if body["operation"] == "findDeadlockedThreads()":
+        return httpx.Response(200, json={"status": 200, "value": [2]})
+    # getThreadInfo([J,int): one entry per ID, null for threads that have exited
+    return httpx.Response(200, json={"status": 200, "value": [THREAD_INFO, None]})
+
+
+def test_thread_dump_checks_deadlocks_after_thread_info(jolokia):
+    jolokia.handler = _handler
+
+    result = get_thread_dump.main({**INPUT, "max_depth": 1})
+
+    assert result["data"]["thread_count"] == 2
+    assert result["data"]["deadlocked_threads"] == [2]
+    assert result["data"]["deadlock_check"] == "ok"
+    assert result["data"]["threads"] == [{
+        "name": "main",
+        "id": 1,
+        "state": "RUNNABLE",
+        "daemon": False,
+        "priority": 5,
+        "stack_trace": ["App.run(App.java:10)"],
+        "locked_monitors": [],
+        "locked_synchronizers": [],
+    }]
+    operations = [json.loads(r.content) for r in jolokia.requests]
+    assert operations[1]["operation"] == "getThreadInfo([J,int)"
+    assert operations[1]["arguments"] == [[1, 2], 1]
+    assert operations[2]["operation"] == "findDeadlockedThreads()"
+
+
+def test_deadlock_timeout_keeps_thread_data(jolokia):
+    def handler(request):
+        if b"findDeadlockedThreads" in request.content:
+            raise httpx.ReadTimeout("slow", request=request)
+        return _handler(request)
+
+    jolokia.handler = handler
+
+    result = get_thread_dump.main(INPUT)
+
+    assert result["success"] is True
+    assert result["data"]["deadlock_check"] == "timeout"
+    assert [t["name"] for t in result["data"]["threads"]] == ["main"]
+
+
+def test_no_thread_ids_skips_the_remaining_requests(jolokia):
+    jolokia.handler = lambda request: httpx.Response(
+        200, json=[{"status": 200, "value": {"ThreadCount": 0}}, {"status": 200, "value": []}]
+    )
+
+    result = get_thread_dump.main(INPUT)
+
+    assert result["data"]["deadlock_check"] == "skipped"
+    assert len(jolokia.requests) == 1
+
+
+def test_auth_failure_is_reported(jolokia):
+    jolokia.handler = lambda request: httpx.Response(401)
+
+    assert get_thread_dump.main(INPUT)["error"]["code"] == "JMX_AUTH_ERROR"
+
+
+def test_frames_without_line_numbers_still_render():
+    info = {"stackTrace": [{"className": "App", "methodName": "run", "lineNumber": None}]}
+
+    assert get_thread_dump._format_thread(info, 7)["stack_trace"] == ["App.run(:None)"]
@@ -0,0 +1,45 @@
+"""Tests for the java_list_mbeans tool."""
+
+import httpx
+import pytest
+
+from aiops_tools.tools.java import list_mbeans
+
+
+def test_lists_mbeans_for_domain(jolokia):
+    jolokia.handler = lambda request: httpx.Response(200, json={"value": [
+        "java.lang:type=Memory",
+        "java.lang:name=G1 Eden Space,type=MemoryPool",
+        "java.lang:name=Other",
+        "not-an-object-name",
+    ]})
+
+    result = list_mbeans.main({"jmx_url": "http://app:8080", "domain": "java.lang"})
+
+    assert [r.url.path for r in jolokia.requests] == ["/jolokia/search/java.lang:*"]
+    data = result["data"]
+    assert data["total_count"] == 4
+    assert data["domains"] == ["java.lang"]
+    assert [m["type"] for m in data["mbeans"]] == ["Memory", "MemoryPool", None]
+
+
+def test_non_200_is_a_connection_error(jolokia):
+    jolokia.handler = lambda request: httpx.Response(503)
+
+    result = list_mbeans.main({"jmx_url": "http://app:8080"})
+
+    assert result["error"]["code"] == "JMX_CONNECTION_ERROR"
+
+
+@pytest.mark.parametrize(
+    ("properties", "expected"),
+    [
+        ("type=Memory", "Memory"),
+        ("name=G1 Eden Space,type=MemoryPool", "MemoryPool"),
+        ("subtype=Cache,type=Manager", "Manager"),
+        ("name=mytype=odd", None),
+        ("name=Other", None),
+    ],
+)
+def test_extract_type_matches_the_exact_key(properties, expected):
+    assert list_mbeans._extract_type(properties) == expected
@@ -0,0 +1,116 @@
+"""Tests for the k8s_describe_pod tool."""
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+from kubernetes.client.rest import ApiException
+
+from aiops_tools.tools.k8s import describe_pod
+
+POD = {
+    "metadata": {"name": "web-1", "namespace": "shop", "labels": {"app": "web"}},
+    "spec": {"nodeName": "node-a"},
+    "status": {
+        "phase": "Running",
+        "startTime": "2024-01-01T00:00:00Z",
+        "containerStatuses": [{
+            "name": "app",
+            "image": "web:1",
+            "ready": False,
+            "restartCount": 4,
+            "state": {"waiting": {"reason": "CrashLoopBackOff"}},
+        }],
+    },
+}
+
+
+def _pod() -> MagicMock:
+    return MagicMock(data=json.dumps(POD).encode())
+
+
+def _events(*events: dict) -> MagicMock:
+    return MagicMock(data=json.dumps({"items": list(events)}).encode())
+
+
+def test_events_are_requested_alongside_the_pod_read(k8s):
+    k8s.core.read_namespaced_pod.return_value = _pod()
+    event = {"type": "Warning", "reason": "BackOff", "firstTimestamp": "2024-01-01T00:00:00Z"}
+    k8s.core.list_namespaced_event.return_value.get.return_value = _events(event)
+
+    result = describe_pod.main({"pod_name": "web-1", "namespace": "shop"})
+
+    data = result["data"]
+    assert data["containers"][0]["state"] == "Waiting (CrashLoopBackOff)"
+    assert data["host_ip"] == "N/A"
+    assert data["start_time"] == "2024-01-01T00:00:00Z"
+    assert [e["reason"] for e in data["events"]] == ["BackOff"]
+    assert k8s.core.read_namespaced_pod.call_args.kwargs["_preload_content"] is False
+    call = k8s.core.list_namespaced_event.call_args
+    assert call.kwargs["async_req"] is True
+    assert call.kwargs["resource_version"] == "0"
+    assert call.kwargs["_preload_content"] is False
+    assert call.kwargs["field_selector"] == (
+        "involvedObject.name=web-1,involvedObject.namespace=shop"
+    )
+
+
+def test_newest_events_are_reported_by_timestamp(k8s):
+    k8s.core.read_namespaced_pod.return_value = _pod()
+    events = [
+        {"reason": f"E{i:02d}", "lastTimestamp": f"2024-01-01T00:{i:02d}:00Z"} for i in range(12)
+    ]
+    k8s.core.list_namespaced_event.return_value.get.return_value = _events(*reversed(events))
+
+    result = describe_pod.main({"pod_name": "web-1"})
+
+    assert [e["reason"] for e in result["data"]["events"]] == [f"E{i:02d}" for i in range(2, 12)]
+
+
+def test_unparseable_event_time_only_drops_that_age(k8s):
+    k8s.core.read_namespaced_pod.return_value = _pod()
+    k8s.core.list_namespaced_event.return_value.get.return_value = _events(
+        {"reason": "Odd", "eventTime": "not-a-time"},
+        {"reason": "Pulled", "lastTimestamp": "2024-01-01T00:00:00Z"},
+    )
+
+    result = describe_pod.main({"pod_name": "web-1"})
+
+    events = {e["reason"]: e["age"] for e in result["data"]["events"]}
+    assert events["Odd"] == "N/A"
+    assert events["Pulled"].endswith("d ago")
+
+
+def test_event_failures_do_not_fail_the_call(k8s):
+    k8s.core.read_namespaced_pod.return_value = _pod()
+    k8s.core.list_namespaced_event.return_value.get.side_effect = ApiException(status=403)
+
+    result = describe_pod.main({"pod_name": "web-1"})
+
+    assert result["success"] is True
+    assert result["data"]["events"] == []
+
+
+def test_missing_pod(k8s):
+    k8s.core.read_namespaced_pod.side_effect = ApiException(status=404)
+
+    assert describe_pod.main({"pod_name": "gone"})["error"]["code"] == "K8S_NOT_FOUND"
+
+
+def test_container_state_summaries():
+    assert describe_pod._container_state({"running": {}}) == "Running"
+    assert describe_pod._container_state({"terminated": {"reason": "OOMKilled"}}) == (
+        "Terminated (OOMKilled)"
+    )
+    assert describe_pod._container_state({}) == "Unknown"
+
+
+def test_format_age_uses_whole_seconds_and_clamps_skew():
+    start = "2024-01-01T00:00:00Z"
+    now_ts = datetime(2024, 1, 1, tzinfo=UTC).timestamp()
+
+    assert describe_pod._format_age(start, now_ts + 2 * 86400 + 5) == "2d ago"
+    assert describe_pod._format_age(start, now_ts + 3 * 3600 + 59) == "3h ago"
+    assert describe_pod._format_age(start, now_ts + 150) == "2m ago"
+    assert describe_pod._format_age(start, now_ts - 30) == "0m ago"
+    assert describe_pod._format_age("", now_ts) == "N/A"
@@ -0,0 +1,67 @@
+"""Tests for the k8s_get_deployment_status tool."""
+
+import json
+from unittest.mock import MagicMock
+
+from kubernetes import client as k8s_client
+from kubernetes.client.rest import ApiException
+
+from aiops_tools.tools.k8s import get_deployment_status
+
+DEPLOYMENT = {
+    "metadata": {"name": "web", "namespace": "shop"},
+    "spec": {"replicas": 3, "strategy": {"type": "RollingUpdate"}},
+    "status": {
+        "readyReplicas": 2,
+        "availableReplicas": 2,
+        "conditions": [{"type": "Available", "status": "True"}],
+    },
+}
+
+
+def test_reads_deployment_from_watch_cache(k8s):
+    call_api = k8s.apps.api_client.call_api
+    call_api.return_value = MagicMock(data=json.dumps(DEPLOYMENT).encode())
+
+    result = get_deployment_status.main({"deployment_name": "web", "namespace": "shop"})
+
+    data = result["data"]
+    assert data["replicas"] == {"desired": 3, "ready": 2, "available": 2, "updated": 0}
+    assert data["strategy"] == "RollingUpdate"
+    assert data["conditions"][0]["type"] == "Available"
+    assert data["labels"] == {}
+    call = call_api.call_args
+    assert call.kwargs["path_params"] == {"namespace": "shop", "name": "web"}
+    assert call.kwargs["query_params"] == [("resourceVersion", "0")]
+    assert call.kwargs["_preload_content"] is False
+
+
+def test_missing_deployment(k8s):
+    k8s.apps.api_client.call_api.side_effect = ApiException(status=404)
+
+    result = get_deployment_status.main({"deployment_name": "gone"})
+
+    assert result["error"]["code"] == "K8S_NOT_FOUND"
+
+
+def test_requires_deployment_name():
+    assert get_deployment_status.main({})["error"]["code"] == "K8S_INVALID_INPUT"
+
+
+def test_api_client_pools_connections_and_retries_5xx(k8s, monkeypatch):
+    api_clients = []
+
+    def apps_api(api_client):
+        api_clients.append(api_client)
+        return k8s.apps
+
+    monkeypatch.setattr(k8s_client, "AppsV1Api", apps_api)
+    k8s.apps.api_client.call_api.return_value = MagicMock(data=json.dumps(DEPLOYMENT).encode())
+
+    get_deployment_status.main({"deployment_name": "web"})
+
+    configuration = api_clients[0].configuration
+    assert configuration.connection_pool_maxsize == 20
+    assert configuration.retries.total == 3
+    assert 503 in configuration.retries.status_forcelist
+    assert configuration.retries.raise_on_status is False
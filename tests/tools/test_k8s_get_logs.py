@@ -0,0 +1,53 @@
+"""Tests for the k8s_get_logs tool."""
+
+from unittest.mock import MagicMock
+
+from kubernetes.client.rest import ApiException
+
+from aiops_tools.tools.k8s import get_logs
+
+
+def _log_response(*chunks: bytes) -> MagicMock:
+    response = MagicMock()
+    response.stream.return_value = iter(chunks)
+    return response
+
+
+def test_streams_single_pod_logs(k8s):
+    response = _log_response(b"one\ntw", b"o\nthree")
+    k8s.core.read_namespaced_pod_log.return_value = response
+
+    result = get_logs.main({"pod_name": "web-1", "tail_lines": 3, "since_seconds": 60})
+
+    assert result["data"]["logs"] == "one\ntwo\nthree"
+    assert result["data"]["line_count"] == 3
+    assert result["data"]["container"] == "default"
+    kwargs = k8s.core.read_namespaced_pod_log.call_args.kwargs
+    assert kwargs["tail_lines"] == 3
+    assert kwargs["since_seconds"] == 60
+    assert kwargs["_preload_content"] is False
+    assert "container" not in kwargs
+    response.release_conn.assert_called_once()
+
+
+def test_multiple_pods_report_failures_per_pod(k8s):
+    def read_log(pod_name, namespace, **kwargs):
+        if pod_name == "gone":
+            raise ApiException(status=404)
+        return _log_response(b"ok\n")
+
+    k8s.core.read_namespaced_pod_log.side_effect = read_log
+
+    result = get_logs.main({"pod_name": ["web-1", "gone", "web-1"], "container": "app"})
+
+    pods = result["data"]["pods"]
+    assert [p["pod_name"] for p in pods] == ["web-1", "gone"]
+    assert pods[0]["logs"] == "ok\n"
+    assert pods[0]["container"] == "app"
+    assert pods[1]["error"]["code"] == "K8S_NOT_FOUND"
+
+
+def test_missing_pod(k8s):
+    k8s.core.read_namespaced_pod_log.side_effect = ApiException(status=404)
+
+    assert get_logs.main({"pod_name": "gone"})["error"]["code"] == "K8S_NOT_FOUND"
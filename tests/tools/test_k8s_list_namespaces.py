@@ -0,0 +1,44 @@
+"""Tests for the k8s_list_namespaces tool."""
+
+import json
+from unittest.mock import MagicMock
+
+from kubernetes import config as k8s_config
+
+from aiops_tools.tools.k8s import list_namespaces
+
+
+def test_lists_namespaces_from_raw_json(k8s):
+    k8s.core.list_namespace.return_value = MagicMock(data=json.dumps({"items": [
+        {
+            "metadata": {"name": "default", "creationTimestamp": "2024-01-01T00:00:00Z"},
+            "status": {"phase": "Active"},
+        },
+    ]}).encode())
+
+    result = list_namespaces.main({})
+
+    namespace = result["data"]["namespaces"][0]
+    assert namespace == {"name": "default", "status": "Active", "age": namespace["age"]}
+    assert namespace["age"].endswith("d")
+    k8s.core.list_namespace.assert_called_once_with(
+        _preload_content=False, _request_timeout=list_namespaces._REQUEST_TIMEOUT
+    )
+
+
+def test_configuration_errors_are_returned(k8s):
+    k8s_config.load_kube_config.side_effect = RuntimeError("no config")
+
+    result = list_namespaces.main({"kubeconfig": "/missing"})
+
+    assert result["error"]["code"] == "K8S_CONFIG_ERROR"
+    k8s.core.list_namespace.assert_not_called()
+
+
+def test_get_age_units():
+    now = 1_700_000_000.0
+
+    assert list_namespaces._get_age("2023-11-14T22:13:20+00:00", now) == "0m"
+    assert list_namespaces._get_age("2023-11-14T20:13:20+00:00", now) == "2h"
+    assert list_namespaces._get_age("2023-11-11T22:13:20+00:00", now) == "3d"
+    assert list_namespaces._get_age("2023-11-14T22:14:20+00:00", now) == "0m"
@@ -0,0 +1,78 @@
+"""Tests for the k8s_list_pods tool."""
+
+import json
+from unittest.mock import MagicMock
+
+from kubernetes.client.rest import ApiException
+
+from aiops_tools.tools.k8s import list_pods
+
+POD = {
+    "metadata": {"name": "web-1", "creationTimestamp": "2024-01-01T00:00:00Z"},
+    "spec": {"nodeName": "node-a"},
+    "status": {
+        "phase": "Running",
+        "containerStatuses": [
+            {"ready": True, "restartCount": 1},
+            {"ready": False, "restartCount": 2},
+        ],
+    },
+}
+
+
+def _raw(items: list[dict]) -> MagicMock:
+    """A _preload_content=False response carrying a pod list as JSON."""
+    return MagicMock(data=json.dumps({"items": items}).encode())
+
+
+def test_lists_pods_from_raw_json(k8s):
+    k8s.core.list_namespaced_pod.return_value = _raw([POD])
+
+    result = list_pods.main({"namespace": "shop", "label_selector": "app=web"})
+
+    pod = result["data"]["pods"][0]
+    assert pod["name"] == "web-1"
+    assert pod["ready"] == "1/2"
+    assert pod["restarts"] == 3
+    assert pod["node"] == "node-a"
+    call = k8s.core.list_namespaced_pod.call_args
+    assert call.args == ("shop",)
+    assert call.kwargs["label_selector"] == "app=web"
+    assert call.kwargs["_preload_content"] is False
+
+
+def test_rows_format_returns_columns_once(k8s):
+    pending = {
+        "metadata": {"name": "web-2", "creationTimestamp": "2024-01-01T00:00:00Z"},
+        "status": {"phase": "Pending"},
+    }
+    k8s.core.list_namespaced_pod.return_value = _raw([POD, pending])
+
+    result = list_pods.main({"format": "rows"})
+
+    data = result["data"]
+    assert data["columns"] == list(list_pods._POD_COLUMNS)
+    assert "pods" not in data
+    assert data["rows"][1][:4] == ("web-2", "Pending", "0/0", 0)
+    assert data["rows"][1][5] == "N/A"
+
+
+def test_ready_and_restarts_in_one_pass():
+    statuses = POD["status"]["containerStatuses"]
+
+    assert list_pods._get_ready_and_restarts(statuses) == ("1/2", 3)
+    assert list_pods._get_ready_and_restarts(None) == ("0/0", 0)
+
+
+def test_missing_namespace(k8s):
+    k8s.core.list_namespaced_pod.side_effect = ApiException(status=404)
+
+    result = list_pods.main({"namespace": "gone"})
+
+    assert result["error"]["code"] == "K8S_NOT_FOUND"
+
+
+def test_missing_kubernetes_is_reported(monkeypatch):
+    monkeypatch.setattr(list_pods, "_HAS_K8S", False)
+
+    assert list_pods.main({})["error"]["code"] == "K8S_IMPORT_ERROR"
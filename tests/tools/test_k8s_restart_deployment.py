@@ -0,0 +1,37 @@
+"""Tests for the k8s_restart_deployment tool."""
+
+from kubernetes.client.rest import ApiException
+
+from aiops_tools.tools.k8s import restart_deployment
+
+
+def test_patches_only_the_restart_annotation(k8s):
+    result = restart_deployment.main({"deployment_name": "web", "namespace": "shop"})
+
+    assert result["success"] is True
+    call = k8s.apps.patch_namespaced_deployment.call_args
+    assert call.args[:2] == ("web", "shop")
+    annotations = call.args[2]["spec"]["template"]["metadata"]["annotations"]
+    assert annotations == {"kubectl.kubernetes.io/restartedAt": result["data"]["restart_time"]}
+    assert call.kwargs["_content_type"] == "application/strategic-merge-patch+json"
+    assert call.kwargs["_request_timeout"] == (3, 30)
+    k8s.apps.read_namespaced_deployment.assert_not_called()
+
+
+def test_missing_deployment(k8s):
+    k8s.apps.patch_namespaced_deployment.side_effect = ApiException(status=404)
+
+    result = restart_deployment.main({"deployment_name": "gone"})
+
+    assert result["error"]["code"] == "K8S_NOT_FOUND"
+
+
+def test_other_patch_errors(k8s):
+    k8s.apps.patch_namespaced_deployment.side_effect = ApiException(status=422, reason="Invalid")
+
+    result = restart_deployment.main({"deployment_name": "web"})
+
+    assert result["error"] == {
+        "code": "K8S_PATCH_ERROR",
+        "message": "Failed to restart deployment: Invalid",
+    }